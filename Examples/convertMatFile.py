@@ -14,7 +14,10 @@ dictionary and the set of latter stored in a container which is then written
 to a pickle file. A different file suffix is used depending upon whether the 
 file is created using Python 2 (.pkl) or Python 3 (.pkl3) because the pickle 
 package is not cross version compatible for pickle files containing containers 
-of dictionaries.
+of dictionaries. The data are also written to a dataset directory with the
+write_dataset function, which is independent of the version of Python and
+allows each series to be read on its own. Existing pickle files can be
+converted to dataset directories with the convert_pickle_dataset function.
 
 The reference data used in this example are cell concentrations of a
 phytoplankton collected from cruise surveys at selected locations and 
@@ -42,6 +45,7 @@ Revised on Apr 26, 2017
 import datetime as dt
 import numpy as np, h5py
 import pickle
+import skill_metrics as sm
 from sys import version_info
 
 def char2str(charArr):
@@ -147,6 +151,10 @@ if __name__ == '__main__':
     
     # Save dictionaries to pickle file
     save_obj(data,'target_data')
+
+    # Save dictionaries to dataset directory, which can be read with
+    # sm.read_dataset('target_data') by any version of Python
+    sm.write_dataset('target_data', data, overwrite = True)
     
     # Print summary
     print('\nSummary for ref:')
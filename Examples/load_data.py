@@ -1,5 +1,6 @@
 import os
 import pandas as pd
+import skill_metrics as sm
 from read_csv_data import read_csv_data
 
 def load_data(filenames : list) -> dict:
@@ -11,9 +12,10 @@ def load_data(filenames : list) -> dict:
     e.g. pred1 for a file named pred1.csv, so for a returned dictionary named "data" this 
     would be data['pred1']. 
     
-    The contents of the file are stored as lists in the dictionary, so for a column named
-    'data' in the CSV file example above, the data would be accessed using 
-    data['pred1']['data']. 
+    The contents of the file are stored as NumPy arrays in the dictionary, so for a column
+    named 'data' in the CSV file example above, the data would be accessed using 
+    data['pred1']['data']. The units of the columns are stored as a dictionary in
+    data['pred1']['units'], e.g. {'data': 'cell/L'}.
      
     INPUTS:
     filenames : list of CSV filenames, e.g.
@@ -47,19 +49,14 @@ def load_data(filenames : list) -> dict:
     
     # Process list of filenames
     for name in filenames:
-        # Read data from provided CSV file
-        csv_data = read_csv_data(name)
-        
-        # Convert pandas data frame to dictionary
-        dict_data = csv_data.to_dict('list')
+        # Read data from provided CSV file as typed arrays
+        dict_data = sm.read_element_data(name)
 
         # Get prefix of file name
         file_name, file_extension = os.path.splitext(name)
         
         # Store data as key in dictionary
         data[file_name] = dict_data
-        
-        del csv_data, dict_data
     
     return data
 
@@ -0,0 +1,86 @@
+'''
+Tests of the CHECK_DUPLICATE_STATS function against the direct comparison
+of every pair of points.
+
+Run from the root of the repository with:
+
+$ python -m pytest Test
+'''
+import importlib
+
+import numpy as np
+import pytest
+
+from skill_metrics.check_duplicate_stats import check_duplicate_stats
+
+# Module of the function, whose name the package binds to the function
+_MODULE = importlib.import_module('skill_metrics.check_duplicate_stats')
+
+def _get_reference_duplicates(stats, threshold):
+    '''
+    Return the duplicates of the statistics STATS found by comparing every
+    pair of points, as done by the original O(n^2) implementation.
+    '''
+    values = [np.asarray(values, dtype = float) for values in stats]
+    duplicates = []
+    n = len(values[0])
+    with np.errstate(divide = 'ignore', invalid = 'ignore'):
+        for i in range(n):
+            for j in range(i+1, n):
+                if all(abs((x[i] - x[j])/x[i]) < threshold for x in values):
+                    duplicates.append( (i, j, tuple(x[i] for x in values),
+                                        tuple(x[j] for x in values)) )
+    return duplicates
+
+def _get_stats(seed, n, nstats):
+    '''
+    Return NSTATS statistics of N points on a coarse grid, so that many
+    points agree and relative differences fall on the threshold, with zeros,
+    NaN, infinite and negative values.
+    '''
+    rng = np.random.default_rng(seed)
+    stats = []
+    for k in range(nstats):
+        values = rng.integers(-3, 60, n)/20.0
+        values[rng.random(n) < 0.05] = np.nan
+        values[rng.random(n) < 0.02] = np.inf
+        stats.append(values)
+    return stats
+
+def _check(stats, threshold):
+    if len(stats) == 2:
+        duplicates = check_duplicate_stats(stats[0], stats[1], threshold)
+    else:
+        duplicates = check_duplicate_stats(stats[0], stats[1], threshold,
+                                           stats3 = stats[2])
+    expected = _get_reference_duplicates(stats, threshold)
+    assert [pair[:2] for pair in duplicates] == [pair[:2] for pair in expected]
+    np.testing.assert_array_equal([pair[2:] for pair in duplicates],
+                                  [pair[2:] for pair in expected])
+
+@pytest.mark.parametrize('nstats', [2, 3])
+@pytest.mark.parametrize('threshold', [0.01, 0.05, 0.5, 2.0])
+@pytest.mark.parametrize('seed', range(5))
+def test_reference(seed, threshold, nstats):
+    _check(_get_stats(seed, 300, nstats), threshold)
+
+@pytest.mark.parametrize('nstats', [2, 3])
+def test_chunks(monkeypatch, nstats):
+    # Compare few candidate pairs at a time
+    monkeypatch.setattr(_MODULE, '_CHUNK_PAIRS', 7)
+    _check(_get_stats(10, 200, nstats), 0.05)
+
+def test_lists():
+    stats1 = [1.0, 1.005, 0.0, 0.0, 2.0, -1.0, -1.002]
+    stats2 = [3.0, 3.01, 1.0, 1.0, 3.0, 5.0, 5.0]
+    assert check_duplicate_stats(stats1, stats2) == \
+        [(0, 1, (1.0, 3.0), (1.005, 3.01)),
+         (5, 6, (-1.0, 5.0), (-1.002, 5.0))]
+
+def test_invalid():
+    with pytest.raises(ValueError, match = 'threshold value must be positive'):
+        check_duplicate_stats([1.0], [1.0], threshold = 0.0)
+    with pytest.raises(ValueError, match = 'Argument stats2 is empty list!'):
+        check_duplicate_stats([1.0], [])
+    with pytest.raises(ValueError, match = 'len\\(stats1\\) = 2 != len\\(stats3\\) = 1'):
+        check_duplicate_stats([1.0, 2.0], [1.0, 2.0], stats3 = [1.0])
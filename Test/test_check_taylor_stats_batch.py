@@ -0,0 +1,94 @@
+'''
+Tests of the CHECK_TAYLOR_STATS_BATCH function against the CHECK_TAYLOR_STATS
+function applied to each set of statistics in turn.
+
+Run from the root of the repository with:
+
+$ python -m pytest Test
+'''
+import numpy as np
+import pytest
+
+from skill_metrics.check_taylor_stats import check_taylor_stats
+from skill_metrics.check_taylor_stats_batch import check_taylor_stats_batch
+
+THRESHOLD = 0.01
+
+def _get_sets(seed, nsets):
+    '''
+    Return NSETS sets of statistics of random sizes satisfying the Taylor
+    diagram relation, with some points perturbed to violate it.
+    '''
+    rng = np.random.default_rng(seed)
+    sets = []
+    for k in range(nsets):
+        n = rng.integers(2, 12)
+        sdev = np.concatenate(([1.0 + rng.random()], 0.5 + rng.random(n-1)))
+        ccoef = np.concatenate(([1.0], rng.uniform(-0.9, 0.99, n-1)))
+        crmsd = np.sqrt(sdev**2 + sdev[0]**2 - 2.0*sdev*sdev[0]*ccoef)
+        crmsd[0] = 0.0
+        perturbed = rng.random(n) < 0.2
+        perturbed[0] = False
+        crmsd[perturbed] *= rng.uniform(1.02, 1.5, np.count_nonzero(perturbed))
+        sets.append((sdev, crmsd, ccoef))
+    return sets
+
+def _check(report, sets):
+    '''
+    Compare the REPORT of CHECK_TAYLOR_STATS_BATCH with the residuals of each
+    of the SETS returned by CHECK_TAYLOR_STATS.
+    '''
+    expected_sets, expected_index, expected_diff = [], [], []
+    for k, (sdev, crmsd, ccoef) in enumerate(sets):
+        # Residuals of the set, without terminating
+        diff = check_taylor_stats(sdev, crmsd, ccoef, threshold = np.inf)
+        bad = np.nonzero(diff > THRESHOLD)[0]
+        assert report['valid'][k] == (len(bad) == 0)
+        assert report['nbad'][k] == len(bad)
+        assert report['maxdiff'][k] == pytest.approx(np.max(diff), abs = 1e-12)
+        expected_sets += [k]*len(bad)
+        expected_index += list(bad + 1)
+        expected_diff += list(diff[bad])
+
+    np.testing.assert_array_equal(report['set'], expected_sets)
+    np.testing.assert_array_equal(report['index'], expected_index)
+    np.testing.assert_allclose(report['diff'], expected_diff)
+    assert report['threshold'] == THRESHOLD
+
+@pytest.mark.parametrize('seed', range(5))
+def test_rows(seed):
+    # Sets padded with NaN to rows of the same length
+    sets = _get_sets(seed, 20)
+    n = max(len(sdev) for sdev, crmsd, ccoef in sets)
+    stats = np.full((3, len(sets), n), np.nan)
+    for k, values in enumerate(sets):
+        for i in range(3):
+            stats[i, k, :len(values[i])] = values[i]
+    report = check_taylor_stats_batch(stats[0], stats[1], stats[2], THRESHOLD)
+    _check(report, sets)
+
+@pytest.mark.parametrize('seed', range(5))
+def test_offsets(seed):
+    sets = _get_sets(seed, 20)
+    offsets = np.cumsum([0] + [len(sdev) for sdev, crmsd, ccoef in sets])
+    stats = [np.concatenate([values[i] for values in sets]) for i in range(3)]
+    report = check_taylor_stats_batch(stats[0], stats[1], stats[2], THRESHOLD,
+                                      offsets = offsets)
+    _check(report, sets)
+
+def test_no_predicted_field():
+    report = check_taylor_stats_batch([1.0, 1.0, 0.8], [0.0, 0.0, 0.6],
+                                      [1.0, 1.0, 0.8], offsets = [0, 1, 3])
+    np.testing.assert_array_equal(report['valid'], [True, True])
+    assert np.isnan(report['maxdiff'][0])
+
+@pytest.mark.parametrize('offsets, message', [
+    (None, 'Statistics must be 2-dimensional arrays unless offsets are supplied.'),
+    ([0, 3], 'offsets must start at 0 and end at the number of statistics 2'),
+    ([0, 0, 2], 'offsets must be strictly increasing'),
+    ([0.0, 2.0], 'offsets must be a list of at least 2 integers'),
+])
+def test_invalid(offsets, message):
+    with pytest.raises(ValueError, match = message):
+        check_taylor_stats_batch([1.0, 0.8], [0.0, 0.6], [1.0, 0.8],
+                                 offsets = offsets)
@@ -0,0 +1,62 @@
+'''
+Tests of the DiagramHandle objects returned by the TAYLOR_DIAGRAM and
+TARGET_DIAGRAM functions.
+
+Run from the root of the repository with:
+
+$ python -m pytest Test
+'''
+import matplotlib
+matplotlib.use('Agg')
+from matplotlib.figure import Figure
+import numpy as np
+
+import skill_metrics as sm
+
+SDEV = np.array([1.0, 0.8, 1.2, 0.9])
+CRMSD = np.array([0.0, 0.5, 0.6, 0.4])
+CCOEF = np.array([1.0, 0.85, 0.8, 0.9])
+
+def _new_axes():
+    return Figure().add_subplot(1, 1, 1)
+
+def test_update_points_markers_legend():
+    markers = {name: {'labelColor': 'k', 'symbol': symbol, 'size': 9,
+                      'faceColor': color, 'edgeColor': 'k'}
+               for name, symbol, color in (('A', 'o', 'r'), ('B', 's', 'b'),
+                                           ('C', 'd', 'g'))}
+    handle = sm.taylor_diagram(_new_axes(), SDEV, CRMSD, CCOEF, markers = markers,
+                               markerLegend = 'on')
+    assert handle.labels == [None]*3
+
+    handle.update_points(SDEV*1.1, CRMSD, CCOEF)
+    X, Y = handle.get_points()
+    np.testing.assert_allclose(np.hypot(X, Y), SDEV[1:]*1.1)
+
+def _get_label_offsets(handle):
+    offsets = []
+    for line, label in zip(handle.markers, handle.labels):
+        x, y = label.get_position()
+        offsets.append((line.get_xdata()[0] - x, line.get_ydata()[0] - y,
+                        label.get_horizontalalignment(), label.get_verticalalignment()))
+    return offsets
+
+def test_update_points_auto_labels():
+    # Crowded points whose labels are moved to avoid overlaps
+    rng = np.random.default_rng(0)
+    n = 40
+    sdev = np.concatenate(([1.0], 1.0 + 0.05*rng.standard_normal(n)))
+    ccoef = np.concatenate(([1.0], 0.9 + 0.02*rng.standard_normal(n)))
+    crmsd = np.sqrt(sdev**2 + 1.0 - 2.0*sdev*ccoef)
+    labels = ['Obs'] + ['P%d' % i for i in range(n)]
+    handle = sm.taylor_diagram(_new_axes(), sdev, crmsd, ccoef, markerLabel = labels,
+                               markerLabelPlacement = 'auto', axismax = 1.5)
+    before = _get_label_offsets(handle)
+    assert any(dy != 0.0 for dx, dy, ha, va in before)
+    assert len({va for dx, dy, ha, va in before}) > 1
+
+    handle.update_points(sdev*1.05, crmsd, ccoef)
+    after = _get_label_offsets(handle)
+    for (dx0, dy0, ha0, va0), (dx1, dy1, ha1, va1) in zip(before, after):
+        assert (ha0, va0) == (ha1, va1)
+        np.testing.assert_allclose((dx1, dy1), (dx0, dy0), atol = 1e-12)
@@ -0,0 +1,133 @@
+'''
+Tests of the options of the TAYLOR_DIAGRAM and TARGET_DIAGRAM functions
+resolved from keyword arguments and options files by the
+GET_TAYLOR_DIAGRAM_OPTIONS and GET_TARGET_DIAGRAM_OPTIONS functions.
+
+The expected values and error messages are those of the functions before
+the options were described by a shared schema.
+
+Run from the root of the repository with:
+
+$ python -m pytest Test
+'''
+import numpy as np
+import pytest
+
+from skill_metrics.get_target_diagram_options import get_target_diagram_options
+from skill_metrics.get_taylor_diagram_options import get_taylor_diagram_options
+
+CORS = np.array([1, 0.9, 0.5])
+
+def _get_tickcor():
+    tickcor1 = [1, 0.99, 0.95] + list(np.linspace(0.9, 0.1, 9)) + [0]
+    tickcor2 = tickcor1 + list(np.linspace(-0.1, -0.9, 9)) + [-0.95, -0.99, -1]
+    return (tickcor1, tickcor2)
+
+def _check_options(option, expected):
+    for key, value in expected.items():
+        assert key in option, key
+        if isinstance(option[key], np.ndarray):
+            np.testing.assert_allclose(option[key], value, err_msg = key)
+        elif isinstance(value, float):
+            assert option[key] == pytest.approx(value), key
+        else:
+            assert option[key] == value, key
+
+def test_taylor_defaults():
+    option = get_taylor_diagram_options(CORS)
+    _check_options(option, {
+        'numberpanels': 1, 'axismax': 0.0, 'alpha': 1.0, 'checkstats': 'off',
+        'colormap': 'on', 'markerdisplayed': 'marker', 'markerlegend': 'off',
+        'markerlabel': '', 'overlay': 'off', 'rincrms': [], 'rincstd': [],
+        'tickrms': [], 'tickstd': [], 'rmslabelformat': '0',
+        'showlabelsrms': 'on', 'stylerms': '--', 'titlerms': 'on',
+        'titlermsdangle': 160.0, 'tickrmsangle': -1, 'styleobs': '',
+        'titleobs': '', 'cmapzdata': [], 'colscor': None, 'colsstd': None,
+        'arcresolution': 'fixed', 'preview': 'off', 'rasterize': 'off'})
+    for values, expected in zip(option['tickcor'], _get_tickcor()):
+        np.testing.assert_allclose(values, expected)
+
+    # Two panels for negative correlations
+    option = get_taylor_diagram_options(np.array([1, -0.5]))
+    assert option['numberpanels'] == 2
+
+def test_taylor_keywords():
+    option = get_taylor_diagram_options(
+        CORS, numberPanels = 2, tickRMS = [0, 1, 2, 3], tickSTD = [0, 0.5, 1, 2],
+        axisMax = 3, colsCOR = {'grid': 'r'}, MarkerLegend = 'On',
+        markerLabel = ['a', 'b', 'c'], rmsLabelFormat = '0:.2f',
+        tickRMSangle = 110.0, checkStats = 'on', styleOBS = '-', titleOBS = 'ref')
+    _check_options(option, {
+        'numberpanels': 2, 'tickrms': [0, 1, 2, 3], 'rincrms': 0.75,
+        'tickstd': [0.0, 0.5, 1.0, 2.0], 'rincstd': 0.5, 'axismax': 3,
+        'colscor': {'grid': 'r'}, 'markerlegend': 'on',
+        'markerlabel': ['b', 'c'], 'rmslabelformat': '0:.2f',
+        'tickrmsangle': 110.0, 'checkstats': 'on', 'styleobs': '-',
+        'titleobs': 'ref'})
+
+def test_target_defaults():
+    option = get_target_diagram_options()
+    _check_options(option, {
+        'axismax': 0.0, 'circlecolor': 'k', 'circlestyle': '--',
+        'circlelinespec': 'k--', 'circles': None, 'ticks': [],
+        'normalized': 'off', 'cmapzdata': [], 'overlay': 'off',
+        'markerdisplayed': 'marker', 'markerlegend': 'off', 'markerlabel': '',
+        'colormap': 'on', 'preview': 'off', 'rasterize': 'off'})
+
+def test_target_keywords():
+    option = get_target_diagram_options(
+        circleLineSpec = 'b-.', circles = [1, 2], ticks = [-1, 0, 1],
+        markerLabel = {'a': 1}, normalized = 'on', cmapzdata = [1, 2])
+    _check_options(option, {
+        'circlelinespec': 'b-.', 'circlecolor': 'b', 'circlestyle': '-.',
+        'circles': [1, 2], 'ticks': [-1, 0, 1], 'markerlabel': {'a': 1},
+        'normalized': 'on', 'cmapzdata': [1, 2]})
+
+@pytest.mark.parametrize('kwargs, message', [
+    ({'bogus': 1}, 'Unrecognized option: bogus'),
+    ({'nonRMSDz': 'on'}, 'nonrmsdz is an obsolete option. Use cmapzdata instead.'),
+    ({'cmapzdata': 'x'}, 'cmapzdata cannot be a string!'),
+    ({'cmapzdata': True}, 'cmapzdata cannot be a boolean!'),
+    ({'markerLabel': 5}, 'markerlabel value is not a list or dictionary: 5'),
+    ({'colsCOR': {'bad': 1}}, 'Unrecognized option of colscor: bad'),
+    ({'checkStats': 'maybe'}, 'Invalid value: maybe'),
+    ({'arcResolution': 'fine'}, "arcresolution must be 'auto' or 'fixed': fine"),
+])
+def test_taylor_invalid(kwargs, message):
+    with pytest.raises(ValueError) as error:
+        get_taylor_diagram_options(CORS, **kwargs)
+    assert str(error.value) == message
+
+@pytest.mark.parametrize('kwargs, message', [
+    ({'bogus': 2}, 'Unrecognized option: bogus'),
+    ({'overlay': 'x'}, 'Invalid value: x'),
+    ({'cmapzdata': 'x'}, 'cmapzdata cannot be a string!'),
+    ({'checkStats': 'on'}, 'Unrecognized option: checkstats'),
+])
+def test_target_invalid(kwargs, message):
+    with pytest.raises(ValueError) as error:
+        get_target_diagram_options(**kwargs)
+    assert str(error.value) == message
+
+def test_options_file(tmp_path):
+    filename = tmp_path / 'taylor_options.csv'
+    filename.write_text('name,value\ntickRMS,"[0.0, 1.0, 2.0]"\ncolRMS,"0, .6, 0"\n' +
+                        'titleOBS,Ref\nmarkerLegend,on\n')
+
+    # Keywords override the options file
+    option = get_taylor_diagram_options(CORS, taylor_options_file = str(filename),
+                                        titleOBS = 'Observation')
+    _check_options(option, {'tickrms': [0.0, 1.0, 2.0], 'rincrms': 2.0/3,
+                            'markerlegend': 'on', 'titleobs': 'Observation'})
+    np.testing.assert_allclose(option['colrms'], (0, 0.6, 0))
+
+def test_options_file_invalid(tmp_path):
+    with pytest.raises(FileNotFoundError, match = 'File does not exist'):
+        get_taylor_diagram_options(CORS, taylor_options_file = str(tmp_path / 'none.csv'))
+    with pytest.raises(ValueError, match = 'Invalid file type: options.xls'):
+        get_target_diagram_options(target_options_file = 'options.xls')
+
+    filename = tmp_path / 'target_options.csv'
+    filename.write_text('name,value\nbogus,1\n')
+    with pytest.raises(ValueError, match = 'Unrecognized option: bogus'):
+        get_target_diagram_options(target_options_file = str(filename))
@@ -0,0 +1,51 @@
+'''
+Tests of the SVG documents written by the TAYLOR_DIAGRAM_SVG and
+TARGET_DIAGRAM_SVG functions.
+
+Run from the root of the repository with:
+
+$ python -m pytest Test
+'''
+import xml.etree.ElementTree as ET
+
+import numpy as np
+import pytest
+
+import skill_metrics as sm
+
+SDEV = np.array([1.0, 0.8, 1.2, 0.9])
+CRMSD = np.array([0.0, 0.5, 0.6, 0.4])
+CCOEF = np.array([1.0, 0.85, 0.8, 0.9])
+
+_MARKUP = 'a"/><script>alert(1)</script><b x="&'
+
+def _get_texts(svg):
+    root = ET.fromstring(svg)
+    return [''.join(element.itertext()) for element in root.iter()
+            if element.tag.endswith('}text')]
+
+def test_text_escaped():
+    labels = ['Obs', _MARKUP, 'B <2>', 'C & D']
+    svg = sm.taylor_diagram_svg(SDEV, CRMSD, CCOEF, markerLabel = labels,
+                                titleOBS = _MARKUP)
+    texts = _get_texts(svg)
+    assert texts.count(_MARKUP) == 2
+    assert 'B <2>' in texts and 'C & D' in texts
+    assert '<script>' not in svg
+
+    labels = [_MARKUP, 'B', 'C']
+    svg = sm.target_diagram_svg(CRMSD[1:], CRMSD[1:], SDEV[1:], markerLabel = labels,
+                                markerLegend = 'on')
+    assert _MARKUP in _get_texts(svg)
+
+@pytest.mark.parametrize('color', ['r"/><script>alert(1)</script>', '#ff"/><x',
+                                   '#12345', 'not a color!'])
+def test_invalid_color(color):
+    with pytest.raises(ValueError, match = 'Invalid color'):
+        sm.taylor_diagram_svg(SDEV, CRMSD, CCOEF, colRMS = color)
+
+@pytest.mark.parametrize('color', ['r', 'C1', 'tab:blue', '#f00', '#ff000080',
+                                   '0.5', 'dark green', (0, 0.6, 0)])
+def test_valid_color(color):
+    svg = sm.taylor_diagram_svg(SDEV, CRMSD, CCOEF, colRMS = color)
+    ET.fromstring(svg)
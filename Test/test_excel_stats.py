@@ -0,0 +1,83 @@
+'''
+Tests of the ExcelStatsWriter class, through the WRITE_TAYLOR_STATS and
+WRITE_TARGET_STATS functions, and of the READ_TAYLOR_STATS and
+READ_TARGET_STATS functions reading the Excel files it writes.
+
+Run from the root of the repository with:
+
+$ python -m pytest Test
+'''
+import zipfile
+
+import numpy as np
+import pytest
+
+import skill_metrics as sm
+
+def _get_sheets(filename):
+    with zipfile.ZipFile(filename) as book:
+        return [name for name in book.namelist()
+                if name.startswith('xl/worksheets/sheet')]
+
+def _get_taylor_stats(n):
+    rng = np.random.default_rng(0)
+    return {'sdev': rng.random(n), 'crmsd': rng.random(n), 'ccoef': rng.random(n)}
+
+@pytest.mark.parametrize('maxrows', [2, 3, 5, 7])
+def test_taylor_round_trip(tmp_path, maxrows):
+    # Tables continued on several worksheets, including their title rows
+    filename = str(tmp_path / 'taylor_stats.xlsx')
+    data = [_get_taylor_stats(9), _get_taylor_stats(4), _get_taylor_stats(6)]
+    title = ['Expt. 01', 'Expt. 02', 'Expt. 03']
+    label = ['Station %d' % i for i in range(9)]
+    sm.write_taylor_stats(filename, data, title = title, label = label,
+                          maxrows = maxrows)
+    assert len(_get_sheets(filename)) > 1
+
+    stats = sm.read_taylor_stats(filename)
+    assert len(stats) == len(data)
+    for values, expected, name in zip(stats, data, title):
+        # Numbers are written with the 15 significant digits of Excel
+        for key in ('sdev', 'crmsd', 'ccoef'):
+            np.testing.assert_allclose(values[key], expected[key], rtol = 1e-15)
+        assert values['title'] == name
+        assert values['label'] == label[:len(expected['sdev'])]
+
+def test_target_round_trip(tmp_path):
+    filename = str(tmp_path / 'target_stats.xlsx')
+    data = {'bias': [0.5, -0.25, 1.0], 'crmsd': [1.0, 2.0, 0.5],
+            'rmsd': [1.5, 2.5, 1.25]}
+    sm.write_target_stats(filename, data, maxrows = 4, numberformat = '0.00')
+
+    stats = sm.read_target_stats(filename)
+    assert len(stats) == 1
+    for key in ('bias', 'crmsd', 'rmsd'):
+        np.testing.assert_array_equal(stats[0][key], data[key])
+    assert stats[0]['title'] == ''
+    assert stats[0]['label'] == []
+
+def test_writer_sheets(tmp_path):
+    filename = str(tmp_path / 'stats.xlsx')
+    header = ['Station', 'SDEV']
+    with sm.ExcelStatsWriter(filename, max_rows = 4) as writer:
+        writer.write_row(['Taylor Statistics'])
+        writer.write_table([['A', 'B', 'C', 'D', 'E'], np.arange(5.0)],
+                           header = header)
+        # Title, header and 2 rows, then the header repeated and 3 rows
+        assert writer.sheets == 2
+        assert writer.row == 4
+    assert len(_get_sheets(filename)) == 2
+
+    with pytest.raises(ValueError, match = 'Excel writer is closed'):
+        writer.write_row(['x'])
+
+def test_writer_invalid(tmp_path):
+    filename = str(tmp_path / 'stats.xlsx')
+    with pytest.raises(ValueError, match = 'max_rows must be an integer from 2'):
+        sm.ExcelStatsWriter(filename, max_rows = 1)
+
+    with sm.ExcelStatsWriter(filename) as writer:
+        with pytest.raises(ValueError, match = 'Columns have different lengths'):
+            writer.write_table([[1.0, 2.0], [1.0]])
+    with pytest.raises(ValueError, match = 'File already exists'):
+        sm.ExcelStatsWriter(filename)
@@ -0,0 +1,36 @@
+'''
+Tests of the names exported by the skill_metrics package.
+
+Run from the root of the repository with:
+
+$ python -m pytest Test
+'''
+import os
+import subprocess
+import sys
+
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def _run(code):
+    '''
+    Run CODE in a new Python interpreter, in which the package is not yet
+    imported, and return its output.
+    '''
+    environment = dict(os.environ, PYTHONPATH = _ROOT, MPLBACKEND = 'Agg')
+    return subprocess.run([sys.executable, '-c', code], env = environment,
+                          check = True, capture_output = True, text = True).stdout
+
+def test_import_is_lazy():
+    output = _run('import sys; import skill_metrics.diagram_svg; '
+                  'import skill_metrics.diagram_geometry; '
+                  'print("matplotlib" in sys.modules, "pandas" in sys.modules)')
+    assert output.split() == ['False', 'False']
+
+def test_submodule_import_keeps_function():
+    # Importing a module of the same name as its function, directly or
+    # through another module, binds the function in the package
+    output = _run('import skill_metrics as sm; import skill_metrics.render_diagrams; '
+                  'import skill_metrics.target_diagram; '
+                  'print(callable(sm.taylor_diagram), callable(sm.target_diagram), '
+                  'sm.taylor_diagram.__module__)')
+    assert output.split() == ['True', 'True', 'skill_metrics.taylor_diagram']
@@ -0,0 +1,112 @@
+'''
+Tests of the CONVERT_PICKLE_DATASET function converting pickle files to
+datasets read back with the READ_DATASET function.
+
+Run from the root of the repository with:
+
+$ python -m pytest Test
+'''
+import datetime
+import os
+import pickle
+
+import numpy as np
+import pytest
+
+from skill_metrics.convert_pickle_dataset import convert_pickle_dataset
+from skill_metrics.read_dataset import read_dataset
+
+EXAMPLES = os.path.join(os.path.dirname(__file__), '..', 'Examples')
+
+class Container(object):
+    '''
+    Class of the data of the examples, which need not be available when
+    the pickle file is converted.
+    '''
+
+    def __init__(self, pred1, pred2, ref):
+        self.pred1 = pred1
+        self.pred2 = pred2
+        self.ref = ref
+
+class _Command(object):
+    '''
+    Object whose unpickling runs a shell command creating the file FILENAME.
+    '''
+
+    def __init__(self, filename):
+        self.filename = filename
+
+    def __reduce__(self):
+        return (os.system, ('touch ' + self.filename,))
+
+def _get_element(seed, n):
+    rng = np.random.default_rng(seed)
+    return {'data': rng.random(n), 'depth': -np.arange(n, dtype = float),
+            'station': ['S%d' % i for i in range(n)],
+            'date': [datetime.date(2016, 12, 3 + i) for i in range(n)],
+            'units': 'cell/L'}
+
+def _check_element(data, expected):
+    np.testing.assert_array_equal(data['data'], expected['data'])
+    np.testing.assert_array_equal(data['depth'], expected['depth'])
+    assert data['station'].tolist() == expected['station']
+    np.testing.assert_array_equal(data['date'],
+                                  np.array(expected['date'], dtype = 'datetime64[D]'))
+    assert data['units'] == expected['units']
+
+@pytest.mark.parametrize('protocol', [0, 2, pickle.HIGHEST_PROTOCOL])
+def test_round_trip(tmp_path, protocol):
+    expected = Container(_get_element(1, 10), _get_element(2, 10), _get_element(3, 10))
+    filename = str(tmp_path / 'data.pkl3')
+    with open(filename, 'wb') as file:
+        pickle.dump(expected, file, protocol = protocol)
+
+    data = convert_pickle_dataset(filename)
+    dirname = str(tmp_path / 'data')
+    assert os.path.isdir(dirname)
+    assert sorted(data) == ['pred1', 'pred2', 'ref']
+    for name in ('pred1', 'pred2', 'ref'):
+        _check_element(data[name], getattr(expected, name))
+
+    # Entries read by their keys
+    _check_element(read_dataset(dirname, key = 'pred2'), expected.pred2)
+    np.testing.assert_array_equal(read_dataset(dirname, key = '/ref/data/'),
+                                  expected.ref['data'])
+    assert read_dataset(dirname, key = 'ref/units') == 'cell/L'
+    with pytest.raises(ValueError, match = 'Entry not in dataset .*: ref/bias'):
+        read_dataset(dirname, key = 'ref/bias')
+    with pytest.raises(ValueError, match = 'Entry not in dataset .*: ref/units/x'):
+        read_dataset(dirname, key = 'ref/units/x')
+
+    with pytest.raises(ValueError, match = 'already exists'):
+        convert_pickle_dataset(filename, dirname)
+    convert_pickle_dataset(filename, dirname, overwrite = True)
+
+@pytest.mark.parametrize('name', ['taylor_data.pkl', 'taylor_data.pkl3'])
+def test_examples(tmp_path, name):
+    # Pickle files of the examples written by Python 2 and Python 3
+    dirname = str(tmp_path / 'taylor_data')
+    data = convert_pickle_dataset(os.path.join(EXAMPLES, name), dirname)
+    assert sorted(data) == ['pred1', 'pred2', 'pred3', 'ref']
+    values = read_dataset(dirname, key = 'ref/data')
+    assert isinstance(values, np.ndarray) and len(values) > 0
+    np.testing.assert_array_equal(values, data['ref']['data'])
+
+def test_unsafe_callable(tmp_path):
+    # The pickled call of os.system must not be run
+    marker = str(tmp_path / 'marker')
+    filename = str(tmp_path / 'data.pkl3')
+    with open(filename, 'wb') as file:
+        pickle.dump({'ref': _Command(marker)}, file)
+
+    with pytest.raises(ValueError, match = 'Cannot convert pickle file'):
+        convert_pickle_dataset(filename)
+    assert not os.path.exists(marker)
+    assert not os.path.exists(str(tmp_path / 'data'))
+
+def test_missing_file(tmp_path):
+    with pytest.raises(ValueError, match = 'File does not exist'):
+        convert_pickle_dataset(str(tmp_path / 'none.pkl'))
+    with pytest.raises(ValueError, match = 'Dataset does not exist'):
+        read_dataset(str(tmp_path / 'none'))
@@ -0,0 +1,93 @@
+'''
+Tests of the READ_ELEMENT_DATA function reading the example prediction
+file Examples/pred1.csv as a whole, in chunks and by columns.
+
+Run from the root of the repository with:
+
+$ python -m pytest Test
+'''
+import csv
+import os
+
+import numpy as np
+import pytest
+
+from skill_metrics.read_element_data import read_element_data
+
+FILENAME = os.path.join(os.path.dirname(__file__), '..', 'Examples', 'pred1.csv')
+
+NUMBERS = ['data', 'latitude', 'longitude', 'depth', 'jday']
+
+def _read_csv(filename):
+    '''
+    Return the columns of a CSV file as lists of strings by their headers.
+    '''
+    with open(filename, newline = '') as file:
+        rows = list(csv.DictReader(file))
+    return {header: [row[header] for row in rows] for header in rows[0]}
+
+def test_read():
+    expected = _read_csv(FILENAME)
+    data = read_element_data(FILENAME)
+    assert list(data) == NUMBERS + ['units']
+    for name in NUMBERS:
+        assert data[name].dtype == np.float64
+        np.testing.assert_array_equal(data[name], np.array(expected[name], dtype = float))
+    assert data['units'] == {'data': 'cell/L'}
+
+    # Suffix added to the name
+    data = read_element_data(FILENAME[:-len('.csv')])
+    np.testing.assert_array_equal(data['data'], np.array(expected['data'], dtype = float))
+
+@pytest.mark.parametrize('chunksize', [1, 10, 56, 100])
+def test_chunks(chunksize):
+    expected = read_element_data(FILENAME)
+    chunks = list(read_element_data(FILENAME, chunksize = chunksize))
+    assert len(chunks) == -(-len(expected['data']) // chunksize)
+    assert all(len(chunk['data']) <= chunksize for chunk in chunks)
+    for name in NUMBERS:
+        np.testing.assert_array_equal(np.concatenate([chunk[name] for chunk in chunks]),
+                                      expected[name])
+    assert all(chunk['units'] == {'data': 'cell/L'} for chunk in chunks)
+
+def test_usecols():
+    expected = read_element_data(FILENAME)
+    data = read_element_data(FILENAME, usecols = ['jday', 'data'],
+                             dtype = {'data': np.float32})
+    assert list(data) == ['data', 'jday', 'units']
+    assert data['data'].dtype == np.float32
+    np.testing.assert_array_equal(data['data'], expected['data'].astype(np.float32))
+    np.testing.assert_array_equal(data['jday'], expected['jday'])
+
+    # Units of the data are only known from the units column
+    assert data['units'] == {}
+    data = read_element_data(FILENAME, usecols = ['data', 'units'], chunksize = 20)
+    assert [chunk['units'] for chunk in data] == [{'data': 'cell/L'}]*3
+
+def test_units_header(tmp_path):
+    filename = str(tmp_path / 'obs.csv')
+    with open(filename, 'w') as file:
+        file.write('station,data (cell/L),depth (m)\nA,1.5,-1\nB,2.5,-10\n')
+    data = read_element_data(filename)
+    assert list(data) == ['station', 'data', 'depth', 'units']
+    assert data['station'].tolist() == ['A', 'B']
+    np.testing.assert_array_equal(data['depth'], [-1.0, -10.0])
+    assert data['units'] == {'data': 'cell/L', 'depth': 'm'}
+
+    data = read_element_data(filename, usecols = ['data'])
+    assert list(data) == ['data', 'units']
+    assert data['units'] == {'data': 'cell/L'}
+
+def test_invalid(tmp_path):
+    with pytest.raises(ValueError, match = 'Invalid file type: pred1.txt'):
+        read_element_data('pred1.txt')
+    with pytest.raises(ValueError, match = 'File does not exist'):
+        read_element_data(str(tmp_path / 'none.csv'))
+    with pytest.raises(ValueError, match = 'Columns not in file .*: salinity'):
+        read_element_data(FILENAME, usecols = ['data', 'salinity'])
+
+    filename = str(tmp_path / 'pred.csv')
+    with open(filename, 'w') as file:
+        file.write('data,units\n1.0,cell/L\n2.0,mg/L\n')
+    with pytest.raises(ValueError, match = 'Units vary within file .*: cell/L, mg/L'):
+        read_element_data(filename)
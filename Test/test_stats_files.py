@@ -0,0 +1,108 @@
+'''
+Tests of the StatsStreamWriter class and of the READ_TAYLOR_STATS and
+READ_TARGET_STATS functions reading the files it writes.
+
+Run from the root of the repository with:
+
+$ python -m pytest Test
+
+The Parquet and Feather tests are skipped if pyarrow is not installed.
+'''
+import numpy as np
+import pytest
+
+import skill_metrics as sm
+
+def _get_taylor_stats():
+    '''
+    Return the statistics of two data sets with the same (empty) title and a
+    third data set with a title, labels and a missing value.
+    '''
+    return [({'sdev': [1.0, 2.5], 'crmsd': [0.0, 1.25], 'ccoef': [1.0, 0.5]},
+             '', None),
+            ({'sdev': [3.0], 'crmsd': [0.5], 'ccoef': [0.9]}, '', None),
+            ({'sdev': [4.0, 5.0, 6.0], 'crmsd': [0.25, np.nan, 2.0],
+              'ccoef': [0.75, 0.25, -0.5]}, 'Experiment 1', ['A', 'B', 'C'])]
+
+def _check_taylor_stats(data, expected):
+    assert len(data) == len(expected)
+    for stats, (values, title, label) in zip(data, expected):
+        for key in ('sdev', 'crmsd', 'ccoef'):
+            np.testing.assert_array_equal(stats[key], values[key])
+        assert stats['title'] == title
+        assert stats['label'] == ([] if label is None else label)
+
+def _write_taylor_stats(filename, expected):
+    with sm.StatsStreamWriter(filename) as writer:
+        for values, title, label in expected:
+            writer.write(values, title = title, label = label)
+    return writer
+
+@pytest.mark.parametrize('suffix', ['.csv', '.parquet', '.feather', '.arrow'])
+def test_round_trip(tmp_path, suffix):
+    if suffix != '.csv':
+        pytest.importorskip('pyarrow')
+    filename = str(tmp_path / ('stats' + suffix))
+    expected = _get_taylor_stats()
+
+    writer = _write_taylor_stats(filename, expected)
+    assert writer.metrics == ['sdev', 'crmsd', 'ccoef']
+    assert writer.rows == 6
+    assert writer.groups == 3
+
+    # Data sets with the same title are read back apart
+    _check_taylor_stats(sm.read_taylor_stats(filename), expected)
+
+@pytest.mark.parametrize('suffix', ['.parquet', '.feather'])
+def test_arrow_column_types(tmp_path, suffix):
+    pyarrow = pytest.importorskip('pyarrow')
+    import pyarrow.feather
+    import pyarrow.parquet
+    filename = str(tmp_path / ('stats' + suffix))
+    _write_taylor_stats(filename, _get_taylor_stats())
+
+    if suffix == '.parquet':
+        table = pyarrow.parquet.read_table(filename)
+    else:
+        table = pyarrow.feather.read_table(filename)
+    assert table.column_names == ['group', 'title', 'label', 'sdev', 'crmsd', 'ccoef']
+    assert table.schema.field('group').type == pyarrow.int64()
+    assert table.schema.field('title').type == pyarrow.string()
+    assert table.schema.field('sdev').type == pyarrow.float64()
+    assert table.column('group').to_pylist() == [0, 0, 1, 2, 2, 2]
+
+def test_append_csv(tmp_path):
+    filename = str(tmp_path / 'stats.csv')
+    expected = _get_taylor_stats()
+    _write_taylor_stats(filename, expected[:2])
+
+    with sm.StatsStreamWriter(filename, append = True) as writer:
+        assert writer.metrics == ['sdev', 'crmsd', 'ccoef']
+        assert writer.groups == 2
+        values, title, label = expected[2]
+        writer.write(values, title = title, label = label)
+
+    _check_taylor_stats(sm.read_taylor_stats(filename), expected)
+
+def test_target_stats_missing_metrics(tmp_path):
+    filename = str(tmp_path / 'stats.csv')
+    with sm.StatsStreamWriter(filename, metrics = ['bias', 'crmsd', 'rmsd']) as writer:
+        writer.write({'bias': [0.5, -0.5], 'rmsd': [1.0, 2.0]}, title = 'T')
+
+    data = sm.read_target_stats(filename)
+    assert len(data) == 1
+    np.testing.assert_array_equal(data[0]['bias'], [0.5, -0.5])
+    assert np.isnan(data[0]['crmsd']).all()
+    np.testing.assert_array_equal(data[0]['rmsd'], [1.0, 2.0])
+    assert data[0]['title'] == 'T'
+
+    with pytest.raises(ValueError, match = 'Statistics missing from file'):
+        sm.read_taylor_stats(filename)
+
+def test_existing_file(tmp_path):
+    filename = str(tmp_path / 'stats.csv')
+    _write_taylor_stats(filename, _get_taylor_stats())
+    with pytest.raises(ValueError, match = 'File already exists'):
+        sm.StatsStreamWriter(filename)
+    with pytest.raises(ValueError, match = 'Metrics differ'):
+        sm.StatsStreamWriter(filename, metrics = ['bias'], append = True)
@@ -1,41 +1,113 @@
-from .add_legend import add_legend
-from .bias import bias
-from .bias_percent import bias_percent
-from .brier_score import brier_score
-from .centered_rms_dev import centered_rms_dev
-from .check_on_off import check_on_off
-from .check_duplicate_stats import check_duplicate_stats
-from .check_label_position import check_label_position
-from .check_taylor_stats import check_taylor_stats
-from .error_check_stats import error_check_stats
-from .get_axis_tick_label import get_axis_tick_label
-from .get_default_markers import get_default_markers
-from .get_from_dict_or_default import get_from_dict_or_default
-from .get_single_markers import get_single_markers
-from .get_target_diagram_axes import get_target_diagram_axes
-from .get_target_diagram_options import get_target_diagram_options
-from .get_taylor_diagram_axes import get_taylor_diagram_axes
-from .get_taylor_diagram_options import get_taylor_diagram_options
-from .kling_gupta_eff09 import kling_gupta_eff09
-from .kling_gupta_eff12 import kling_gupta_eff12
-from .nash_sutcliffe_eff import nash_sutcliffe_eff
-from .overlay_target_diagram_circles import overlay_target_diagram_circles
-from .overlay_taylor_diagram_circles import overlay_taylor_diagram_circles
-from .overlay_taylor_diagram_lines import overlay_taylor_diagram_lines
-from .plot_pattern_diagram_colorbar import plot_pattern_diagram_colorbar
-from .plot_pattern_diagram_markers import plot_pattern_diagram_markers
-from .plot_target_axes import plot_target_axes
-from .plot_taylor_axes import plot_taylor_axes
-from .plot_taylor_obs import plot_taylor_obs
-from .report_duplicate_stats import report_duplicate_stats
-from .rmsd import rmsd
-from .save_figures import save_figures
-from .skill_score_brier import skill_score_brier
-from .skill_score_murphy import skill_score_murphy
-from .target_diagram import target_diagram
-from .target_statistics import target_statistics
-from .taylor_diagram import taylor_diagram
-from .taylor_statistics import taylor_statistics
-from .write_stats import write_stats
-from .write_target_stats import write_target_stats
-from .write_taylor_stats import write_taylor_stats
+import importlib
+import sys
+import types
+
+# Functions and classes of the package and the modules defining them. A
+# module is only imported when one of its names is first used, so that
+# importing the package, or one of its modules that does not draw, e.g.
+# DIAGRAM_GEOMETRY or DIAGRAM_SVG, does not import matplotlib or pandas.
+_MODULES = {
+    'add_legend': 'add_legend',
+    'animate_diagram': 'animate_diagram',
+    'batch_render_diagrams': 'batch_render_diagrams',
+    'bias': 'bias',
+    'bias_percent': 'bias_percent',
+    'brier_score': 'brier_score',
+    'centered_rms_dev': 'centered_rms_dev',
+    'check_on_off': 'check_on_off',
+    'check_duplicate_stats': 'check_duplicate_stats',
+    'check_label_position': 'check_label_position',
+    'check_taylor_stats': 'check_taylor_stats',
+    'check_taylor_stats_batch': 'check_taylor_stats_batch',
+    'convert_pickle_dataset': 'convert_pickle_dataset',
+    'get_target_diagram_geometry': 'diagram_geometry',
+    'get_taylor_diagram_geometry': 'diagram_geometry',
+    'DiagramHandle': 'diagram_handle',
+    'target_diagram_json': 'diagram_json',
+    'taylor_diagram_json': 'diagram_json',
+    'DiagramPdfWriter': 'diagram_pdf_writer',
+    'target_diagram_svg': 'diagram_svg',
+    'taylor_diagram_svg': 'diagram_svg',
+    'error_check_stats': 'error_check_stats',
+    'ExcelStatsWriter': 'excel_stats_writer',
+    'export_diagram': 'export_diagram',
+    'export_figure': 'export_figure',
+    'export_pdf': 'export_pdf',
+    'get_axis_tick_label': 'get_axis_tick_label',
+    'get_default_markers': 'get_default_markers',
+    'get_from_dict_or_default': 'get_from_dict_or_default',
+    'get_single_markers': 'get_single_markers',
+    'get_target_diagram_axes': 'get_target_diagram_axes',
+    'get_target_diagram_options': 'get_target_diagram_options',
+    'get_taylor_diagram_axes': 'get_taylor_diagram_axes',
+    'get_taylor_diagram_options': 'get_taylor_diagram_options',
+    'kling_gupta_eff09': 'kling_gupta_eff09',
+    'kling_gupta_eff12': 'kling_gupta_eff12',
+    'nash_sutcliffe_eff': 'nash_sutcliffe_eff',
+    'OptionProfile': 'option_profile',
+    'overlay_target_diagram_circles': 'overlay_target_diagram_circles',
+    'overlay_taylor_diagram_circles': 'overlay_taylor_diagram_circles',
+    'overlay_taylor_diagram_lines': 'overlay_taylor_diagram_lines',
+    'place_marker_labels': 'place_marker_labels',
+    'plot_pattern_diagram_colorbar': 'plot_pattern_diagram_colorbar',
+    'plot_pattern_diagram_density': 'plot_pattern_diagram_density',
+    'plot_pattern_diagram_markers': 'plot_pattern_diagram_markers',
+    'plot_pattern_diagram_preview': 'plot_pattern_diagram_preview',
+    'plot_target_axes': 'plot_target_axes',
+    'plot_taylor_axes': 'plot_taylor_axes',
+    'plot_taylor_obs': 'plot_taylor_obs',
+    'rasterize_diagram': 'rasterize_diagram',
+    'read_dataset': 'read_dataset',
+    'read_element_data': 'read_element_data',
+    'read_options_file': 'read_options_file',
+    'read_target_stats': 'read_target_stats',
+    'read_taylor_stats': 'read_taylor_stats',
+    'RenderCache': 'render_cache',
+    'render_diagrams': 'render_diagrams',
+    'report_duplicate_stats': 'report_duplicate_stats',
+    'rmsd': 'rmsd',
+    'save_figures': 'save_figures',
+    'skill_score_brier': 'skill_score_brier',
+    'skill_score_murphy': 'skill_score_murphy',
+    'StatsStreamWriter': 'stats_stream_writer',
+    'target_diagram': 'target_diagram',
+    'target_statistics': 'target_statistics',
+    'taylor_diagram': 'taylor_diagram',
+    'taylor_statistics': 'taylor_statistics',
+    'write_dataset': 'write_dataset',
+    'write_stats': 'write_stats',
+    'write_target_stats': 'write_target_stats',
+    'write_taylor_stats': 'write_taylor_stats',
+}
+
+__all__ = list(_MODULES)
+
+def __getattr__(name):
+    if not name in _MODULES:
+        raise AttributeError("module '" + __name__ + "' has no attribute '" +
+                             name + "'")
+    module = importlib.import_module('.' + _MODULES[name], __name__)
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | set(_MODULES))
+
+# Importing a submodule binds it as an attribute of the package, e.g. the
+# import of skill_metrics.taylor_diagram by RENDER_DIAGRAMS would replace
+# the TAYLOR_DIAGRAM function with its module. __getattr__ alone cannot
+# prevent this since it is only called for missing names, so the class of
+# the package is changed to bind the function instead.
+class _Package(types.ModuleType):
+    '''
+    Package binding the function or class of a module of the same name,
+    e.g. TAYLOR_DIAGRAM, rather than the module when the module is imported.
+    '''
+
+    def __setattr__(self, name, value):
+        if isinstance(value, types.ModuleType) and _MODULES.get(name) == name:
+            value = getattr(value, name, value)
+        super().__setattr__(name, value)
+
+sys.modules[__name__].__class__ = _Package
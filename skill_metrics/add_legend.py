@@ -1,8 +1,8 @@
 import math
-import matplotlib.pyplot as plt
 from matplotlib.lines import Line2D
 
-def add_legend(markerLabel, labelcolor, option, rgba, markerSize, fontSize, hp = []):
+def add_legend(markerLabel, labelcolor, option, rgba, markerSize, fontSize, hp = [],
+               ax = None):
     '''
     Adds a legend to a pattern diagram.
     
@@ -40,6 +40,8 @@ def add_legend(markerLabel, labelcolor, option, rgba, markerSize, fontSize, hp =
     markerSize : point size of markers
     fontSize : font size in points of labels
     hp : list of plot handles that match markerLabel when latter is a list
+    ax : matplotlib.axes.Axes object to receive the legend. If None, the
+         current pyplot axes is used. (Default: None)
     
     OUTPUTS:
     None
@@ -53,6 +55,10 @@ def add_legend(markerLabel, labelcolor, option, rgba, markerSize, fontSize, hp =
         prochford@thesymplectic.com
     '''
 
+    if ax is None:
+        import matplotlib.pyplot as plt
+        ax = plt.gca()
+
     if type(markerLabel) is list:
         
         # Check for empty list of plot handles
@@ -66,7 +72,7 @@ def add_legend(markerLabel, labelcolor, option, rgba, markerSize, fontSize, hp =
         if len(markerLabel) <= 6:
             # Put legend in a default location
             markerlabel = tuple(markerLabel)
-            leg = plt.legend(hp, markerlabel, loc = 'upper right',
+            leg = ax.legend(hp, markerlabel, loc = 'upper right',
                                  fontsize = fontSize, numpoints=1,
                                  bbox_to_anchor=(1.2,1.0))
         else:
@@ -81,7 +87,7 @@ def add_legend(markerLabel, labelcolor, option, rgba, markerSize, fontSize, hp =
             markerlabel = tuple(markerLabel)
 
             # Shift figure to include legend
-            plt.gcf().subplots_adjust(right=0.6)
+            ax.figure.subplots_adjust(right=0.6)
 
             # Plot legend of multi-column markers
             # Note: do not use bbox_to_anchor as this cuts off the legend
@@ -89,7 +95,7 @@ def add_legend(markerLabel, labelcolor, option, rgba, markerSize, fontSize, hp =
                 loc = (1.2, 0.25)
             else:
                 loc = (1.1, 0.25)
-            leg = plt.legend(hp, markerlabel, loc = loc, fontsize = fontSize,
+            leg = ax.legend(hp, markerlabel, loc = loc, fontsize = fontSize,
                              numpoints=1, ncol = ncol)
 
     elif type(markerLabel) is dict:
@@ -113,13 +119,13 @@ def add_legend(markerLabel, labelcolor, option, rgba, markerSize, fontSize, hp =
             legend_elements.append(legend_object)
 
         # Put legend in a default location
-        leg = plt.legend(handles=legend_elements, loc = 'upper right',
+        leg = ax.legend(handles=legend_elements, loc = 'upper right',
                              fontsize = fontSize, numpoints=1,
                              bbox_to_anchor=(1.2,1.0))
 
         if _checkKey(option, 'numberpanels') and option['numberpanels'] == 2:
             # add padding so legend is not cut off
-            plt.tight_layout(pad=1)
+            ax.figure.tight_layout(pad=1)
     else:
         raise Exception('markerLabel type is not a list or dictionary: ' + 
                         str(type(markerLabel)))
@@ -0,0 +1,208 @@
+from collections import deque
+import itertools
+import shutil
+import subprocess
+
+from matplotlib import rcParams
+from matplotlib.collections import LineCollection
+import numpy as np
+
+from skill_metrics.export_figure import _close_figure
+
+def _get_statistics(statistics: dict, kind: str) -> tuple:
+    '''
+    Return the arguments for the DiagramHandle.update_points method from a
+    dictionary of statistics.
+    '''
+    if kind == 'taylor':
+        return statistics['sdev'], statistics['crmsd'], statistics['ccoef']
+    else:
+        return statistics['bias'], statistics['crmsd'], statistics['rmsd']
+
+class _ImageSequenceWriter(object):
+    '''
+    Write each frame to a numbered image file, e.g. 'frame%05d.png'.
+    '''
+
+    def __init__(self, filename, size):
+        self.filename = filename
+        self.size = size
+        self.frame = 0
+
+    def write(self, buffer) -> None:
+        from PIL import Image
+        image = Image.frombuffer('RGBA', self.size, buffer, 'raw', 'RGBA', 0, 1)
+        image.save(self.filename % self.frame)
+        self.frame += 1
+
+    def close(self) -> None:
+        pass
+
+class _PillowWriter(object):
+    '''
+    Write frames to an animated GIF using Pillow. The frames are held in
+    memory until the writer is closed.
+    '''
+
+    def __init__(self, filename, size, fps):
+        self.filename = filename
+        self.size = size
+        self.duration = 1000/fps
+        self.frames = []
+
+    def write(self, buffer) -> None:
+        from PIL import Image
+        image = Image.frombuffer('RGBA', self.size, buffer, 'raw', 'RGBA', 0, 1)
+        self.frames.append(image.convert('RGB'))
+
+    def close(self) -> None:
+        if len(self.frames) > 0:
+            self.frames[0].save(self.filename, save_all = True,
+                                append_images = self.frames[1:],
+                                duration = self.duration, loop = 0)
+        self.frames = []
+
+class _FFMpegWriter(object):
+    '''
+    Write frames to a movie file by piping raw RGBA pixels to ffmpeg.
+    '''
+
+    def __init__(self, ffmpeg, filename, size, fps):
+        command = [ffmpeg, '-y', '-loglevel', 'error',
+                   '-f', 'rawvideo', '-vcodec', 'rawvideo', '-pix_fmt', 'rgba',
+                   '-s', '%dx%d' % size, '-r', str(fps), '-i', 'pipe:']
+        if not filename.lower().endswith('.gif'):
+            # Most video codecs require even frame dimensions
+            command += ['-vf', 'pad=ceil(iw/2)*2:ceil(ih/2)*2', '-pix_fmt', 'yuv420p']
+        command.append(filename)
+
+        self.proc = subprocess.Popen(command, stdin = subprocess.PIPE,
+                                     stderr = subprocess.PIPE)
+
+    def write(self, buffer) -> None:
+        self.proc.stdin.write(buffer)
+
+    def close(self) -> None:
+        self.proc.stdin.close()
+        error = self.proc.stderr.read()
+        if self.proc.wait() != 0:
+            raise RuntimeError('ffmpeg failed to write movie: ' +
+                               error.decode(errors = 'replace'))
+
+def _get_writer(filename, size, fps):
+    '''
+    Choose a writer for the frames from the name of the output file.
+    '''
+    if '%' in filename:
+        return _ImageSequenceWriter(filename, size)
+
+    ffmpeg = shutil.which(rcParams['animation.ffmpeg_path'])
+    if ffmpeg is not None:
+        return _FFMpegWriter(ffmpeg, filename, size, fps)
+    elif filename.lower().endswith('.gif'):
+        return _PillowWriter(filename, size, fps)
+    else:
+        raise ValueError('ffmpeg is required to write movie file: ' + filename)
+
+def animate_diagram(frames, filename, options = None, fps = 10, trail = 0,
+                    trailcolor = '0.5', figsize = None, dpi = None) -> int:
+    '''
+    Animate a Taylor or target diagram evolving over a sequence of frames.
+
+    The diagram is drawn once for the first frame. Its axes, grid, labels
+    and legend are then kept as a static background and only the markers,
+    their labels, colors and optional trails are redrawn for each frame
+    using blitting. The frames are rendered with the Agg backend and
+    written directly to a movie file or a sequence of images, so long
+    runs of many thousands of frames can be produced quickly.
+
+    The output format is chosen from FILENAME:
+    'frame%05d.png' : a name containing a % format writes a numbered image
+                      for each frame, e.g. frame00000.png, frame00001.png, ...
+    'skill.mp4'     : a movie file in any format supported by ffmpeg, which
+                      must be installed (see rcParams["animation.ffmpeg_path"])
+    'skill.gif'     : an animated GIF, written with ffmpeg if installed,
+                      otherwise with Pillow keeping all frames in memory
+
+    The axis limits are those of the first frame, so markers moving outside
+    them are hidden. Supply the 'axismax' option to allow for the range of
+    all the frames.
+
+    INPUTS:
+    frames     : iterable of dictionaries of statistics, one for each frame,
+                 as described for the RENDER_DIAGRAMS function. All the frames
+                 must contain the same type of statistics and number of points.
+                 Frames are consumed lazily, so a generator may be used.
+    filename   : name of the movie file or image file format
+    options    : dictionary of options passed as keywords to the
+                 TAYLOR_DIAGRAM or TARGET_DIAGRAM function (Default: None)
+    fps        : frames per second of the movie (Default: 10)
+    trail      : number of previous frames to draw as a trail behind each
+                 marker, not available when MarkerDisplayed == 'density'
+                 (Default: 0, no trail)
+    trailcolor : color of the trails (Default: '0.5', gray)
+    figsize    : figure size in inches (Default: rcParams["figure.figsize"])
+    dpi        : resolution in dots per inch (Default: rcParams["figure.dpi"])
+
+    OUTPUTS:
+    count : number of frames written
+
+    EXAMPLE:
+    frames = (sm.taylor_statistics(pred[cycle], ref[cycle]) for cycle in cycles)
+    sm.animate_diagram(frames, 'skill.mp4', {'axismax': 2.0}, fps = 25, trail = 10)
+    '''
+    from skill_metrics.render_diagrams import _draw_diagram, _get_diagram_type, _new_figure
+
+    frames = iter(frames)
+    try:
+        first = next(frames)
+    except StopIteration:
+        raise ValueError('No frames to animate.')
+    kind = _get_diagram_type(first)
+
+    # Draw diagram for first frame
+    figure = _new_figure(figsize, dpi)
+    ax = figure.add_subplot(1, 1, 1)
+    handle = _draw_diagram(ax, first, options)
+    if trail > 0 and handle.mesh is not None:
+        raise ValueError("Trails require markers, not MarkerDisplayed == 'density'.")
+
+    try:
+        # Identify the artists changed in each frame and exclude them from
+        # the background
+        artists = handle.update_points(*_get_statistics(first, kind))
+        if trail > 0:
+            trails = LineCollection([], colors = trailcolor, linewidths = 1)
+            ax.add_collection(trails, autolim = False)
+            artists.insert(0, trails)
+            history = deque(maxlen = trail + 1)
+        for artist in artists:
+            artist.set_animated(True)
+
+        # Draw static background once
+        canvas = figure.canvas
+        canvas.draw()
+        background = canvas.copy_from_bbox(figure.bbox)
+
+        writer = _get_writer(filename, canvas.get_width_height(), fps)
+        count = 0
+        try:
+            for statistics in itertools.chain([first], frames):
+                handle.update_points(*_get_statistics(statistics, kind))
+                if trail > 0:
+                    history.append(np.column_stack(handle.get_points()))
+                    trails.set_segments(np.stack(history, axis = 1))
+
+                # Redraw only the animated artists over the background
+                canvas.restore_region(background)
+                for artist in artists:
+                    figure.draw_artist(artist)
+
+                writer.write(canvas.buffer_rgba())
+                count += 1
+        finally:
+            writer.close()
+    finally:
+        _close_figure(figure)
+
+    return count
@@ -0,0 +1,93 @@
+import multiprocessing
+import numbers
+import time
+import traceback
+
+# Figure reused by all the jobs rendered in a worker process
+_worker_figure = None
+_worker_dpi = None
+
+def _init_worker(figsize, dpi):
+    '''
+    Initialize a worker process with a headless Agg figure for reuse.
+    '''
+    global _worker_figure, _worker_dpi
+    import matplotlib
+    matplotlib.use('Agg')
+    from skill_metrics.render_diagrams import _new_figure
+
+    _worker_figure = _new_figure(figsize, dpi)
+    _worker_dpi = dpi
+
+def _run_job(indexed_job) -> dict:
+    '''
+    Render one job in a worker process, capturing the time taken and any error.
+    '''
+    from skill_metrics.render_diagrams import _render_diagram
+
+    index, (statistics, options, filename) = indexed_job
+
+    result = {'index': index, 'filename': filename, 'time': 0.0, 'error': None}
+    start = time.perf_counter()
+    try:
+        _render_diagram(statistics, options, filename, figure = _worker_figure,
+                        dpi = _worker_dpi)
+    except Exception as error:
+        result['error'] = ''.join(traceback.format_exception_only(type(error), error)).strip()
+    result['time'] = time.perf_counter() - start
+
+    return result
+
+def _get_results(jobs, processes, figsize, dpi, chunksize):
+    '''
+    Generate the results of the JOBS rendered by a process pool.
+    '''
+    with multiprocessing.Pool(processes, initializer = _init_worker,
+                              initargs = (figsize, dpi)) as pool:
+        for result in pool.imap_unordered(_run_job, enumerate(jobs), chunksize):
+            yield result
+
+def batch_render_diagrams(jobs, processes = None, figsize = None, dpi = None,
+                          chunksize = 1):
+    '''
+    Render a large batch of Taylor or target diagrams using a process pool.
+
+    The jobs are distributed to a pool of headless worker processes using the
+    Agg backend. Each worker creates a single figure that is cleared and
+    reused for every job it renders. Results are returned as each job
+    completes, in the order of completion, along with the time taken to
+    render it. An error in a job does not stop the batch, but is reported
+    in the result for that job.
+
+    INPUTS:
+    jobs       : iterable of (statistics, options, filename) tuples as described
+                 for the RENDER_DIAGRAMS function. Jobs are consumed lazily, so
+                 a generator may be used for very large batches.
+    processes  : number of worker processes (Default: None, the number of CPUs)
+    figsize    : figure size in inches (Default: rcParams["figure.figsize"])
+    dpi        : resolution in dots per inch (Default: rcParams["figure.dpi"])
+    chunksize  : number of jobs sent to a worker at a time (Default: 1). Larger
+                 values reduce the communication overhead for small diagrams.
+
+    OUTPUTS:
+    Generator of dictionaries, one for each job:
+    result['index']    : position of the job in JOBS
+    result['filename'] : name of the file written
+    result['time']     : time in seconds taken to render the diagram
+    result['error']    : error message if the job failed, otherwise None
+
+    EXAMPLE:
+    for result in batch_render_diagrams(jobs, processes = 8, chunksize = 16):
+        if result['error'] is not None:
+            print(result['filename'], result['error'])
+    '''
+    # Check arguments when called, rather than when the results are first
+    # requested
+    if isinstance(chunksize, bool) or not isinstance(chunksize, numbers.Integral) or chunksize < 1:
+        raise ValueError('chunksize must be a positive integer: ' + str(chunksize))
+    if processes is not None and (isinstance(processes, bool) or
+                                  not isinstance(processes, numbers.Integral) or processes < 1):
+        raise ValueError('processes must be a positive integer or None: ' +
+                         str(processes))
+
+    return _get_results(jobs, processes, figsize, dpi, chunksize)
@@ -1,16 +1,104 @@
-def check_duplicate_stats(stats1, stats2, threshold = 0.01):
+import numpy as np
+
+# Maximum number of candidate pairs compared at a time, bounding the memory
+# used for large numbers of statistics
+_CHUNK_PAIRS = 2**20
+
+def _get_windows(values: np.ndarray, threshold: float) -> tuple:
+    '''
+    Return the order that sorts VALUES, and for each value the range
+    [lo, hi) of positions in that order of the values that may agree with
+    it within the relative THRESHOLD. The ranges are slightly widened so
+    that the agreement can be decided exactly afterwards. Values of zero or
+    that are not finite agree with no value.
+    '''
+    order = np.argsort(values, kind = 'stable')
+    ordered = values[order]
+    with np.errstate(invalid = 'ignore', over = 'ignore'):
+        width = threshold*np.abs(values)*(1.0 + 1e-9)
+        lo = np.searchsorted(ordered, values - width, side = 'left')
+        hi = np.searchsorted(ordered, values + width, side = 'right')
+    empty = ~(np.isfinite(width) & (width > 0.0))
+    hi[empty] = lo[empty]
+    return order, lo, hi
+
+def _get_candidates(order, lo, hi, first, last) -> tuple:
+    '''
+    Return the indices (i, j) of the candidate pairs of the values with
+    indices FIRST to LAST - 1 and the values in their windows.
+    '''
+    counts = hi[first:last] - lo[first:last]
+    i = np.repeat(np.arange(first, last), counts)
+    starts = np.cumsum(counts) - counts
+    offsets = np.arange(len(i)) - np.repeat(starts, counts)
+    j = order[np.repeat(lo[first:last], counts) + offsets]
+    return i, j
+
+def _get_duplicate_indices(values: list, threshold: float) -> tuple:
+    '''
+    Return the indices (i, j), with i < j in increasing order, of the points
+    whose statistics in VALUES all agree within the relative THRESHOLD.
+    '''
+    n = len(values[0])
+
+    # Sweep the points sorted by the statistic giving the fewest candidates
+    windows = [_get_windows(stats, threshold) for stats in values]
+    ncandidates = [np.sum(hi - lo) for order, lo, hi in windows]
+    order, lo, hi = windows[int(np.argmin(ncandidates))]
+
+    # Split the points into chunks with a bounded number of candidates
+    total = np.cumsum(hi - lo)
+    bounds = np.searchsorted(total, np.arange(_CHUNK_PAIRS, total[-1], _CHUNK_PAIRS),
+                             side = 'right')
+    bounds = np.unique(np.concatenate(([0], bounds, [n])))
+
+    first_index, second_index = [], []
+    for first, last in zip(bounds[:-1], bounds[1:]):
+        i, j = _get_candidates(order, lo, hi, first, last)
+        keep = j > i
+        i, j = i[keep], j[keep]
+
+        # Same test as the relative differences of each statistic
+        with np.errstate(divide = 'ignore', invalid = 'ignore'):
+            for stats in values:
+                keep = np.abs((stats[i] - stats[j])/stats[i]) < threshold
+                i, j = i[keep], j[keep]
+
+        first_index.append(i)
+        second_index.append(j)
+
+    i, j = np.concatenate(first_index), np.concatenate(second_index)
+    sort = np.lexsort((j, i))
+    return i[sort], j[sort]
+
+def check_duplicate_stats(stats1, stats2, threshold = 0.01, stats3 = None):
     '''
     Checks two lists of paired statistics for duplicates and returns a list of
     the pairs that agree within to <1%.
 
+    Two points i < j are duplicates when the relative difference
+    abs((stats[i] - stats[j])/stats[i]) of each statistic is less than
+    THRESHOLD. Rather than comparing every pair of points, the points are
+    sorted by the statistic with the narrowest spread of agreeing values,
+    and each point is only compared with the points within its tolerance
+    of that statistic. This takes near-linear time, e.g. a fraction of a
+    second for 20,000 points, unless most points are duplicates.
+
+    A third statistic can be supplied for the points of a target diagram,
+    e.g. bias, centered RMSD and RMSD.
+
     INPUTS:
-    STATS1 : List of first statistical metric, e.g. Standard Deviations
-    STATS2 : List of second statistical metric, e.g. Centered Root Mean Square Difference
+    STATS1    : List of first statistical metric, e.g. Standard Deviations
+    STATS2    : List of second statistical metric, e.g. Centered Root Mean Square Difference
+    THRESHOLD : relative difference below which statistics agree (Default: 0.01)
+    STATS3    : List of optional third statistical metric, e.g. Root Mean Square
+                Difference (Default: None)
 
     OUTPUTS:
     DUPLICATES : List of tuples of paired statistics that are duplicates. The list contains
                  the index locations of the pairs of statistics followed by their values
-                 as 2-tuples.
+                 as 2-tuples, or 3-tuples if STATS3 is supplied. The pairs are ordered
+                 by their index locations.
 
     Author: Peter A. Rochford
         Symplectic, LLC
@@ -22,27 +110,28 @@ def check_duplicate_stats(stats1, stats2, threshold = 0.01):
     if threshold < 1e-7:
         raise ValueError('threshold value must be positive: ' + str(threshold))
 
+    stats = [stats1, stats2] if stats3 is None else [stats1, stats2, stats3]
+
     # Check for non-empty lists
-    if len(stats1) == 0:
-        raise ValueError('Argument stats1 is empty list!')
-    elif len(stats2) == 0:
-        raise ValueError('Argument stats2 is empty list!')
+    for k, values in enumerate(stats):
+        if len(values) == 0:
+            raise ValueError('Argument stats' + str(k + 1) + ' is empty list!')
 
     # Check for matching list lengths
-    if len(stats1) != len(stats2):
-        raise ValueError('Arguments stats1 and stats2 have different list lengths.\n' +
-                   'len(stats1) = ' + str(len(stats1)) + ' != len(stats2) = ' +
-                   str(len(stats2)))
-    
+    for k, values in enumerate(stats[1:], 2):
+        if len(values) != len(stats1):
+            raise ValueError('Arguments stats1 and stats' + str(k) +
+                             ' have different list lengths.\n' +
+                             'len(stats1) = ' + str(len(stats1)) + ' != len(stats' +
+                             str(k) + ') = ' + str(len(values)))
+
     # Search for duplicate pairs of statistics
+    values = [np.asarray(values, dtype = float) for values in stats]
+    first, second = _get_duplicate_indices(values, threshold)
+
     duplicates = []
-    n = len(stats1)
-    for i in range(n):
-        for j in range(i+1,n):
-            diff1 = abs((stats1[i] - stats1[j])/stats1[i])
-            diff2 = abs((stats2[i] - stats2[j])/stats2[i])
-            if diff1 < threshold and diff2 < threshold:
-                duplicates.append( (i, j, (stats1[i], stats2[i]), (stats1[j], stats2[j])) )
- 
-    return duplicates
+    for i, j in zip(first.tolist(), second.tolist()):
+        duplicates.append( (i, j, tuple(values[i] for values in stats),
+                            tuple(values[j] for values in stats)) )
 
+    return duplicates
@@ -1,5 +1,18 @@
 import numpy as np
 
+def _get_taylor_residuals(STDs, CRMSDs, CORs, STDref) -> np.ndarray:
+    '''
+    Return the relative residuals of the Taylor diagram relation for the
+    statistics STDs, CRMSDs and CORs of predicted fields, and the standard
+    deviations STDref of their reference fields:
+
+     abs(CRMSDs^2 - (STDs^2 + STDref^2 - 2*STDs*STDref*CORs))/CRMSDs^2
+    '''
+    diff = np.square(CRMSDs) \
+           - (np.square(STDs) + np.square(STDref) \
+           - 2.0*STDref*np.multiply(STDs,CORs))
+    return np.abs(np.divide(diff,np.square(CRMSDs)))
+
 def check_taylor_stats(STDs, CRMSDs, CORs, threshold = 0.01):
     '''
     Checks input statistics satisfy Taylor diagram relation to <1%.
@@ -32,10 +45,7 @@ def check_taylor_stats(STDs, CRMSDs, CORs, threshold = 0.01):
     if threshold < 1e-7:
         raise ValueError('threshold value must be positive: ' + str(threshold))
 
-    diff = np.square(CRMSDs[1:]) \
-           - (np.square(STDs[1:]) + np.square(STDs[0]) \
-           - 2.0*STDs[0]*np.multiply(STDs[1:],CORs[1:]))
-    diff = np.abs(np.divide(diff,np.square(CRMSDs[1:])))
+    diff = _get_taylor_residuals(STDs[1:], CRMSDs[1:], CORs[1:], STDs[0])
     index = np.where(diff > threshold)
 
     if np.any(index):
@@ -0,0 +1,119 @@
+import numpy as np
+
+from skill_metrics.check_taylor_stats import _get_taylor_residuals
+
+def _get_ragged_sets(offsets, n: int) -> tuple:
+    '''
+    Return the set and the index within the set of each of the N points of
+    sets concatenated at the positions OFFSETS.
+    '''
+    offsets = np.asarray(offsets)
+    if offsets.ndim != 1 or len(offsets) < 2 or not np.issubdtype(offsets.dtype, np.integer):
+        raise ValueError('offsets must be a list of at least 2 integers: ' + str(offsets))
+    if offsets[0] != 0 or offsets[-1] != n:
+        raise ValueError('offsets must start at 0 and end at the number of ' +
+                         'statistics ' + str(n) + ': ' + str(offsets))
+    sizes = np.diff(offsets)
+    if np.any(sizes < 1):
+        raise ValueError('offsets must be strictly increasing: ' + str(offsets))
+
+    sets = np.repeat(np.arange(len(sizes)), sizes)
+    points = np.arange(n) - offsets[sets]
+    return sets, points
+
+def check_taylor_stats_batch(STDs, CRMSDs, CORs, threshold = 0.01, offsets = None) -> dict:
+    '''
+    Checks many sets of statistics satisfy Taylor diagram relation to <1%.
+
+    Validates the statistics of many Taylor diagrams at once, e.g. those of
+    a whole campaign before plotting, in a single vectorized pass. Unlike
+    the CHECK_TAYLOR_STATS function, it does not terminate with an error at
+    the first set that is not satisfied, but returns a report of all the
+    offending points. The threshold applies to the same ratio as in the
+    CHECK_TAYLOR_STATS function:
+
+     abs(CRMSDs^2 - (STDs^2 + STDs(1)^2 - 2*STDs*STDs(1)*CORs))/CRMSDs^2
+
+    where STDs(1) is the standard deviation of the reference field of the
+    set.
+
+    The sets of statistics are supplied either as 2-dimensional arrays with
+    one set per row, or as 1-dimensional arrays of the sets concatenated
+    together with their OFFSETS, so that set k is STDs[offsets[k]:offsets[k+1]].
+    In both cases the first element of each set must contain the value for
+    the reference field. Rows of sets with fewer points can be padded with
+    NaN, which is ignored, as are points whose ratio is not a number, e.g.
+    when the CRMSD and the difference are both zero.
+
+    INPUTS:
+    STDs      : Standard deviations
+    CRMSDs    : Centered Root Mean Square Difference
+    CORs      : Correlation
+    threshold : limit for acceptance, e.g. 0.1 for 10% (default 0.01)
+    offsets   : positions of the first element of each set in 1-dimensional
+                statistics, followed by their length, or None for
+                2-dimensional statistics (default None)
+
+    OUTPUTS:
+    report : dictionary of the results of the check
+    report['valid']    : True for each set satisfying the relation
+    report['nbad']     : number of offending points of each set
+    report['maxdiff']  : largest ratio of each set, NaN for a set with no
+                         predicted field
+    report['set']      : set of each offending point
+    report['index']    : index of each offending point within its set
+    report['diff']     : ratio of each offending point
+    report['threshold']: limit for acceptance
+    '''
+    if threshold < 1e-7:
+        raise ValueError('threshold value must be positive: ' + str(threshold))
+
+    STDs = np.asarray(STDs, dtype = float)
+    CRMSDs = np.asarray(CRMSDs, dtype = float)
+    CORs = np.asarray(CORs, dtype = float)
+    if not STDs.shape == CRMSDs.shape == CORs.shape:
+        raise ValueError('STDs, CRMSDs and CORs have different shapes: ' +
+                         str(STDs.shape) + ', ' + str(CRMSDs.shape) + ', ' +
+                         str(CORs.shape))
+
+    with np.errstate(divide = 'ignore', invalid = 'ignore'):
+        if offsets is None:
+            if STDs.ndim != 2:
+                raise ValueError('Statistics must be 2-dimensional arrays ' +
+                                 'unless offsets are supplied.')
+            nsets = STDs.shape[0]
+            diff = _get_taylor_residuals(STDs[:,1:], CRMSDs[:,1:], CORs[:,1:],
+                                         STDs[:,:1])
+            sets, index = np.nonzero(diff > threshold)
+            index = index + 1
+
+            # Largest ratio of each set, ignoring NaN
+            checked = ~np.isnan(diff)
+            maxdiff = np.max(np.where(checked, diff, -np.inf), axis = 1,
+                             initial = -np.inf)
+            maxdiff[~checked.any(axis = 1)] = np.nan
+            bad = diff[sets, index - 1]
+        else:
+            if STDs.ndim != 1:
+                raise ValueError('Statistics must be 1-dimensional arrays ' +
+                                 'when offsets are supplied.')
+            setof, pointof = _get_ragged_sets(offsets, len(STDs))
+            nsets = len(offsets) - 1
+            predicted = pointof > 0
+            setof, pointof = setof[predicted], pointof[predicted]
+            reference = STDs[np.asarray(offsets[:-1])][setof]
+            diff = _get_taylor_residuals(STDs[predicted], CRMSDs[predicted],
+                                         CORs[predicted], reference)
+            offending = diff > threshold
+            sets, index = setof[offending], pointof[offending]
+
+            # Largest ratio of each set, ignoring NaN
+            checked = ~np.isnan(diff)
+            maxdiff = np.full(nsets, -np.inf)
+            np.maximum.at(maxdiff, setof[checked], diff[checked])
+            maxdiff[np.bincount(setof[checked], minlength = nsets) == 0] = np.nan
+            bad = diff[offending]
+
+    nbad = np.bincount(sets, minlength = nsets)
+    return {'valid': nbad == 0, 'nbad': nbad, 'maxdiff': maxdiff,
+            'set': sets, 'index': index, 'diff': bad, 'threshold': threshold}
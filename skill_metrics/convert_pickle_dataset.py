@@ -0,0 +1,91 @@
+import os
+import pickle
+
+from skill_metrics.write_dataset import write_dataset
+
+# Classes and functions used to unpickle the data of the examples by
+# module, including their Python 2 names, and the encoding of bytes by
+# Python 3 with protocols 0 to 2
+_SAFE_NAMES = {'numpy': {'ndarray', 'dtype'},
+               'numpy.core.multiarray': {'_reconstruct', 'scalar'},
+               'numpy._core.multiarray': {'_reconstruct', 'scalar'},
+               'numpy.core.numeric': {'_frombuffer'},
+               'numpy._core.numeric': {'_frombuffer'},
+               'datetime': {'date', 'time', 'datetime', 'timedelta', 'timezone'},
+               'collections': {'OrderedDict'},
+               'copyreg': {'_reconstructor'}, 'copy_reg': {'_reconstructor'},
+               '_codecs': {'encode'},
+               'builtins': {'object', 'list', 'dict', 'tuple', 'set', 'frozenset',
+                            'str', 'bytes', 'bytearray', 'int', 'float',
+                            'complex', 'bool', 'slice'},
+               '__builtin__': {'object', 'list', 'dict', 'tuple', 'set',
+                               'frozenset', 'str', 'unicode', 'bytearray', 'int',
+                               'long', 'float', 'complex', 'bool', 'slice'}}
+
+class _Record(object):
+    '''
+    Object restored in place of an instance of a class defined in a script,
+    e.g. the Container classes of the examples, holding its attributes.
+    '''
+
+    def __setstate__(self, state):
+        if isinstance(state, tuple): state = state[0] or {}
+        self.__dict__.update(state)
+
+class _DatasetUnpickler(pickle.Unpickler):
+    '''
+    Unpickler restoring arrays, dates and built-in types, and any other
+    class or function as a _Record, so that pickles of classes defined in
+    scripts can be read without the scripts and without running arbitrary
+    code.
+    '''
+
+    def find_class(self, module, name):
+        if name in _SAFE_NAMES.get(module, ()):
+            return super().find_class(module, name)
+        return _Record
+
+def convert_pickle_dataset(filename, dirname = None, overwrite = False):
+    '''
+    Convert a pickle file of data to a dataset directory.
+
+    Reads the data of a pickle file FILENAME, e.g. the .pkl and .pkl3 files
+    of the examples holding a Container of dictionaries of observations and
+    predictions, and writes them to the dataset directory DIRNAME with the
+    WRITE_DATASET function, from which they are read with the READ_DATASET
+    function independently of the version of Python. Pickle files written
+    by Python 2 (.pkl) are also read.
+
+    The classes of the objects in the pickle file, such as Container, need
+    not be available: objects of classes other than arrays, dates and
+    built-in types are converted to groups of their attributes. Only those
+    classes are created when reading the file, so that a pickle file cannot
+    run arbitrary code.
+
+    INPUTS:
+    filename  : name of pickle file
+    dirname   : name of dataset directory, or None for the name of the
+                pickle file without its suffix (Default: None)
+    overwrite : boolean flag to overwrite an existing dataset (Default: False)
+
+    OUTPUTS:
+    data : dictionary of the data of the dataset, as read by READ_DATASET
+    '''
+    from skill_metrics.read_dataset import read_dataset
+
+    # Check if file exists
+    if not os.path.isfile(filename):
+        raise ValueError('File does not exist: ' + filename)
+    if dirname is None:
+        dirname = os.path.splitext(filename)[0]
+
+    # Load object from file in pickle format, decoding Python 2 strings
+    with open(filename, 'rb') as file:
+        try:
+            data = _DatasetUnpickler(file, encoding = 'latin1').load()
+        except (TypeError, pickle.UnpicklingError) as error:
+            raise ValueError('Cannot convert pickle file ' + filename + ': ' +
+                             str(error))
+
+    write_dataset(dirname, data, overwrite)
+    return read_dataset(dirname)
@@ -0,0 +1,67 @@
+import matplotlib.axes
+import matplotlib.lines
+
+def _get_arc_scale(ax: matplotlib.axes.Axes, kind: str, option: dict):
+    '''
+    Get the number of pixels per data unit of a diagram of type KIND,
+    'taylor' or 'target', drawn in AX, used to adapt the resolution of the
+    circles to their rendered size. The current size of the axes is used,
+    so the scale is only final when the figure is drawn. Returns None if
+    the axis limits are not set.
+    '''
+    limit = option['axismax']
+    if kind == 'taylor':
+        xspan, yspan = option['numberpanels']*limit, limit
+    else:
+        xspan, yspan = 2*limit, 2*limit
+    if not (xspan > 0 and yspan > 0):
+        return None
+
+    return min(ax.bbox.width/xspan, ax.bbox.height/yspan)
+
+class _ArcLine(matplotlib.lines.Line2D):
+    '''
+    Line of a circle or arc of a diagram whose points are sampled again
+    each time the figure is drawn, at a resolution adapted to the size of
+    the axes in pixels. The size is only known once the layout of the
+    figure (legend, tight_layout) and the resolution it is drawn at (e.g.
+    the dpi of savefig) are final.
+    '''
+
+    def __init__(self, ax: matplotlib.axes.Axes, kind: str, option: dict,
+                 points, **kwargs):
+        self._kind = kind
+        self._option = option
+        self._points = points
+        xy = points(scale = _get_arc_scale(ax, kind, option))
+        if xy is None: xy = points(scale = None)
+        super().__init__(xy[:,0], xy[:,1], **kwargs)
+
+    def draw(self, renderer):
+        xy = self._points(scale = _get_arc_scale(self.axes, self._kind,
+                                                  self._option))
+        if xy is not None and len(xy) != len(self.get_xdata(orig = True)):
+            self.set_data(xy[:,0], xy[:,1])
+        super().draw(renderer)
+
+def _plot_arc(ax: matplotlib.axes.Axes, kind: str, option: dict, points,
+              **kwargs) -> list:
+    '''
+    Plot a circle or arc of a diagram of type KIND, 'taylor' or 'target',
+    in AX with the line properties KWARGS, returning a list of its Line2D
+    handle as done by Axes.plot.
+
+    POINTS is a function returning the (N, 2) array of (x,y) coordinates
+    of the arc for a number of pixels per data unit given as its SCALE
+    argument, or for a SCALE of None at the fixed resolution. If
+    option['arcresolution'] is 'auto' the arc is sampled again at the
+    resolution of the axes each time it is drawn, otherwise it is drawn at
+    the fixed resolution.
+    '''
+    if option['arcresolution'] != 'auto':
+        xy = points(scale = None)
+        return ax.plot(xy[:,0], xy[:,1], **kwargs)
+
+    line = ax.add_line(_ArcLine(ax, kind, option, points, **kwargs))
+    ax.autoscale_view()
+    return [line]
@@ -0,0 +1,20 @@
+from array import array
+import numbers
+import numpy as np
+
+def _ensure_np_array_or_die(v, label: str) -> np.ndarray:
+    '''
+    Check variable is correct data type.
+     
+    v: Value to be ensured
+    label: Python data type
+    '''
+
+    ret_v = v
+    if isinstance(ret_v, array):
+        ret_v = np.array(v)
+    if isinstance(ret_v, numbers.Number):
+        ret_v = np.array(v, ndmin=1)
+    if not isinstance(ret_v, np.ndarray):
+        raise ValueError('Argument {0} is not a numeric array: {1}'.format(label, v))
+    return ret_v
@@ -0,0 +1,529 @@
+from functools import lru_cache
+import math
+import numpy as np
+
+# Tick steps used by the matplotlib AutoLocator
+_TICK_STEPS = np.array([0.1, 0.2, 0.25, 0.5, 1, 1, 2, 2.5, 5, 10, 20])
+
+# Range of number of points on a full circle for adaptive arc resolution
+_MIN_ARC_POINTS = 16
+_MAX_ARC_POINTS = 8192
+
+# Angular step of the circles of a target diagram at fixed resolution
+_TARGET_STEP = 0.01
+
+def _nonsingular(vmin, vmax, expander = 1e-13, tiny = 1e-14):
+    '''
+    Expand the endpoints of a range as needed to avoid singularities, as
+    done by matplotlib.transforms.nonsingular.
+    '''
+    if (not np.isfinite(vmin)) or (not np.isfinite(vmax)):
+        return -expander, expander
+
+    if vmax < vmin: vmin, vmax = vmax, vmin
+    vmin, vmax = float(vmin), float(vmax)
+
+    maxabsvalue = max(abs(vmin), abs(vmax))
+    if maxabsvalue < (1e6 / tiny) * np.finfo(float).tiny:
+        vmin, vmax = -expander, expander
+    elif vmax - vmin <= maxabsvalue * tiny:
+        if vmax == 0 and vmin == 0:
+            vmin, vmax = -expander, expander
+        else:
+            vmin -= expander*abs(vmin)
+            vmax += expander*abs(vmax)
+
+    return vmin, vmax
+
+def nice_ticks(vmin, vmax, nbins = 9) -> np.ndarray:
+    '''
+    Determine tick values for an axis range.
+
+    Returns tick values at "nice" numbers, multiples of 1, 2, 2.5 or 5 times
+    a power of 10, spanning the range VMIN to VMAX with at most NBINS
+    intervals. The values are identical to those given by the matplotlib
+    AutoLocator for an axis with room for NBINS intervals, i.e.
+    matplotlib.ticker.AutoLocator().tick_values(vmin, vmax) for the default
+    of 9.
+
+    INPUTS:
+    vmin  : minimum of axis range
+    vmax  : maximum of axis range
+    nbins : maximum number of intervals between ticks (Default: 9)
+
+    OUTPUTS:
+    ticks : array of tick values, including one value beyond each end of
+            the range where needed to span it
+    '''
+    vmin, vmax = _nonsingular(vmin, vmax)
+
+    # Scale steps to range
+    dv = abs(vmax - vmin)
+    meanv = (vmax + vmin)/2
+    if abs(meanv)/dv < 100:
+        offset = 0
+    else:
+        offset = math.copysign(10**(math.log10(abs(meanv)) // 1), meanv)
+    scale = 10**(math.log10(dv/nbins) // 1)
+
+    _vmin = vmin - offset
+    _vmax = vmax - offset
+    steps = _TICK_STEPS*scale
+
+    # Find index of smallest step larger than raw step
+    large_steps = steps >= (_vmax - _vmin)/nbins
+    if any(large_steps):
+        istep = np.nonzero(large_steps)[0][0]
+    else:
+        istep = len(steps) - 1
+
+    # Work back through smaller steps until one provides enough ticks
+    for step in steps[:istep+1][::-1]:
+        best_vmin = (_vmin // step)*step
+
+        # Allow for loss of precision when there is a large offset
+        if offset != 0:
+            digits = np.log10(abs(offset)/step)
+            tol = min(0.4999, max(1e-10, 10**(digits - 12)))
+        else:
+            tol = 1e-10
+        d, m = divmod(_vmin - best_vmin, step)
+        low = d + 1 if abs(m/step - 1) < tol else d
+        d, m = divmod(_vmax - best_vmin, step)
+        high = d if abs(m/step) < tol else d + 1
+
+        ticks = np.arange(low, high + 1)*step + best_vmin
+        nticks = ((ticks <= _vmax) & (ticks >= _vmin)).sum()
+        if nticks >= 2:
+            break
+
+    return ticks + offset
+
+@lru_cache(maxsize = None)
+def _unit_circle(step: float) -> tuple:
+    '''
+    Return the angles and (x,y) coordinates of points on a unit circle at
+    angle increments STEP. The arrays are cached and read-only.
+    '''
+    theta = np.arange(0, 2*np.pi, step)
+    xunit = np.cos(theta)
+    yunit = np.sin(theta)
+    for array in (theta, xunit, yunit): array.flags.writeable = False
+
+    return theta, xunit, yunit
+
+@lru_cache(maxsize = None)
+def _taylor_unit_circle() -> tuple:
+    '''
+    Return the angles and (x,y) coordinates of the points on a unit circle
+    used for the circles of a Taylor diagram, with points forced to lie on
+    the x/y axes. The arrays are cached and read-only.
+    '''
+    theta, xunit, yunit = _unit_circle(np.pi/150)
+    xunit, yunit = xunit.copy(), yunit.copy()
+
+    # now really force points on x/y axes to lie on them exactly
+    inds = range(0,len(theta),(len(theta)-1) // 4)
+    xunit[inds[1:5:2]] = np.zeros(2)
+    yunit[inds[0:6:2]] = np.zeros(3)
+    for array in (xunit, yunit): array.flags.writeable = False
+
+    return theta, xunit, yunit
+
+def arc_points(radius, tolerance = 0.1) -> int:
+    '''
+    Return the number of points needed to draw a full circle of RADIUS
+    pixels.
+
+    The number of points is chosen so that the straight segments between
+    them deviate from the circle by at most TOLERANCE pixels, and is
+    rounded up to a power of 2 so that only a few unit circles are ever
+    computed (see _closed_unit_circle). A circle of radius 100 pixels is
+    drawn with 128 points and one of radius 2000 pixels with 512 points.
+    '''
+    if not radius > tolerance: return _MIN_ARC_POINTS
+
+    step = 2*math.acos(1 - tolerance/radius)
+    npoints = 2**math.ceil(math.log2(2*math.pi/step))
+
+    return int(min(max(npoints, _MIN_ARC_POINTS), _MAX_ARC_POINTS))
+
+@lru_cache(maxsize = None)
+def _closed_unit_circle(npoints: int) -> tuple:
+    '''
+    Return the angles and (x,y) coordinates of NPOINTS equally spaced points
+    on a unit circle, with the first point repeated at the end to close the
+    circle and points on the x/y axes lying on them exactly. NPOINTS must be
+    a multiple of 4. The arrays are cached and read-only.
+    '''
+    theta = 2*np.pi*np.arange(npoints + 1)/npoints
+    xunit = np.cos(theta)
+    yunit = np.sin(theta)
+
+    quarter = npoints // 4
+    xunit[quarter::2*quarter] = 0.0
+    yunit[0::2*quarter] = 0.0
+    for array in (theta, xunit, yunit): array.flags.writeable = False
+
+    return theta, xunit, yunit
+
+def _arc_unit_circle(radius, scale, fixed) -> tuple:
+    '''
+    Return the unit circle used to draw a circle of RADIUS in data units.
+
+    If SCALE, the number of pixels per data unit, is given the resolution
+    is adapted to the size of the circle in pixels (see ARC_POINTS).
+    Otherwise the unit circle returned by the function FIXED is used.
+    '''
+    if scale is None: return fixed()
+    return _closed_unit_circle(arc_points(abs(radius)*scale))
+
+def circle(radius, step = np.pi/150, scale = None) -> np.ndarray:
+    '''
+    Return the (x,y) coordinates of a circle of RADIUS about the origin as
+    an array of shape (N, 2), with points at angle increments STEP, or at a
+    resolution adapted to the size of the circle for SCALE pixels per data
+    unit if given.
+    '''
+    theta, xunit, yunit = _arc_unit_circle(radius, scale, lambda: _unit_circle(step))
+    return np.column_stack((radius*xunit, radius*yunit))
+
+def taylor_points(STDs, CORs) -> tuple:
+    '''
+    Return the (X,Y) locations of the markers of a Taylor diagram.
+
+    The standard deviations STDs and correlations CORs are expressed in
+    polar coordinates. Note that the first element is the reference series,
+    which is not plotted, so only rho[1:N] and theta[1:N] are returned.
+    '''
+    rho, theta = np.asarray(STDs), np.arccos(CORs)
+    X = np.multiply(rho[1:], np.cos(theta[1:]))
+    Y = np.multiply(rho[1:], np.sin(theta[1:]))
+
+    return X, Y
+
+def taylor_axes(rho, option: dict, xticks = None) -> dict:
+    '''
+    Get axes values for a Taylor diagram.
+
+    Determines the axes information for a Taylor diagram as described for
+    the GET_TAYLOR_DIAGRAM_AXES function from the radial coordinates RHO
+    and the tick values XTICKS of the x-axis. If XTICKS is None, the tick
+    values are determined by the NICE_TICKS function. Also modifies the
+    input variable 'option'.
+    '''
+    axes = {}
+    axes['dx'] = rho[0]
+
+    axes['tc'] = option['colframe']
+    axes['next'] = 'replace' #needed?
+
+    if xticks is None:
+        # make a radial grid
+        if option['axismax'] == 0.0:
+            maxrho = max(abs(rho))
+        else:
+            maxrho = option['axismax']
+        xticks = nice_ticks(-maxrho, maxrho)
+
+    # Determine default number of tick marks
+    xt = xticks
+    ticks = sum(xt >= 0)
+
+    # Check radial limits and ticks
+    axes['rmin'] = 0;
+    if option['axismax'] == 0.0:
+        axes['rmax'] = xt[-1]
+        option['axismax'] = axes['rmax']
+    else:
+        axes['rmax'] = option['axismax']
+    rticks = np.amax(ticks-1,axis=0)
+    if rticks > 5: # see if we can reduce the number
+        if rticks % 2 == 0:
+            rticks = rticks/2
+        elif rticks % 3 == 0:
+            rticks = rticks/3
+    axes['rinc']  = (axes['rmax'] - axes['rmin'])/rticks
+    tick  = np.arange(axes['rmin'] + axes['rinc'],
+                      axes['rmax'] + axes['rinc'],
+                      axes['rinc'])
+
+    if len(option['tickrms']) == 0:
+        option['tickrms'] = tick
+        option['rincrms'] = axes['rinc']
+    if len(option['tickstd']) == 0:
+        option['tickstd'] = tick
+        option['rincstd'] = axes['rinc']
+
+    return axes
+
+def taylor_rms_arc(axes: dict, radius, scale = None):
+    '''
+    Return the (N, 2) array of (x,y) coordinates of the arc of the RMS
+    contour of RADIUS of a Taylor diagram, a circle about the observation
+    point clipped to the outer boundary of the diagram, or None if the
+    contour lies outside the diagram. The arc is drawn at a resolution
+    adapted to its size for SCALE pixels per data unit if given.
+    '''
+    th, xunit, yunit = _arc_unit_circle(radius, scale, _taylor_unit_circle)
+    rho = np.sqrt(axes['dx']**2+axes['rmax']**2 -
+                  2*axes['dx']*axes['rmax']*xunit)
+    phi = th[np.where(rho >= radius)]
+    if len(phi) == 0: return None
+
+    phi = phi[0]
+    ig = np.where(radius*np.cos(th)+axes['dx'] <= axes['rmax']*np.cos(phi))
+    arc = np.column_stack((xunit[ig]*radius+axes['dx'], yunit[ig]*radius))
+    if scale is not None:
+        # end arc exactly on the outer boundary of the diagram
+        cosphi = ((axes['dx']**2 + axes['rmax']**2 - radius**2)/
+                  (2*axes['dx']*axes['rmax'])) if axes['dx'] != 0 else 1.0
+        if abs(cosphi) < 1:
+            end = axes['rmax']*np.array([cosphi, np.sqrt(1 - cosphi**2)])
+            arc = np.vstack((end, arc, end*[1, -1]))
+    return arc
+
+def taylor_std_arc(radius, scale = None) -> np.ndarray:
+    '''
+    Return the (N, 2) array of (x,y) coordinates of the circle of RADIUS
+    about the origin of a Taylor diagram, drawn at a resolution adapted to
+    its size for SCALE pixels per data unit if given.
+    '''
+    th, xunit, yunit = _arc_unit_circle(radius, scale, _taylor_unit_circle)
+    return np.column_stack((xunit*radius, yunit*radius))
+
+def taylor_rms_arcs(axes: dict, option: dict, scale = None) -> dict:
+    '''
+    Return the arcs and tick labels of the RMS contours of a Taylor diagram.
+
+    The contours are circles about the observation point clipped to the
+    outer boundary of the diagram. They are drawn at a resolution adapted
+    to their size for SCALE pixels per data unit if given.
+
+    OUTPUTS:
+    rms : dictionary containing
+    rms['radius']  : RMS values of the contours drawn
+    rms['arcs']    : list of (N, 2) arrays of (x,y) coordinates of the arcs
+    rms['labelxy'] : (N, 2) array of (x,y) locations of the tick labels
+    rms['labels']  : list of tick label strings
+    rms['angle']   : angle of the tick labels in degrees
+    '''
+    # ANGLE OF THE TICK LABELS
+    if option['tickrmsangle'] > 0:
+        tickRMSAngle = option['tickrmsangle']
+    else:
+        phi = np.arctan2(option['tickstd'][-1],axes['dx'])
+        tickRMSAngle = 180 - np.rad2deg(phi)
+
+    cst = np.cos(tickRMSAngle*np.pi/180)
+    snt = np.sin(tickRMSAngle*np.pi/180)
+
+    # Define label format
+    labelFormat = '{' + option['rmslabelformat'] + '}'
+
+    rms = {'radius': [], 'arcs': [], 'labelxy': [], 'labels': [],
+           'angle': tickRMSAngle}
+    for iradius in option['tickrms']:
+        arc = taylor_rms_arc(axes, iradius, scale)
+        if arc is None: continue
+        rms['radius'].append(iradius)
+        rms['arcs'].append(arc)
+
+        rt =(iradius+option['rincrms']/20)
+        if option['tickrmsangle'] > 90:
+            xtextpos = (rt + abs(cst)*axes['rinc']/5)*cst + axes['dx']
+            ytextpos = (rt + abs(cst)*axes['rinc']/5)*snt
+        else:
+            xtextpos = rt*cst + axes['dx']
+            ytextpos = rt*snt
+        rms['labelxy'].append((xtextpos, ytextpos))
+        rms['labels'].append(labelFormat.format(iradius))
+    rms['labelxy'] = np.reshape(np.array(rms['labelxy'], dtype = float), (-1, 2))
+
+    return rms
+
+def taylor_std_arcs(option: dict, scale = None) -> dict:
+    '''
+    Return the circles of the standard deviation contours of a Taylor
+    diagram, drawn at a resolution adapted to their size for SCALE pixels
+    per data unit if given.
+
+    OUTPUTS:
+    std : dictionary containing
+    std['radius']   : standard deviations of the contours drawn
+    std['arcs']     : list of (N, 2) arrays of (x,y) coordinates of the
+                      circles about the origin
+    std['boundary'] : (N, 2) array of (x,y) coordinates of the circle for
+                      the outer boundary of the diagram
+    '''
+    std = {'radius': list(option['tickstd']),
+           'arcs': [taylor_std_arc(i, scale) for i in option['tickstd']],
+           'boundary': taylor_std_arc(option['axismax'], scale)}
+
+    return std
+
+def taylor_cor_rays(axes: dict, option: dict) -> dict:
+    '''
+    Return the rays and tick labels of the correlation coefficients of a
+    Taylor diagram.
+
+    OUTPUTS:
+    cor : dictionary containing
+    cor['segments'] : (N, 2, 2) array of end points [(0,0), (x,y)] of the
+                      lines emanating from the origin
+    cor['labelxy']  : (M, 2) array of (x,y) locations of the tick labels
+    cor['labels']   : list of tick label strings
+    '''
+    # Get common information
+    corr = option['tickcor'][option['numberpanels']-1]
+    th  = np.arccos(corr)
+    cst, snt = np.cos(th), np.sin(th)
+
+    # Lines emanating from the origin
+    cs = np.append(-1.0*cst, cst)
+    sn = np.append(-1.0*snt, snt)
+    segments = np.zeros((len(cs), 2, 2))
+    segments[:,1,0] = axes['rmax']*cs
+    segments[:,1,1] = axes['rmax']*sn
+
+    # Label locations
+    rt = 1.05 * axes['rmax']
+    if option['numberpanels'] == 2:
+        x = (1.05+np.abs(cst)/30)*axes['rmax']*cst
+    else:
+        x = rt*cst
+    y = rt*snt
+
+    cor = {'segments': segments, 'labelxy': np.column_stack((x, y)),
+           'labels': [str(round(cc, 2)) for cc in corr]}
+
+    return cor
+
+def target_circles(option: dict, scale = None) -> dict:
+    '''
+    Return the circles of a target diagram, drawn at a resolution adapted
+    to their size for SCALE pixels per data unit if given.
+
+    OUTPUTS:
+    circles : dictionary containing
+    circles['reference']   : (N, 2) array of (x,y) coordinates of the unit
+                             reference circle of a normalized diagram, or None
+    circles['radius']      : radii of the circles drawn to indicate isopleths
+                             of standard deviation
+    circles['arcs']        : list of (N, 2) arrays of (x,y) coordinates of
+                             these circles
+    circles['uncertainty'] : (N, 2) array of (x,y) coordinates of the
+                             observational uncertainty threshold, or None
+    '''
+    step = _TARGET_STEP
+
+    # 1 - reference circle if normalized
+    circles = {'reference': None, 'uncertainty': None}
+    if option['normalized'] == 'on':
+        circles['reference'] = circle(1.0, step, scale)
+
+    # Set range for target circles
+    if option['normalized'] == 'on':
+        radius = [.5, 1]
+    else:
+        if option['circles'] is None:
+            radius = [option['axismax'] * x for x in [.7, 1]]
+        else:
+            radius = np.asarray(option['circles'])
+            index = np.where(radius <= option['axismax'])
+            radius = [option['circles'][i] for i in index[0]]
+
+    # 2 - secondary circles
+    circles['radius'] = radius
+    circles['arcs'] = [circle(c, step, scale) for c in radius]
+
+    # 3 - Observational Uncertainty threshold
+    if option['obsuncertainty'] > 0:
+        circles['uncertainty'] = circle(option['obsuncertainty'], step, scale)
+
+    return circles
+
+def get_taylor_diagram_geometry(STDs, CORs, option: dict, axes: dict = None,
+                                scale = None) -> dict:
+    '''
+    Compute the geometry of a Taylor diagram without drawing it.
+
+    Returns the coordinates of all the primitives drawn on a Taylor diagram
+    as NumPy arrays, without using matplotlib.
+
+    INPUTS:
+    STDs   : standard deviations, as for the TAYLOR_DIAGRAM function
+    CORs   : correlations, as for the TAYLOR_DIAGRAM function
+    option : dictionary containing option values as returned by the
+             GET_TAYLOR_DIAGRAM_OPTIONS function. It is modified with the
+             tick values and axis limit determined for the diagram.
+    axes   : dictionary containing axes information as returned by the
+             GET_TAYLOR_DIAGRAM_AXES function (Default: None, determined
+             using NICE_TICKS for the radial axis)
+    scale  : number of pixels per data unit of the rendered diagram, used
+             to adapt the resolution of the circles to their size (see
+             ARC_POINTS) (Default: None, a fixed resolution)
+
+    OUTPUTS:
+    geometry : dictionary containing
+    geometry['axes']   : axes information for the diagram
+    geometry['points'] : (N, 2) array of (x,y) locations of the markers
+    geometry['rms']    : RMS contours (see TAYLOR_RMS_ARCS)
+    geometry['std']    : standard deviation contours (see TAYLOR_STD_ARCS)
+    geometry['cor']    : correlation rays (see TAYLOR_COR_RAYS)
+    geometry['obs']    : (N, 2) array of (x,y) coordinates of the circle
+                         through the observation point
+
+    EXAMPLE:
+    option = sm.get_taylor_diagram_options(ccoef)
+    geometry = sm.get_taylor_diagram_geometry(sdev, ccoef, option)
+    '''
+    STDs = np.asarray(STDs)
+    if axes is None: axes = taylor_axes(STDs, option)
+
+    geometry = {'axes': axes}
+    geometry['points'] = np.column_stack(taylor_points(STDs, CORs))
+    geometry['rms'] = taylor_rms_arcs(axes, option, scale)
+    geometry['std'] = taylor_std_arcs(option, scale)
+    geometry['cor'] = taylor_cor_rays(axes, option)
+    geometry['obs'] = circle(STDs[0], scale = scale)
+
+    return geometry
+
+def get_target_diagram_geometry(Bs, RMSDs, option: dict, axes: dict = None,
+                                scale = None) -> dict:
+    '''
+    Compute the geometry of a target diagram without drawing it.
+
+    Returns the coordinates of all the primitives drawn on a target diagram
+    as NumPy arrays, without using matplotlib.
+
+    INPUTS:
+    Bs     : bias, as for the TARGET_DIAGRAM function
+    RMSDs  : unbiased RMS difference, as for the TARGET_DIAGRAM function
+    option : dictionary containing option values as returned by the
+             GET_TARGET_DIAGRAM_OPTIONS function. It is modified with the
+             tick values and axis limit determined for the diagram.
+    axes   : dictionary containing axes information as returned by the
+             GET_TARGET_DIAGRAM_AXES function (Default: None, determined
+             by that function)
+    scale  : number of pixels per data unit of the rendered diagram, used
+             to adapt the resolution of the circles to their size (see
+             ARC_POINTS) (Default: None, a fixed resolution)
+
+    OUTPUTS:
+    geometry : dictionary containing
+    geometry['axes']    : axes information for the diagram, including the
+                          tick values and labels
+    geometry['points']  : (N, 2) array of (x,y) locations of the markers
+    geometry['circles'] : circles of the diagram (see TARGET_CIRCLES)
+    '''
+    from skill_metrics.get_target_diagram_axes import get_target_diagram_axes
+
+    if axes is None: axes = get_target_diagram_axes(RMSDs, Bs, option)
+
+    geometry = {'axes': axes}
+    geometry['points'] = np.column_stack((RMSDs, Bs))
+    geometry['circles'] = target_circles(option, scale)
+
+    return geometry
@@ -0,0 +1,208 @@
+import numpy as np
+
+from skill_metrics.diagram_geometry import taylor_points
+from skill_metrics.plot_pattern_diagram_colorbar import _setColorBarTicks
+from skill_metrics.plot_pattern_diagram_density import _get_density
+
+class DiagramHandle(object):
+    '''
+    Handle to the artists of a Taylor or target diagram.
+
+    Returned by the TAYLOR_DIAGRAM and TARGET_DIAGRAM functions, it holds
+    the artists created for the diagram together with the axes geometry
+    and options used to draw it. The data points can be moved to new
+    statistics with the UPDATE_POINTS method, which only changes the
+    positions and colors of the existing markers instead of redrawing the
+    whole diagram, e.g. for a new forecast cycle or an animation frame:
+
+    h = sm.taylor_diagram(ax, sdev, crmsd, ccoef)
+    for sdev, crmsd, ccoef in cycles:
+        h.update_points(sdev, crmsd, ccoef)
+        fig.canvas.draw_idle()
+
+    The axes, grid, observation point and legend are not redrawn, so
+    markers moved outside the axis limits of the diagram are hidden.
+
+    ATTRIBUTES:
+    ax       : matplotlib.axes.Axes containing the diagram
+    kind     : type of diagram, 'taylor' or 'target'
+    axes     : dictionary of axes geometry as returned by the
+               GET_TAYLOR_DIAGRAM_AXES or GET_TARGET_DIAGRAM_AXES function
+    options  : dictionary of option values used to draw the diagram
+    grid     : list of artists of the axes, grid and circles of the diagram
+    markers  : list of Line2D handles, one for each marker, when
+               MarkerDisplayed == 'marker'
+    labels   : list of Text handles of the marker labels, one for each
+               marker, or None where a marker is not labeled
+    scatter  : PathCollection handle of the markers when
+               MarkerDisplayed == 'colorbar', otherwise None
+    mesh     : QuadMesh handle of the density of points when
+               MarkerDisplayed == 'density', otherwise None
+    colorbar : Colorbar handle, or None
+    legend   : Legend handle, or None
+    '''
+
+    def __init__(self, ax, kind: str, axes: dict, options: dict, grid: list,
+                 markers: list = None, labels: list = None, scatter = None,
+                 colorbar = None, mesh = None):
+        self.ax = ax
+        self.kind = kind
+        self.axes = axes
+        self.options = options
+        self.grid = grid
+        self.markers = [] if markers is None else markers
+        self.labels = [None]*len(self.markers) if labels is None else labels
+        self.scatter = scatter
+        self.colorbar = colorbar
+        self.mesh = mesh
+        self.legend = ax.get_legend()
+
+    def _get_points(self, *args):
+        '''
+        Get the (X,Y) locations of the markers and the values used for
+        color shading from the statistics supplied to UPDATE_POINTS.
+        '''
+        if len(args) != 3:
+            raise ValueError('Must supply 3 arguments.')
+        args = [np.atleast_1d(np.asarray(arg, dtype = float)) for arg in args]
+
+        if self.kind == 'taylor':
+            # Note that only rho[1:N] and theta[1:N] are plotted.
+            STDs, RMSs, CORs = args
+            X, Y = taylor_points(STDs, CORs)
+            Z = RMSs[1:]
+        else:
+            Bs, RMSDs, RMSDz = args
+            X, Y, Z = RMSDs, Bs, RMSDz
+
+        return X, Y, Z
+
+    def get_points(self) -> tuple:
+        '''
+        Return the X and Y coordinates of the markers in the diagram as
+        arrays, including any hidden markers outside the axis limits.
+        '''
+        if self.mesh is not None:
+            raise ValueError('Points are not available for a density diagram.')
+        elif self.scatter is None:
+            X = np.array([line.get_xdata()[0] for line in self.markers], dtype = float)
+            Y = np.array([line.get_ydata()[0] for line in self.markers], dtype = float)
+        else:
+            offsets = np.asarray(self.scatter.get_offsets(), dtype = float)
+            X, Y = offsets[:,0], offsets[:,1]
+
+        return X, Y
+
+    def update_points(self, *args, cmapzdata = None) -> list:
+        '''
+        Move the markers of the diagram to new statistics.
+
+        h.update_points(STDs,RMSs,CORs)    for a Taylor diagram
+        h.update_points(Bs,RMSDs,RMSDz)    for a target diagram
+
+        The arguments are the same as those of the TAYLOR_DIAGRAM or
+        TARGET_DIAGRAM function and must contain the same number of points
+        as the diagram, except for a density diagram where the histogram is
+        recounted for any number of points. Only the positions, visibility
+        and colors of the existing artists are changed. The labels of the
+        markers keep their offsets and alignments relative to their markers,
+        including those chosen when option['markerlabelplacement'] is 'auto'.
+
+        INPUTS:
+        args      : statistics as described for the TAYLOR_DIAGRAM or
+                    TARGET_DIAGRAM function
+        cmapzdata : data values to use for color mapping of markers when
+                    MarkerDisplayed == 'colorbar'. (Default: None, the RMSs
+                    or RMSDz values, unless 'cmapzdata' was supplied as an
+                    option in which case the colors are not changed)
+
+        OUTPUTS:
+        artists : list of artists changed, e.g. for use with blitting
+        '''
+        X, Y, Z = self._get_points(*args)
+
+        if self.mesh is not None:
+            # Recount points in histogram bins
+            counts = _get_density(self.kind, X, Y, self.options)[2]
+            self._update_colors(self.mesh, counts, counts.compressed())
+
+            artists = [self.mesh]
+            if self.colorbar is not None: artists.append(self.colorbar.ax)
+            return artists
+        elif self.scatter is None:
+            npoints = len(self.markers)
+        else:
+            npoints = len(self.scatter.get_offsets())
+        if len(X) != npoints or len(Y) != npoints:
+            raise ValueError('Number of points does not match diagram: ' +
+                             str(len(X)) + ' != ' + str(npoints))
+
+        artists = []
+        if self.scatter is None:
+            # Move individual markers and their labels
+            limit = self.options['axismax']
+            for i, line in enumerate(self.markers):
+                inrange = abs(X[i]) <= limit and abs(Y[i]) <= limit
+                label = self.labels[i]
+                if label is not None:
+                    # Keep offset of label from its marker, e.g. as placed
+                    # by PLACE_MARKER_LABELS
+                    xlabel, ylabel = label.get_position()
+                    xoffset = line.get_xdata()[0] - xlabel
+                    yoffset = line.get_ydata()[0] - ylabel
+                    label.set_position((X[i] - xoffset, Y[i] - yoffset))
+                    label.set_visible(inrange)
+                    artists.append(label)
+
+                line.set_data([X[i]], [Y[i]])
+                line.set_visible(inrange)
+                artists.append(line)
+        else:
+            # Move markers of scatter plot and update their colors
+            self.scatter.set_offsets(np.column_stack((X, Y)))
+            artists.append(self.scatter)
+
+            if self.scatter.get_array() is None:
+                # Markers of a preview are not color shaded
+                Z = None
+            elif cmapzdata is not None:
+                Z = np.asarray(cmapzdata, dtype = float)
+                if self.kind == 'taylor': Z = Z[1:]
+            elif len(self.options['cmapzdata']) > 0:
+                Z = None
+
+            if Z is not None:
+                self._update_colors(self.scatter, Z, Z)
+                if self.colorbar is not None: artists.append(self.colorbar.ax)
+
+        return artists
+
+    def _update_colors(self, mappable, A, Z) -> None:
+        '''
+        Update the color shading of the scatter plot markers or density
+        mesh MAPPABLE to the values A, and the color bar for the range of
+        values Z.
+        '''
+        mappable.set_array(A)
+        if self.options['colormap'] == 'off':
+            # map color shading of markers to min to max range of Z values
+            if len(Z) > 1:
+                mappable.set_clim(min(Z), max(Z))
+                if self.colorbar is not None:
+                    self.colorbar.set_ticks([min(Z), max(Z)])
+                    self.colorbar.set_ticklabels(['Min.', 'Max.'])
+        else:
+            # map color shading of markers to colormap
+            norm = mappable.norm
+            norm.vmin = self.options['cmap_vmin']
+            norm.vmax = self.options['cmap_vmax']
+            mappable.autoscale_None()
+
+            # Limit number of ticks on color bar to reasonable number
+            if self.colorbar is not None and self.colorbar.orientation == 'horizontal':
+                _setColorBarTicks(self.colorbar,5,20)
+
+        if self.colorbar is not None:
+            # Restore tick and label positions reset by the color bar update
+            self.colorbar.ax.xaxis.set_ticks_position('top')
+            self.colorbar.ax.xaxis.set_label_position('top')
@@ -0,0 +1,300 @@
+import json
+import math
+import numbers
+
+import numpy as np
+
+from skill_metrics.check_taylor_stats import check_taylor_stats
+from skill_metrics.diagram_arguments import _ensure_np_array_or_die
+from skill_metrics.diagram_geometry import get_target_diagram_geometry
+from skill_metrics.diagram_geometry import get_taylor_diagram_geometry
+from skill_metrics.diagram_markers import _get_markers, _parse_format
+from skill_metrics.diagram_svg import _color
+from skill_metrics.get_from_dict_or_default import get_from_dict_or_default
+from skill_metrics.get_target_diagram_options import get_target_diagram_options
+from skill_metrics.get_taylor_diagram_options import get_taylor_diagram_options
+
+# Version of the layout of the JSON document
+_SPEC_VERSION = 1
+
+# Number of significant digits of coordinates relative to the axis limit
+_DIGITS = 5
+
+def _hex(color, alpha = None):
+    '''
+    Convert a matplotlib color to a CSS color string, '#rrggbb' or
+    '#rrggbbaa' if partly transparent.
+    '''
+    value, opacity = _color(color, alpha)
+    if value.startswith('#') and opacity < 1.0:
+        value += '%02x' % int(round(255*opacity))
+    return value
+
+def _to_json(value, decimals: int):
+    '''
+    Convert a value to a type that can be written as JSON, rounding floating
+    point numbers to DECIMALS decimal places. Values that are not finite are
+    written as null and objects without a JSON equivalent as strings.
+    '''
+    if isinstance(value, dict):
+        return {str(key): _to_json(item, decimals) for key, item in value.items()}
+    elif isinstance(value, (list, tuple, np.ndarray)):
+        return [_to_json(item, decimals) for item in value]
+    elif isinstance(value, (bool, np.bool_)):
+        return bool(value)
+    elif isinstance(value, numbers.Integral):
+        return int(value)
+    elif isinstance(value, numbers.Real):
+        value = float(value)
+        return round(value, decimals) if math.isfinite(value) else None
+    elif value is None or isinstance(value, str):
+        return value
+    else:
+        return str(value)
+
+def _get_decimals(limit: float) -> int:
+    '''
+    Number of decimal places giving _DIGITS significant digits for values up
+    to LIMIT.
+    '''
+    if limit <= 0 or not math.isfinite(limit): return _DIGITS
+    return max(0, _DIGITS - 1 - int(math.floor(math.log10(limit))))
+
+def _get_points(kind: str, X, Y, Z, option: dict) -> dict:
+    '''
+    Return the locations, labels and colors of the data points of a pattern
+    diagram as columns of values, one for each point, together with the
+    legend, color bar or density histogram drawn for them.
+    '''
+    lowcase = option['markerdisplayed'].lower()
+    if lowcase == 'marker':
+        markers, legend = _get_markers(X, Y, option)
+        points = {'x': X, 'y': Y,
+                  'visible': [marker['visible'] for marker in markers],
+                  'label': [marker['label'] for marker in markers],
+                  'symbol': [marker['symbol'] for marker in markers],
+                  'size': [marker['size'] for marker in markers],
+                  'facecolor': [_hex(marker['facecolor'], marker['alpha'])
+                                for marker in markers],
+                  'edgecolor': [_hex(marker['edgecolor']) for marker in markers],
+                  'edgewidth': [marker['edgewidth'] for marker in markers],
+                  'labelcolor': _hex(option['markerlabelcolor'])}
+        points['legend'] = [{'label': entry['label'],
+                             'labelcolor': _hex(entry['labelcolor']),
+                             'symbol': entry['symbol'], 'size': entry['size'],
+                             'facecolor': _hex(entry['facecolor'], entry['alpha']),
+                             'edgecolor': _hex(entry['edgecolor']),
+                             'edgewidth': entry['edgewidth']} for entry in legend]
+    elif lowcase == 'colorbar':
+        from matplotlib import colormaps
+        from matplotlib.colors import Normalize
+
+        # Map values to colors as done by the scatter function
+        Z = np.asarray(Z, dtype = float)
+        if option['colormap'] == 'off' or len(Z) == 0:
+            vmin, vmax = None, None
+        else:
+            vmin, vmax = option['cmap_vmin'], option['cmap_vmax']
+        norm = Normalize(vmin, vmax)
+        norm.autoscale_None(Z)
+        cmap = option['cmap']
+        if isinstance(cmap, str): cmap = colormaps[cmap]
+        limit = option['axismax']
+        points = {'x': X, 'y': Y, 'z': Z,
+                  'visible': (np.abs(X) <= limit) & (np.abs(Y) <= limit),
+                  'symbol': _parse_format(option['cmap_marker'])[0],
+                  'size': option['markersize'],
+                  'facecolor': [_hex(color) for color in cmap(norm(Z))]}
+        points['colorbar'] = {'cmap': cmap.name, 'vmin': norm.vmin, 'vmax': norm.vmax,
+                              'colormap': option['colormap'],
+                              'location': option['locationcolorbar'],
+                              'title': option['titlecolorbar']}
+    elif lowcase == 'density':
+        from skill_metrics.plot_pattern_diagram_density import _get_density
+
+        # Only histogram of points is drawn
+        xedges, yedges, counts = _get_density(kind, X, Y, option)
+        points = {'density': {'xedges': xedges, 'yedges': yedges,
+                              'counts': counts.filled(0).astype(int),
+                              'max': int(counts.max()) if counts.count() > 0 else 0,
+                              'cmap': str(option['cmap']),
+                              'vmin': option['cmap_vmin'], 'vmax': option['cmap_vmax'],
+                              'title': option['titlecolorbar']}}
+    else:
+        raise ValueError('Unrecognized option: ' + option['markerdisplayed'])
+
+    return points
+
+def _dumps(spec: dict, limit: float, indent) -> str:
+    '''
+    Write a diagram specification as compact JSON.
+    '''
+    spec = _to_json(spec, _get_decimals(limit))
+    separators = (',', ':') if indent is None else None
+    return json.dumps(spec, indent = indent, separators = separators,
+                      allow_nan = False)
+
+def taylor_diagram_json(STDs, RMSs, CORs, indent = None, **kwargs) -> str:
+    '''
+    Return the complete specification of a Taylor diagram as JSON.
+
+    Instead of drawing the diagram, computes everything needed to render
+    it and returns it as a compact JSON document, e.g. for rendering and
+    zooming in a web browser. No figure is created. The document is an
+    object with the members:
+
+    type    : 'taylor'
+    version : version of the layout of the document
+    options : option values resolved by the GET_TAYLOR_DIAGRAM_OPTIONS
+              function, with any option supplied overriding the default
+    axes    : axes of the diagram with members 'rmin', 'rmax', 'rinc', 'dx'
+              (observation standard deviation), 'numberpanels', 'tickstd',
+              'tickrms' and 'tickcor' (correlations of the panels drawn)
+    grid    : grid of the diagram in data coordinates with members
+              'std' : circles about the origin of radius 'radius' and the
+                      outer 'boundary' radius
+              'rms' : circles about 'center' of radius 'radius', clipped to
+                      the boundary, with tick labels 'labels' drawn at
+                      'labelxy' rotated by 'angle' - 90 degrees
+              'cor' : lines from the origin to 'ends', with tick labels
+                      'labels' drawn at 'labelxy'
+              'obs' : circle through the observation point of radius
+                      'radius'
+              each with the 'color', 'style' and 'width' of its lines
+    points  : data points as columns of values, one for each point, with
+              members 'x', 'y' and 'visible' (False outside the axis limits)
+              and, depending on option['markerdisplayed'],
+              'marker'   : 'label', 'symbol', 'size', 'facecolor',
+                           'edgecolor', 'edgewidth', 'labelcolor' and
+                           'legend' (list of legend entries)
+              'colorbar' : 'z', 'symbol', 'size', 'facecolor' and
+                           'colorbar' (color scale)
+              'density'  : only 'density', the histogram of the points with
+                           members 'xedges', 'yedges' and 'counts'
+
+    Colors are CSS color strings, line styles are matplotlib line styles,
+    and sizes and widths are in points. Coordinates are rounded to 5
+    significant digits of the axis limit.
+
+    INPUTS:
+    STDs   : Standard deviations, as for the TAYLOR_DIAGRAM function
+    RMSs   : Centered Root Mean Square Difference
+    CORs   : Correlation
+    indent : indentation of the JSON document (Default: None, compact)
+    kwargs : options as described for the TAYLOR_DIAGRAM function
+
+    OUTPUTS:
+    spec : string containing the JSON document
+
+    EXAMPLE:
+    spec = sm.taylor_diagram_json(sdev, crmsd, ccoef, markerLabel = label)
+    '''
+    STDs = _ensure_np_array_or_die(STDs, "STDs")
+    RMSs = _ensure_np_array_or_die(RMSs, "RMSs")
+    CORs = _ensure_np_array_or_die(CORs, "CORs")
+
+    # Get options
+    option = get_taylor_diagram_options(CORs, **kwargs)
+    if option['checkstats'] == 'on':
+        check_taylor_stats(STDs, RMSs, CORs, 0.01)
+
+    geometry = get_taylor_diagram_geometry(STDs, CORs, option)
+    axes = geometry['axes']
+    rms, std, cor = geometry['rms'], geometry['std'], geometry['cor']
+
+    spec = {'type': 'taylor', 'version': _SPEC_VERSION, 'options': option}
+    spec['axes'] = {'rmin': axes['rmin'], 'rmax': axes['rmax'], 'rinc': axes['rinc'],
+                    'dx': axes['dx'], 'numberpanels': option['numberpanels'],
+                    'tickstd': option['tickstd'], 'tickrms': option['tickrms'],
+                    'tickcor': option['tickcor'][option['numberpanels']-1]}
+    spec['grid'] = {
+        'std': {'radius': std['radius'], 'boundary': option['axismax'],
+                'color': _hex(get_from_dict_or_default(option, 'colstd', 'colsstd', 'grid')),
+                'style': option['stylestd'], 'width': option['widthstd']},
+        'rms': {'center': [axes['dx'], 0.0], 'radius': rms['radius'],
+                'labels': rms['labels'], 'labelxy': rms['labelxy'],
+                'angle': rms['angle'], 'color': _hex(option['colrms']),
+                'style': option['stylerms'], 'width': option['widthrms']},
+        'cor': {'ends': cor['segments'][:,1], 'labels': cor['labels'],
+                'labelxy': cor['labelxy'],
+                'color': _hex(get_from_dict_or_default(option, 'colcor', 'colscor', 'grid')),
+                'style': option['stylecor'], 'width': option['widthcor']},
+        'obs': {'radius': axes['dx'], 'color': _hex(option['colobs']),
+                'style': option['styleobs'], 'width': option['widthobs']}}
+
+    X, Y = geometry['points'][:,0], geometry['points'][:,1]
+    if len(option['cmapzdata']) == 0:
+        Z = RMSs[1:]
+    else:
+        Z = option['cmapzdata'][1:]
+    spec['points'] = _get_points('taylor', X, Y, Z, option)
+
+    return _dumps(spec, axes['rmax'], indent)
+
+def target_diagram_json(Bs, RMSDs, RMSDz, indent = None, **kwargs) -> str:
+    '''
+    Return the complete specification of a target diagram as JSON.
+
+    Instead of drawing the diagram, computes everything needed to render
+    it and returns it as a compact JSON document, e.g. for rendering and
+    zooming in a web browser. No figure is created. The document is an
+    object with the members:
+
+    type    : 'target'
+    version : version of the layout of the document
+    options : option values resolved by the GET_TARGET_DIAGRAM_OPTIONS
+              function, with any option supplied overriding the default
+    axes    : axes of the diagram with members 'xtick', 'ytick', 'xlabel',
+              'ylabel', 'xoffset', 'yoffset' and 'axismax'
+    grid    : circles of the diagram about the origin with members
+              'circles'     : circles of radius 'radius' with the 'color',
+                              'style' and 'width' of their lines
+              'reference'   : radius of the reference circle of a
+                              normalized diagram, or null
+              'uncertainty' : radius of the observational uncertainty
+                              circle, or null
+    points  : data points as described for the TAYLOR_DIAGRAM_JSON function
+
+    INPUTS:
+    Bs     : Bias, as for the TARGET_DIAGRAM function
+    RMSDs  : unbiased Root-Mean-Square Difference
+    RMSDz  : total Root-Mean-Square Difference
+    indent : indentation of the JSON document (Default: None, compact)
+    kwargs : options as described for the TARGET_DIAGRAM function
+
+    OUTPUTS:
+    spec : string containing the JSON document
+
+    EXAMPLE:
+    spec = sm.target_diagram_json(bias, crmsd, rmsd, markerLabel = label)
+    '''
+    Bs = _ensure_np_array_or_die(Bs, "Bs")
+    RMSDs = _ensure_np_array_or_die(RMSDs, "RMSDs")
+    RMSDz = _ensure_np_array_or_die(RMSDz, "RMSDz")
+
+    # Get options
+    option = get_target_diagram_options(**kwargs)
+
+    geometry = get_target_diagram_geometry(Bs, RMSDs, option)
+    axes = geometry['axes']
+    circles = geometry['circles']
+
+    spec = {'type': 'target', 'version': _SPEC_VERSION, 'options': option}
+    spec['axes'] = {'xtick': axes['xtick'], 'ytick': axes['ytick'],
+                    'xlabel': axes['xlabel'], 'ylabel': axes['ylabel'],
+                    'xoffset': axes['xoffset'], 'yoffset': axes['yoffset'],
+                    'axismax': option['axismax']}
+    spec['grid'] = {
+        'circles': {'radius': circles['radius'], 'color': _hex(option['circlecolor']),
+                    'style': option['circlestyle'], 'width': option['circlelinewidth']},
+        'reference': 1.0 if circles['reference'] is not None else None,
+        'uncertainty': option['obsuncertainty'] if circles['uncertainty'] is not None
+                       else None}
+
+    if len(option['cmapzdata']) == 0:
+        Z = RMSDz
+    else:
+        Z = option['cmapzdata']
+    spec['points'] = _get_points('target', RMSDs, Bs, Z, option)
+
+    return _dumps(spec, option['axismax'], indent)
@@ -0,0 +1,124 @@
+import re
+
+from skill_metrics.get_default_markers import _get_default_symbols_colors
+from skill_metrics.get_from_dict_or_default import get_from_dict_or_default
+from skill_metrics.get_single_markers import get_single_markers
+
+# Single letter colors and marker symbols of matplotlib format strings
+_COLOR_LETTERS = 'bgrcmykw'
+_MARKER_SYMBOLS = '.,ov^<>1234sp*hH+xXDdP|_'
+
+def _parse_format(fmt: str) -> tuple:
+    '''
+    Split a matplotlib format string, e.g. '+r' or 'ok', into its marker
+    symbol and color.
+    '''
+    symbol, color = None, None
+    for char in re.sub('--|-\\.|-|:', '', fmt):
+        if char in _COLOR_LETTERS:
+            color = char
+        elif char in _MARKER_SYMBOLS:
+            symbol = char
+
+    return symbol, color
+
+def _opaque(color: str) -> str:
+    '''
+    Remove the transparency of a hexadecimal color, e.g. '#ff000080'.
+    '''
+    if color.startswith('#') and len(color) in (5, 9):
+        return color[:-1] if len(color) == 5 else color[:-2]
+    return color
+
+def _get_markers(X, Y, option: dict) -> tuple:
+    '''
+    Determine the markers of a pattern diagram and the entries of its legend
+    as done by the PLOT_PATTERN_DIAGRAM_MARKERS function.
+
+    OUTPUTS:
+    markers : list of dictionaries, one for each point, with keys 'x', 'y',
+              'visible' (False if outside the axis limits), 'symbol', 'size',
+              'facecolor', 'edgecolor', 'edgewidth', 'alpha' (face color
+              transparency, or None if included in the face color) and
+              'label' (text displayed beside the marker, or None)
+    legend  : list of dictionaries, one for each legend entry, with keys
+              'symbol', 'size', 'facecolor', 'edgecolor', 'edgewidth',
+              'alpha', 'label' and 'labelcolor'
+    '''
+    alpha = option['alpha']
+    markerSize = option['markersize']
+    limit = option['axismax']
+
+    numberLabel = len(option['markerlabel'])
+    if numberLabel > 0 and isinstance(option['markerlabel'], list) and \
+        numberLabel < len(X):
+        raise ValueError('Insufficient number of marker labels provided.\n' +
+                         'target: No. labels=' + str(numberLabel) + ' < No. markers=' +
+                         str(len(X)) + '\n' +
+                         'taylor: No. labels=' + str(numberLabel+1) + ' < No. markers=' +
+                         str(len(X)+1))
+
+    markers = []
+    legend = []
+    if option['markerlegend'] == 'on':
+        # Check that marker labels have been provided
+        if option['markerlabel'] == '' and option['markers'] == None:
+            raise ValueError('No marker labels provided.')
+
+        if option['markers'] is None:
+            # Default markers of different color and symbol, with the face
+            # color transparency and opaque edges
+            symbols_colors = _get_default_symbols_colors(X, option)
+            marker = [symbol + color for symbol, color in symbols_colors]
+            markerlabel = option['markerlabel']
+            labelcolor = [option['markerlabelcolor']]*len(X)
+            sizes = [markerSize]*len(X)
+            faces = [color for symbol, color in symbols_colors]
+            edges = [_opaque(color) for color in faces]
+            facealpha = alpha
+        else:
+            # Markers from option['markers']
+            markerlabel, labelcolor, marker, sizes, faces, edges = \
+                get_single_markers(option['markers'])
+            facealpha = None
+
+        for i in range(len(X)):
+            inrange = bool(abs(X[i]) <= limit and abs(Y[i]) <= limit)
+            style = {'symbol': _parse_format(marker[i])[0], 'size': sizes[i],
+                     'facecolor': faces[i], 'edgecolor': edges[i], 'edgewidth': 2,
+                     'alpha': facealpha}
+            markers.append(dict(x = X[i], y = Y[i], visible = inrange, label = None,
+                                **style))
+            if inrange:
+                legend.append(dict(label = markerlabel[i], labelcolor = labelcolor[i],
+                                   **style))
+    else:
+        # Markers as symbols of a single color with accompanying labels
+        edge_color = get_from_dict_or_default(option, 'markercolor', 'markercolors', 'edge')
+        if edge_color is None: edge_color = 'r'
+        face_color = get_from_dict_or_default(option, 'markercolor', 'markercolors', 'face')
+        if face_color is None: face_color = edge_color
+        symbol = _parse_format(option['markersymbol'])[0]
+
+        for i in range(len(X)):
+            inrange = bool(abs(X[i]) <= limit and abs(Y[i]) <= limit)
+            label = None
+            if type(option['markerlabel']) is list: label = option['markerlabel'][i]
+            markers.append({'x': X[i], 'y': Y[i], 'visible': inrange,
+                            'symbol': symbol, 'size': markerSize,
+                            'facecolor': face_color, 'edgecolor': edge_color,
+                            'edgewidth': 1.0, 'alpha': alpha, 'label': label})
+
+        # Legend of labels provided as dictionary
+        if type(option['markerlabel']) is dict:
+            for key, value in option['markerlabel'].items():
+                if isinstance(value, dict):
+                    color, marker = str(value['color']), str(value['marker'])
+                else:
+                    color, marker = str(value), '.'
+                legend.append({'symbol': _parse_format(marker)[0], 'size': markerSize,
+                               'facecolor': edge_color, 'edgecolor': color,
+                               'edgewidth': 1.0, 'alpha': alpha, 'label': key,
+                               'labelcolor': option['markerlabelcolor']})
+
+    return markers, legend
@@ -0,0 +1,149 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from skill_metrics.export_figure import _close_figure
+
+class DiagramPdfWriter(object):
+    '''
+    Write Taylor and target diagrams to a multi-page PDF with bounded memory.
+
+    Each page is drawn, appended to the PDF and released immediately, so the
+    memory used stays constant however many pages are written. Diagrams are
+    drawn in figures attached to an Agg canvas that are reused from page to
+    page, without using pyplot. The writer is used as a context manager:
+
+    with sm.DiagramPdfWriter('atlas.pdf') as pdf:
+        for station in stations:
+            pdf.taylor_diagram(sdev[station], crmsd[station], ccoef[station],
+                               titleOBS = station)
+            pdf.target_diagram(bias[station], crmsd[station], rmsd[station])
+
+    When BACKGROUND is True, each page is written to the PDF on a background
+    thread while the next page is being drawn. At most one page is waiting
+    to be written at any time.
+
+    INPUTS:
+    output     : name of PDF file or writable binary file object
+    dpi        : resolution in dots per inch for any rasterized content
+                 (Default: None, as given by rcParams["savefig.dpi"])
+    figsize    : figure size in inches for diagram pages
+                 (Default: rcParams["figure.figsize"])
+    background : boolean flag to write pages on a background thread
+                 (Default: False)
+    metadata   : dictionary of PDF document information, e.g.
+                 {'Title': 'Station Atlas'} (Default: None)
+
+    METHODS:
+    taylor_diagram(STDs, RMSs, CORs, **kwargs) : add a Taylor diagram page
+    target_diagram(Bs, RMSDs, RMSDz, **kwargs) : add a target diagram page
+    add_diagram(statistics, **kwargs) : add a page for a statistics dictionary
+                                        (see EXPORT_DIAGRAM)
+    add_figure(fig, close = True)     : add a page for an existing figure
+    close()                           : finish writing the PDF
+    '''
+
+    def __init__(self, output, dpi = None, figsize = None, background = False,
+                 metadata = None):
+        from matplotlib.backends.backend_pdf import PdfPages
+
+        self._pdf = PdfPages(output, metadata = metadata)
+        self._kwargs = {} if dpi is None else {'dpi': dpi}
+        self.dpi = dpi
+        self.figsize = figsize
+        self.pages = 0
+
+        # Figures are alternated when writing in the background so that one
+        # can be drawn while the other is written
+        self._figures = [None, None]
+        self._slot = 0
+        self._pending = None
+        self._executor = ThreadPoolExecutor(max_workers = 1) if background else None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _wait(self) -> None:
+        '''
+        Wait for the page being written in the background, if any.
+        '''
+        if self._pending is not None:
+            pending, self._pending = self._pending, None
+            pending.result()
+
+    def _save(self, fig, close: bool) -> None:
+        '''
+        Append a figure to the PDF, closing it afterwards if requested.
+        '''
+        self._pdf.savefig(fig, **self._kwargs)
+        if close: _close_figure(fig)
+
+    def _write(self, fig, close: bool) -> None:
+        '''
+        Write a figure to the PDF, on the background thread if requested.
+        '''
+        self._wait()
+        if self._executor is None:
+            self._save(fig, close)
+        else:
+            self._pending = self._executor.submit(self._save, fig, close)
+        self.pages += 1
+
+    def add_diagram(self, statistics: dict, **kwargs) -> None:
+        '''
+        Add a page with the Taylor or target diagram for a dictionary of
+        statistics, as described for the EXPORT_DIAGRAM function.
+        '''
+        from skill_metrics.render_diagrams import _plot_diagram
+
+        if self._pdf is None:
+            raise ValueError('PDF writer is closed.')
+
+        slot = self._slot
+        self._figures[slot] = _plot_diagram(statistics, kwargs, self._figures[slot],
+                                            self.figsize, self.dpi)
+        self._write(self._figures[slot], close = False)
+        if self._executor is not None: self._slot = 1 - slot
+
+    def taylor_diagram(self, STDs, RMSs, CORs, **kwargs) -> None:
+        '''
+        Add a page with a Taylor diagram. The arguments are the same as those
+        of the TAYLOR_DIAGRAM function.
+        '''
+        self.add_diagram({'sdev': STDs, 'crmsd': RMSs, 'ccoef': CORs}, **kwargs)
+
+    def target_diagram(self, Bs, RMSDs, RMSDz, **kwargs) -> None:
+        '''
+        Add a page with a target diagram. The arguments are the same as those
+        of the TARGET_DIAGRAM function.
+        '''
+        self.add_diagram({'bias': Bs, 'crmsd': RMSDs, 'rmsd': RMSDz}, **kwargs)
+
+    def add_figure(self, fig, close = True) -> None:
+        '''
+        Add a page with an existing figure, closing the figure after it has
+        been written unless CLOSE is False.
+        '''
+        if self._pdf is None:
+            raise ValueError('PDF writer is closed.')
+
+        self._write(fig, close)
+
+    def close(self) -> None:
+        '''
+        Finish writing any pending page and close the PDF.
+        '''
+        if self._pdf is None: return
+
+        try:
+            self._wait()
+        finally:
+            if self._executor is not None:
+                self._executor.shutdown()
+            self._pdf.close()
+            self._pdf = None
+
+            for fig in self._figures:
+                if fig is not None: _close_figure(fig)
+            self._figures = [None, None]
@@ -0,0 +1,712 @@
+from functools import lru_cache
+import math
+import re
+from xml.sax.saxutils import escape, quoteattr
+import zlib
+
+import numpy as np
+
+from skill_metrics.check_taylor_stats import check_taylor_stats
+from skill_metrics.diagram_arguments import _ensure_np_array_or_die
+from skill_metrics.diagram_geometry import get_target_diagram_geometry
+from skill_metrics.diagram_geometry import get_taylor_diagram_geometry
+from skill_metrics.diagram_markers import _get_markers, _parse_format
+from skill_metrics.get_axis_tick_label import get_axis_tick_label
+from skill_metrics.get_from_dict_or_default import get_from_dict_or_default
+from skill_metrics.get_target_diagram_options import get_target_diagram_options
+from skill_metrics.get_taylor_diagram_options import get_taylor_diagram_options
+
+# Default matplotlib font size and line width used for the diagrams
+_FONT_SIZE = 10.0
+_LINE_WIDTH = 1.5
+
+# Length of tick marks and padding of tick labels in points
+_TICK_SIZE = 3.5
+_TICK_PAD = 3.5
+_LABEL_PAD = 4.0
+
+# Single letter and property cycle colors of matplotlib
+_BASE_COLORS = {'b': '#0000ff', 'g': '#008000', 'r': '#ff0000', 'c': '#00bfbf',
+                'm': '#bf00bf', 'y': '#bfbf00', 'k': '#000000', 'w': '#ffffff'}
+_TAB_COLORS = {'blue': '#1f77b4', 'orange': '#ff7f0e', 'green': '#2ca02c',
+               'red': '#d62728', 'purple': '#9467bd', 'brown': '#8c564b',
+               'pink': '#e377c2', 'gray': '#7f7f7f', 'olive': '#bcbd22',
+               'cyan': '#17becf'}
+_CYCLE_COLORS = list(_TAB_COLORS.values())
+
+# Dash patterns of matplotlib line styles in multiples of the line width
+_DASHES = {'-': None, 'solid': None,
+           '--': (3.7, 1.6), 'dashed': (3.7, 1.6),
+           '-.': (6.4, 1.6, 1.0, 1.6), 'dashdot': (6.4, 1.6, 1.0, 1.6),
+           ':': (1.0, 1.65), 'dotted': (1.0, 1.65)}
+
+
+def _color(color, alpha = None) -> tuple:
+    '''
+    Convert a matplotlib color specification to an SVG color and opacity.
+    Color strings are checked, so that only valid colors are written to
+    the SVG document.
+    '''
+    opacity = 1.0
+    if color is None:
+        return 'none', opacity
+    elif isinstance(color, str):
+        spec = color.strip()
+        lower = spec.lower()
+        if spec in _BASE_COLORS:
+            value = _BASE_COLORS[spec]
+        elif re.fullmatch('C[0-9]', spec):
+            value = _CYCLE_COLORS[int(spec[1])]
+        elif lower.startswith('tab:') and lower[4:] in _TAB_COLORS:
+            value = _TAB_COLORS[lower[4:]]
+        elif lower == 'none':
+            return 'none', opacity
+        elif spec.startswith('#'):
+            if not re.fullmatch('#([0-9a-fA-F]{3,4}|[0-9a-fA-F]{6}|[0-9a-fA-F]{8})', spec):
+                raise ValueError('Invalid color: ' + repr(color))
+            if len(spec) in (4, 5):
+                spec = '#' + ''.join(2*c for c in spec[1:])
+            value = spec[0:7].lower()
+            if len(spec) == 9: opacity = int(spec[7:9], 16)/255
+        else:
+            try:
+                gray = float(spec)
+                value = '#' + 3*('%02x' % int(round(255*gray)))
+            except ValueError:
+                # Assume CSS color name, most of which match matplotlib
+                value = lower.replace(' ', '')
+                if not re.fullmatch('[a-z]+', value):
+                    raise ValueError('Invalid color: ' + repr(color))
+    else:
+        rgba = [float(v) for v in color]
+        value = '#%02x%02x%02x' % tuple(int(round(255*v)) for v in rgba[0:3])
+        if len(rgba) == 4: opacity = rgba[3]
+
+    if alpha is not None: opacity = alpha
+
+    return value, opacity
+
+def _paint(attribute: str, color, alpha = None) -> str:
+    '''
+    Return the SVG attributes to fill or stroke with a matplotlib color.
+    '''
+    value, opacity = _color(color, alpha)
+    paint = ' %s=%s' % (attribute, quoteattr(value))
+    if opacity < 1.0 and value != 'none':
+        paint += ' %s-opacity="%.3g"' % (attribute, opacity)
+    return paint
+
+def _polygon(n: int, radius: float, angle: float = 90.0) -> list:
+    '''
+    Return the vertices of a regular polygon with N sides.
+    '''
+    theta = np.deg2rad(angle + 360.0*np.arange(n)/n)
+    return list(zip(radius*np.cos(theta), radius*np.sin(theta)))
+
+@lru_cache(maxsize = None)
+def _marker_path(symbol: str, size: float) -> tuple:
+    '''
+    Return the SVG path of a marker symbol centered on the origin and a
+    flag that is True if the marker is filled, as drawn by matplotlib with
+    marker size SIZE in points.
+    '''
+    if symbol in ('+', '1', '2', '3', '4', '|', '_'):
+        lines = {'+': [((-0.5, 0), (0.5, 0)), ((0, -0.5), (0, 0.5))],
+                 '|': [((0, -0.5), (0, 0.5))], '_': [((-0.5, 0), (0.5, 0))]}
+        segments = lines.get(symbol, lines['+'])
+        filled = False
+    elif symbol == 'x':
+        segments = [((-0.5, -0.5), (0.5, 0.5)), ((-0.5, 0.5), (0.5, -0.5))]
+        filled = False
+    else:
+        r = math.sqrt(0.5)
+        vertices = {'s': [(-0.5, -0.5), (0.5, -0.5), (0.5, 0.5), (-0.5, 0.5)],
+                    'D': [(0, -r), (r, 0), (0, r), (-r, 0)],
+                    'd': [(0, -r), (0.6*r, 0), (0, r), (-0.6*r, 0)],
+                    '^': [(0, 0.5), (-0.5, -0.5), (0.5, -0.5)],
+                    'v': [(0, -0.5), (-0.5, 0.5), (0.5, 0.5)],
+                    '<': [(-0.5, 0), (0.5, -0.5), (0.5, 0.5)],
+                    '>': [(0.5, 0), (-0.5, -0.5), (-0.5, 0.5)],
+                    'p': _polygon(5, 0.5), 'h': _polygon(6, 0.5),
+                    'H': _polygon(6, 0.5, 0.0), 'P': _polygon(4, 0.5, 45.0),
+                    'X': _polygon(4, 0.5)}
+        if symbol == '*':
+            outer = _polygon(5, 0.5)
+            inner = _polygon(5, 0.5*0.381966, 90.0 + 36.0)
+            vertices['*'] = [v for pair in zip(outer, inner) for v in pair]
+        if symbol not in vertices:
+            # Circles are drawn as SVG circle elements
+            return None, True
+        segments = [vertices[symbol]]
+        filled = True
+
+    # Scale to marker size with y-axis pointing down
+    path = ''
+    for segment in segments:
+        points = ['%.2f,%.2f' % (size*x, -size*y) for x, y in segment]
+        path += 'M' + ' L'.join(points) + (' Z' if filled else '') + ' '
+
+    return path.strip(), filled
+
+def _text_width(text: str, size: float) -> float:
+    '''
+    Estimate the width of a text string in points.
+    '''
+    return 0.6*size*max(len(line) for line in str(text).split('\n'))
+
+class _SvgCanvas(object):
+    '''
+    Accumulate SVG elements for a diagram drawn in an axes box of equal
+    aspect ratio that spans the data limits XLIM and YLIM.
+    '''
+
+    def __init__(self, figsize, xlim, ylim, right = 0.9):
+        self.width = 72.0*figsize[0]
+        self.height = 72.0*figsize[1]
+        self.elements = []
+
+        # Fit axes box with equal aspect ratio in subplot area as done by
+        # matplotlib for the default subplot parameters
+        left, bottom, top = 0.125, 0.11, 0.88
+        width = (right - left)*self.width
+        height = (top - bottom)*self.height
+        dx, dy = xlim[1] - xlim[0], ylim[1] - ylim[0]
+        self.scale = min(width/dx, height/dy)
+        self.left = left*self.width + (width - self.scale*dx)/2
+        self.bottom = (1 - bottom)*self.height - (height - self.scale*dy)/2
+        self.right = self.left + self.scale*dx
+        self.top = self.bottom - self.scale*dy
+        self.xlim, self.ylim = xlim, ylim
+
+        box = '%.2f %.2f %.2f %.2f' % (self.left, self.top,
+                                       self.right - self.left, self.bottom - self.top)
+        self.clip = 'clip%08x' % zlib.crc32(box.encode())
+
+    def transform(self, x, y) -> tuple:
+        '''
+        Transform data coordinates to SVG coordinates.
+        '''
+        x = self.left + self.scale*(np.asarray(x, dtype = float) - self.xlim[0])
+        y = self.bottom - self.scale*(np.asarray(y, dtype = float) - self.ylim[0])
+        return x, y
+
+    def line(self, xy, color, width = _LINE_WIDTH, style = '-', clip = True) -> None:
+        '''
+        Draw a line through the (N, 2) array of points XY in data coordinates.
+        '''
+        if style in ('', ' ', 'None', 'none', None): return
+
+        x, y = self.transform(xy[:,0], xy[:,1])
+        points = ' '.join(map('{:.2f},{:.2f}'.format, x, y))
+        element = '<polyline points="%s" fill="none"%s stroke-width="%.3g"' % \
+            (points, _paint('stroke', color), width)
+        dashes = _DASHES.get(style)
+        if dashes is not None:
+            element += ' stroke-dasharray="%s"' % \
+                ','.join('%.2f' % (d*width) for d in dashes)
+        if clip:
+            element += ' clip-path="url(#%s)"' % self.clip
+        self.elements.append(element + '/>')
+
+    def text(self, x, y, text, size = _FONT_SIZE, color = 'k', ha = 'left',
+             va = 'baseline', rotation = 0.0, weight = 'normal', data = True) -> None:
+        '''
+        Draw TEXT at (X,Y) in data coordinates, or in SVG coordinates if DATA
+        is False, with matplotlib alignment and rotation in degrees.
+        '''
+        if data: x, y = self.transform(x, y)
+        lines = str(text).split('\n')
+        spacing = 1.2*size
+
+        # Shift baseline of first line for vertical alignment of text block
+        if va == 'top':
+            shift = 0.78*size
+        elif va == 'bottom':
+            shift = -0.22*size - (len(lines) - 1)*spacing
+        elif va in ('center', 'center_baseline'):
+            shift = 0.35*size - (len(lines) - 1)*spacing/2
+        else:
+            shift = 0.0
+
+        anchor = {'left': 'start', 'center': 'middle', 'right': 'end'}[ha]
+        element = '<text x="%.2f" y="%.2f" font-size="%.3g"%s text-anchor="%s"' % \
+            (x, y + shift, size, _paint('fill', color), anchor)
+        if weight != 'normal':
+            element += ' font-weight=%s' % quoteattr(str(weight))
+        if rotation != 0:
+            element += ' transform="rotate(%.2f %.2f %.2f)"' % (-rotation, x, y)
+        if len(lines) == 1:
+            element += '>' + escape(lines[0])
+        else:
+            element += '>' + ''.join('<tspan x="%.2f" dy="%.2f">%s</tspan>' %
+                                     (x, 0 if i == 0 else spacing, escape(line))
+                                     for i, line in enumerate(lines))
+        self.elements.append(element + '</text>')
+
+    def marker(self, x, y, symbol, size, facecolor, edgecolor, edgewidth = 1.0,
+               alpha = None, data = True) -> None:
+        '''
+        Draw a marker SYMBOL of SIZE in points centered at (X,Y), with face
+        color transparency ALPHA.
+        '''
+        if data: x, y = self.transform(x, y)
+        if symbol == '.':
+            symbol, size = 'o', 0.5*size
+        elif symbol == ',':
+            symbol, size = 's', 1.0
+        path, filled = _marker_path(symbol, float(size))
+
+        fill = _paint('fill', facecolor if filled else None, alpha)
+        stroke = _paint('stroke', edgecolor) + ' stroke-width="%.3g"' % edgewidth
+        if path is None:
+            self.elements.append('<circle cx="%.2f" cy="%.2f" r="%.2f"%s%s/>' %
+                                 (x, y, size/2, fill, stroke))
+        else:
+            self.elements.append('<path d="%s" transform="translate(%.2f %.2f)"%s%s/>' %
+                                 (path, x, y, fill, stroke))
+
+    def tick(self, x, y, dx, dy, color) -> None:
+        '''
+        Draw a tick mark from (X,Y) to (X+DX,Y+DY) in SVG coordinates.
+        '''
+        self.elements.append('<line x1="%.2f" y1="%.2f" x2="%.2f" y2="%.2f"%s '
+                             'stroke-width="0.8"/>' %
+                             (x, y, x + dx, y + dy, _paint('stroke', color)))
+
+    def rect(self, x, y, width, height, facecolor, edgecolor, alpha = None) -> None:
+        '''
+        Draw a rectangle in SVG coordinates.
+        '''
+        self.elements.append('<rect x="%.2f" y="%.2f" width="%.2f" height="%.2f" '
+                             'rx="2"%s%s stroke-width="1"/>' %
+                             (x, y, width, height, _paint('fill', facecolor, alpha),
+                              _paint('stroke', edgecolor, alpha)))
+
+    def tostring(self) -> str:
+        '''
+        Return the SVG document.
+        '''
+        header = ('<svg xmlns="http://www.w3.org/2000/svg" width="%.1fpt" '
+                  'height="%.1fpt" viewBox="0 0 %.1f %.1f">' %
+                  (self.width, self.height, self.width, self.height))
+        clip = ('<defs><clipPath id=%s><rect x="%.2f" y="%.2f" width="%.2f" '
+                'height="%.2f"/></clipPath></defs>' %
+                (quoteattr(self.clip), self.left, self.top,
+                 self.right - self.left, self.bottom - self.top))
+        background = '<rect width="100%" height="100%" fill="#ffffff"/>'
+        body = '<g font-family="DejaVu Sans, Bitstream Vera Sans, Arial, sans-serif">'
+
+        return '\n'.join([header, clip, background, body] + self.elements +
+                         ['</g>', '</svg>', ''])
+
+def _draw_legend(canvas: _SvgCanvas, entries: list, option: dict) -> None:
+    '''
+    Draw a legend of marker ENTRIES, as returned by the _GET_MARKERS
+    function, placed as by the ADD_LEGEND function.
+    '''
+    fontSize = _FONT_SIZE
+    nmarkers = len(entries)
+    if nmarkers == 0: return
+
+    # Determine number of rows and columns and location of legend
+    axwidth = canvas.right - canvas.left
+    axheight = canvas.bottom - canvas.top
+    if nmarkers <= 6 or option['markerlegend'] != 'on' or \
+        type(option['markerlabel']) is dict:
+        nrow, ncol = nmarkers, 1
+        anchor = 'upper right'
+        xfrac, yfrac = 1.2, 1.0
+    else:
+        if option['markerlayout'][1] is None:
+            nrow = option['markerlayout'][0]
+            ncol = int(math.ceil(nmarkers / nrow))
+        else:
+            ncol = option['markerlayout'][1]
+            nrow = int(math.ceil(nmarkers / ncol))
+        anchor = 'lower left'
+        xfrac = 1.2 if 'circlelinespec' in option else 1.1
+        yfrac = 0.25
+
+    # Size legend using matplotlib spacing in units of font size
+    borderpad, labelspacing = 0.4*fontSize, 0.5*fontSize
+    handlelength, handletextpad = 2.0*fontSize, 0.8*fontSize
+    columnspacing = 2.0*fontSize
+    columns = [entries[i*nrow:(i + 1)*nrow] for i in range(ncol)]
+    columns = [column for column in columns if len(column) > 0]
+    widths = [handlelength + handletextpad +
+              max(_text_width(entry['label'], fontSize) for entry in column)
+              for column in columns]
+    rows = max(len(column) for column in columns)
+    width = 2*borderpad + sum(widths) + (len(columns) - 1)*columnspacing
+    height = 2*borderpad + rows*fontSize + (rows - 1)*labelspacing
+
+    xanchor = canvas.left + xfrac*axwidth
+    yanchor = canvas.bottom - yfrac*axheight
+    if anchor == 'upper right':
+        x0 = xanchor - 0.5*fontSize - width
+        y0 = yanchor + 0.5*fontSize
+    else:
+        x0, y0 = xanchor, yanchor - height
+
+    canvas.rect(x0, y0, width, height, 'w', '0.8', 0.8)
+    x = x0 + borderpad
+    for column, colwidth in zip(columns, widths):
+        y = y0 + borderpad + fontSize/2
+        for entry in column:
+            canvas.marker(x + handlelength/2, y, entry['symbol'], entry['size'],
+                          entry['facecolor'], entry['edgecolor'], entry['edgewidth'],
+                          entry['alpha'], data = False)
+            canvas.text(x + handlelength + handletextpad, y, entry['label'], fontSize,
+                        entry['labelcolor'], va = 'center', data = False)
+            y += fontSize + labelspacing
+        x += colwidth + columnspacing
+
+def _draw_markers(canvas: _SvgCanvas, X, Y, option: dict) -> None:
+    '''
+    Draw the markers, their labels and legend of a pattern diagram as done
+    by the PLOT_PATTERN_DIAGRAM_MARKERS function.
+    '''
+    markers, legend = _get_markers(X, Y, option)
+
+    # x-offset for labeling of markers
+    numberpanels = option.get('numberpanels', 2)
+    xoffset = 0.005*option['markersize']*option['axismax']*numberpanels/2
+
+    for marker in markers:
+        if not marker['visible']: continue
+        canvas.marker(marker['x'], marker['y'], marker['symbol'], marker['size'],
+                      marker['facecolor'], marker['edgecolor'], marker['edgewidth'],
+                      marker['alpha'])
+        if marker['label'] is not None:
+            canvas.text(marker['x'] - xoffset, marker['y'], marker['label'],
+                        color = option['markerlabelcolor'], ha = 'right', va = 'bottom')
+
+    _draw_legend(canvas, legend, option)
+
+def _check_marker_displayed(option: dict) -> None:
+    '''
+    Check the markers can be drawn by the SVG renderer.
+    '''
+    if option['markerdisplayed'].lower() != 'marker':
+        raise ValueError("SVG diagrams only support markerdisplayed = 'marker': " +
+                         option['markerdisplayed'])
+
+def taylor_diagram_svg(STDs, RMSs, CORs, figsize = (6.4, 4.8), **kwargs) -> str:
+    '''
+    Render a Taylor diagram as an SVG document without using matplotlib.
+
+    The diagram is written directly as SVG from the geometry computed by
+    the GET_TAYLOR_DIAGRAM_GEOMETRY function, so it takes only a few
+    milliseconds and is suitable for rendering diagrams on request, e.g.
+    in a web service. The axes, grid circles, correlation lines, labels,
+    observation point, markers, marker labels and legend are drawn with
+    the styling options of the TAYLOR_DIAGRAM function, e.g. colRMS,
+    styleSTD, widthCOR, tickRMS, markerLabel and markerLegend. The diagram
+    is drawn with the default matplotlib font size and line width and text
+    is sized approximately, so it does not match a matplotlib rendering
+    pixel for pixel.
+
+    Only markerDisplayed = 'marker' is supported.
+
+    INPUTS:
+    STDs    : Standard deviations, as for the TAYLOR_DIAGRAM function
+    RMSs    : Centered Root Mean Square Difference
+    CORs    : Correlation
+    figsize : width and height of the diagram in inches (Default: (6.4, 4.8))
+    kwargs  : options as described for the TAYLOR_DIAGRAM function
+
+    OUTPUTS:
+    svg : string containing the SVG document
+
+    EXAMPLE:
+    svg = sm.taylor_diagram_svg(sdev, crmsd, ccoef, markerLabel = label)
+    '''
+    STDs = _ensure_np_array_or_die(STDs, "STDs")
+    RMSs = _ensure_np_array_or_die(RMSs, "RMSs")
+    CORs = _ensure_np_array_or_die(CORs, "CORs")
+
+    # Get options
+    option = get_taylor_diagram_options(CORs, **kwargs)
+    if option['checkstats'] == 'on':
+        check_taylor_stats(STDs, RMSs, CORs, 0.01)
+    _check_marker_displayed(option)
+
+    geometry = get_taylor_diagram_geometry(STDs, CORs, option)
+    axes = geometry['axes']
+    rmax = axes['rmax']
+
+    # Shift axes to include a legend of many markers
+    right = 0.9
+    if option['markerlegend'] == 'on' and type(option['markerlabel']) is list and \
+        len(option['markerlabel']) > 6:
+        right = 0.6
+
+    if option['numberpanels'] == 2:
+        canvas = _SvgCanvas(figsize, (-rmax, rmax), (0, rmax), right)
+    else:
+        canvas = _SvgCanvas(figsize, (0, rmax), (0, rmax), right)
+
+    if option['overlay'] == 'off':
+        fontSize = _FONT_SIZE + 2
+
+        # Draw circles about origin
+        rms = geometry['rms']
+        for i, arc in enumerate(rms['arcs']):
+            canvas.line(arc, option['colrms'], option['widthrms'], option['stylerms'])
+            if option['showlabelsrms'] == 'on':
+                x, y = rms['labelxy'][i]
+                canvas.text(x, y, rms['labels'][i], fontSize, option['colrms'],
+                            ha = 'center', va = 'center', rotation = rms['angle'] - 90)
+
+        std = geometry['std']
+        grid_color = get_from_dict_or_default(option, 'colstd', 'colsstd', 'grid')
+        for i, arc in enumerate(std['arcs']):
+            # Make outermost STD circle solid
+            style = '-' if i == len(std['arcs']) - 1 else option['stylestd']
+            canvas.line(arc, grid_color, option['widthstd'], style)
+        canvas.line(std['boundary'], grid_color, option['widthstd'], option['stylestd'])
+
+        # Draw lines emanating from origin
+        cor = geometry['cor']
+        lines_col = get_from_dict_or_default(option, 'colcor', 'colscor', 'grid')
+        for segment in cor['segments']:
+            canvas.line(segment, lines_col, option['widthcor'], option['stylecor'])
+        if option['showlabelscor'] == 'on':
+            ticklabels_col = get_from_dict_or_default(option, 'colcor', 'colscor',
+                                                      'tick_labels')
+            for (x, y), label in zip(cor['labelxy'], cor['labels']):
+                canvas.text(x, y, label, _FONT_SIZE, ticklabels_col, ha = 'center')
+
+        # Draw axes
+        _draw_taylor_axes(canvas, geometry, option)
+
+    # Draw markers
+    X, Y = geometry['points'][:,0], geometry['points'][:,1]
+    _draw_markers(canvas, X, Y, option)
+
+    return canvas.tostring()
+
+def _draw_taylor_axes(canvas: _SvgCanvas, geometry: dict, option: dict) -> None:
+    '''
+    Draw the axes, axis titles and observation point of a Taylor diagram as
+    done by the PLOT_TAYLOR_AXES and PLOT_TAYLOR_OBS functions.
+    '''
+    axes = geometry['axes']
+    rmax = axes['rmax']
+    axlabweight = option['labelweight']
+    fontSize = _FONT_SIZE + 2
+    lineWidth = _LINE_WIDTH
+    labels_color = get_from_dict_or_default(option, 'colstd', 'colsstd', 'tick_labels')
+    ticks_color = get_from_dict_or_default(option, 'colstd', 'colsstd', 'ticks')
+    std_color = get_from_dict_or_default(option, 'colstd', 'colsstd', 'title')
+    cor_color = get_from_dict_or_default(option, 'colcor', 'colscor', 'title')
+
+    def curved_title(lab, pos1, DA, dd, xoffset, color, va, spacing = 0.0):
+        # Write label in a circular arc
+        c = np.fliplr([np.linspace(pos1-DA, pos1+DA, len(lab))])[0]
+        for ii, ith in enumerate(c):
+            x = xoffset + dd*np.cos(ith*np.pi/180) - spacing*ii*dd
+            y = dd*np.sin(ith*np.pi/180)
+            canvas.text(x, y, lab[ii], fontSize, color, ha = 'center', va = va,
+                        rotation = ith - 90, weight = axlabweight)
+
+    def rms_title(acoef, bcoef, va):
+        lab = option['labelrms']
+        pos1 = option['titlermsdangle']; DA = 10
+        if option['tickrms'][0] > 0:
+            dd = acoef*option['tickrms'][0] + bcoef*option['tickrms'][1]
+        else:
+            dd = acoef*option['tickrms'][1] + bcoef*option['tickrms'][2]
+
+        # Adjust spacing of label letters if on too small an arc
+        if dd/rmax < 0.31: DA = 2*DA
+        curved_title(lab, pos1, DA, dd, axes['dx'], option['colrms'], va, 0.01)
+
+    if option['numberpanels'] == 1:
+        # Single panel
+        if option['titlecor'] == 'on':
+            if option['titlecorshape'] == 'curved':
+                curved_title('Correlation Coefficient', 45, 15, 1.1*rmax, 0.0,
+                             cor_color, 'bottom')
+            elif option['titlecorshape'] == 'linear':
+                pos_x_y = 1.13 * rmax * np.cos(45*np.pi/180)
+                canvas.text(pos_x_y, pos_x_y, 'Correlation Coefficient', fontSize,
+                            cor_color, ha = 'center', va = 'center', rotation = -45,
+                            weight = axlabweight)
+            else:
+                raise ValueError("Invalid value for 'titlecorshape': %s" %
+                                 option['titlecorshape'])
+
+        if option['titlerms'] == 'on':
+            if option['labelrmspos'] == 'outside':
+                rms_title(0.8, 0.2, 'top')
+            else:
+                rms_title(0.52, 0.2, 'top')
+
+        ytick = [0.0] + [tick for tick in option['tickstd'] if tick > 0 and tick <= rmax]
+        xtick, xlabel = ytick, [get_axis_tick_label(tick) for tick in ytick]
+
+        # Axes lines and y-axis ticks
+        canvas.line(np.array([[0, 0], [rmax, 0]]), axes['tc'], lineWidth + 2, clip = False)
+        canvas.line(np.array([[0, 0], [0, rmax]]), axes['tc'], lineWidth + 1, clip = False)
+        for tick, label in zip(ytick, xlabel):
+            x, y = canvas.left, canvas.transform(0, tick)[1]
+            canvas.tick(x, y, -_TICK_SIZE, 0, ticks_color)
+            canvas.text(x - _TICK_SIZE - _TICK_PAD, y, label, 0.9*fontSize,
+                        labels_color, ha = 'right', va = 'center', data = False)
+
+        if option['titlestd'] == 'on':
+            width = max([_text_width(label, 0.9*fontSize) for label in xlabel] + [0])
+            x = canvas.left - _TICK_SIZE - _TICK_PAD - width - _LABEL_PAD
+            y = (canvas.top + canvas.bottom)/2
+            canvas.text(x, y, 'Standard Deviation', fontSize, std_color,
+                        ha = 'center', va = 'bottom', rotation = 90,
+                        weight = axlabweight, data = False)
+        xtitle = ''
+    else:
+        # Double panel
+        if option['titlecor'] == 'on':
+            curved_title('Correlation Coefficient', 90, 25, 1.1*rmax, 0.0,
+                         cor_color, 'bottom')
+
+        if option['titlerms'] == 'on':
+            if option['labelrmspos'] == 'outside':
+                rms_title(0.7, 0.3, 'bottom')
+            else:
+                rms_title(0.4, 0.3, 'bottom')
+
+        tickstd = np.asarray(option['tickstd'])
+        if 0 in tickstd:
+            xtick = np.concatenate((-tickstd[1:], tickstd), axis=None)
+        else:
+            xtick = np.concatenate((-tickstd, 0, tickstd), axis=None)
+        xtick = np.sort(xtick)
+        xlabel = ['0' if tick == 0 else get_axis_tick_label(abs(tick)) for tick in xtick]
+
+        canvas.line(np.array([[-rmax, 0], [rmax, 0]]), axes['tc'], lineWidth + 1,
+                    clip = False)
+        canvas.line(np.array([[0, 0], [0, rmax]]), axes['tc'], lineWidth, clip = False)
+        xtitle = 'Standard Deviation' if option['titlestd'] == 'on' else ''
+
+    # x-axis ticks
+    fontTick = 0.9*fontSize if option['numberpanels'] == 1 else _FONT_SIZE
+    for tick, label in zip(xtick, xlabel):
+        if tick < canvas.xlim[0] or tick > canvas.xlim[1]: continue
+        x, y = canvas.transform(tick, 0)[0], canvas.bottom
+        canvas.tick(x, y, 0, _TICK_SIZE, ticks_color)
+        canvas.text(x, y + _TICK_SIZE + _TICK_PAD, label, fontTick, labels_color,
+                    ha = 'center', va = 'top', data = False)
+
+    # Plot marker on axis indicating observation STD
+    obsSTD = axes['dx']
+    if option['markerobs'] != 'none':
+        symbol = _parse_format(option['markerobs'])[0]
+        canvas.marker(obsSTD, 0.001*rmax - axes['rmin'], symbol,
+                      option['markersize'] - 4, option['colobs'], option['colobs'])
+
+    # x-axis title, placed below observation point if given
+    xpos = (canvas.left + canvas.right)/2
+    color, weight = std_color, axlabweight
+    if option['titleobs'] != '':
+        xtitle = option['titleobs']
+        xpos = canvas.transform(obsSTD, 0)[0]
+        color, weight = option['colobs'], 'bold'
+    if xtitle != '':
+        y = canvas.bottom + _TICK_SIZE + _TICK_PAD + 1.2*fontTick + _LABEL_PAD
+        canvas.text(xpos, y, xtitle, fontSize, color, ha = 'center', va = 'top',
+                    weight = weight, data = False)
+
+    if option['styleobs'] != '':
+        canvas.line(geometry['obs'], option['colobs'], option['widthobs'],
+                    option['styleobs'])
+
+def target_diagram_svg(Bs, RMSDs, RMSDz, figsize = (6.4, 4.8), **kwargs) -> str:
+    '''
+    Render a target diagram as an SVG document without using matplotlib.
+
+    The diagram is written directly as SVG from the geometry computed by
+    the GET_TARGET_DIAGRAM_GEOMETRY function, so it takes only a few
+    milliseconds and is suitable for rendering diagrams on request, e.g.
+    in a web service. The axes, circles, markers, marker labels and legend
+    are drawn with the styling options of the TARGET_DIAGRAM function, e.g.
+    circles, circleLineSpec, circleLineWidth, obsUncertainty, ticks,
+    markerLabel and markerLegend. The diagram is drawn with the default
+    matplotlib font size and line width and text is sized approximately,
+    so it does not match a matplotlib rendering pixel for pixel.
+
+    Only markerDisplayed = 'marker' is supported.
+
+    INPUTS:
+    Bs      : Bias, as for the TARGET_DIAGRAM function
+    RMSDs   : unbiased Root-Mean-Square Difference
+    RMSDz   : total Root-Mean-Square Difference
+    figsize : width and height of the diagram in inches (Default: (6.4, 4.8))
+    kwargs  : options as described for the TARGET_DIAGRAM function
+
+    OUTPUTS:
+    svg : string containing the SVG document
+
+    EXAMPLE:
+    svg = sm.target_diagram_svg(bias, crmsd, rmsd, markerLabel = label)
+    '''
+    Bs = _ensure_np_array_or_die(Bs, "Bs")
+    RMSDs = _ensure_np_array_or_die(RMSDs, "RMSDs")
+    RMSDz = _ensure_np_array_or_die(RMSDz, "RMSDz")
+
+    # Get options
+    option = get_target_diagram_options(**kwargs)
+    _check_marker_displayed(option)
+
+    geometry = get_target_diagram_geometry(Bs, RMSDs, option)
+    axes = geometry['axes']
+    xtick, ytick = axes['xtick'], axes['ytick']
+
+    # Shift axes to include a legend of many markers
+    right = 0.9
+    if option['markerlegend'] == 'on' and type(option['markerlabel']) is list and \
+        len(option['markerlabel']) > 6:
+        right = 0.6
+    canvas = _SvgCanvas(figsize, (xtick[0], xtick[-1]), (ytick[0], ytick[-1]), right)
+
+    # Overlay circles
+    circles = geometry['circles']
+    if circles['reference'] is not None:
+        canvas.line(circles['reference'], 'k', option['circlelinewidth'])
+    for arc in circles['arcs']:
+        canvas.line(arc, option['circlecolor'], option['circlelinewidth'],
+                    option['circlestyle'])
+    if circles['uncertainty'] is not None:
+        canvas.line(circles['uncertainty'], 'b', _LINE_WIDTH, '--')
+
+    if option['overlay'] == 'off':
+        # Axes through origin with ticks on inside
+        canvas.line(np.array([[xtick[0], 0], [xtick[-1], 0]]), 'k', _LINE_WIDTH,
+                    clip = False)
+        canvas.line(np.array([[0, ytick[0]], [0, ytick[-1]]]), 'k', _LINE_WIDTH,
+                    clip = False)
+        x0, y0 = canvas.transform(0, 0)
+        for tick, label in zip(xtick, axes['xlabel']):
+            x = canvas.transform(tick, 0)[0]
+            canvas.tick(x, y0, 0, -_TICK_SIZE, 'k')
+            canvas.text(x, y0 + _TICK_PAD, label, _FONT_SIZE, 'k', ha = 'center',
+                        va = 'top', data = False)
+        for tick, label in zip(ytick, axes['ylabel']):
+            y = canvas.transform(0, tick)[1]
+            canvas.tick(x0, y, _TICK_SIZE, 0, 'k')
+            canvas.text(x0 - _TICK_PAD, y, label, _FONT_SIZE, 'k', ha = 'right',
+                        va = 'center', data = False)
+
+        # Label axes
+        xlabel = 'uRMSD'
+        if axes['xoffset'] != 'None': xlabel += '\n(' + axes['xoffset'] + ')'
+        canvas.text(xtick[-1] + 2*xtick[-1]/30, xtick[-1]/30, xlabel, _FONT_SIZE,
+                    'k', ha = 'left', va = 'top')
+        ylabel = 'Bias '
+        if axes['yoffset'] != 'None': ylabel += '(' + axes['yoffset'] + ')'
+        canvas.text(0, ytick[-1] + 2*ytick[-1]/30, ylabel, _FONT_SIZE, 'k',
+                    ha = 'center', va = 'bottom')
+
+    # Draw markers
+    _draw_markers(canvas, RMSDs, Bs, option)
+
+    return canvas.tostring()
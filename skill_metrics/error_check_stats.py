@@ -10,7 +10,8 @@ def error_check_stats(predicted,reference,field=''):
     the name of the field must be supplied in FIELD.
 
     The function currently supports dictionaries, lists, and np.ndarray,
-    types for the PREDICTED and REFERENCE variables.
+    types for the PREDICTED and REFERENCE variables. Arrays of floats,
+    including those in dictionaries, are used without copying them.
 
     Input:
     PREDICTED : predicted field
@@ -39,11 +40,11 @@ def error_check_stats(predicted,reference,field=''):
         if field == '':
             raise ValueError('FIELD argument not supplied.')
         if field in predicted:
-            p = np.array(predicted[field], dtype=float)
+            p = np.asarray(predicted[field], dtype=float)
         else:
             raise ValueError('Field is not in PREDICTED dictionary: ' + field)
     elif isinstance(predicted, list):
-        p = np.array(predicted, dtype=float)
+        p = np.asarray(predicted, dtype=float)
     elif isinstance(predicted, np.ndarray):
         p = predicted
     elif isinstance(predicted, pd.Series):
@@ -55,11 +56,11 @@ def error_check_stats(predicted,reference,field=''):
         if field == '':
             raise ValueError('FIELD argument not supplied.')
         if field in reference:
-            r = np.array(reference[field], dtype=float)
+            r = np.asarray(reference[field], dtype=float)
         else:
             raise ValueError('Field is not in REFERENCE dictionary: ' + field)
     elif isinstance(reference, list):
-        r = np.array(reference, dtype=float)
+        r = np.asarray(reference, dtype=float)
     elif isinstance(reference, np.ndarray):
         r = reference
     elif isinstance(reference, pd.Series):
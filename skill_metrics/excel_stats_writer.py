@@ -0,0 +1,229 @@
+import os
+
+import numpy as np
+import xlsxwriter
+
+# Maximum number of rows of an Excel worksheet
+EXCEL_MAX_ROWS = 1048576
+
+class ExcelStatsWriter(object):
+    '''
+    Write tables of statistics to an Excel file with bounded memory.
+
+    Statistics are supplied as columns, e.g. arrays of standard deviations
+    for many stations, and written row after row in the constant_memory
+    mode of xlsxwriter, where each row is written to disk as soon as the
+    next row is started. The memory used therefore stays constant however
+    many rows are written. Numbers and strings are written with the
+    xlsxwriter methods for their type, without testing the type of each
+    cell, and a NUMBER_FORMAT is applied once to the columns of numbers of
+    each worksheet rather than to each cell.
+
+    When a worksheet is full (MAX_ROWS rows), writing continues on a new
+    worksheet, on which the column headers of the table being written are
+    repeated. The writer is used as a context manager:
+
+    with sm.ExcelStatsWriter('stats.xlsx', overwrite = True) as writer:
+        writer.write_row(['Taylor Statistics'])
+        writer.write_table([station, sdev, crmsd, ccoef],
+                           header = ['Station', 'SDEV', 'CRMSD', 'CCOEF'])
+
+    INPUTS:
+    filename      : name of Excel file
+    overwrite     : boolean flag to overwrite an existing file
+                    (Default: False)
+    max_rows      : maximum number of rows of each worksheet
+                    (Default: EXCEL_MAX_ROWS, the limit of Excel)
+    number_format : Excel number format of the columns of numbers, e.g.
+                    '0.000', or None for the default format (Default: None)
+
+    ATTRIBUTES:
+    row    : index of the next row to write on the current worksheet
+    sheets : number of worksheets
+
+    METHODS:
+    write_row(values)               : write a row of values
+    skip_rows(n)                    : leave N empty rows
+    write_table(columns, header)    : write columns of values row by row
+    close()                         : finish writing the file
+    '''
+
+    def __init__(self, filename, overwrite = False, max_rows = EXCEL_MAX_ROWS,
+                 number_format = None):
+        if not isinstance(max_rows, (int, np.integer)) or \
+           not 2 <= max_rows <= EXCEL_MAX_ROWS:
+            raise ValueError('max_rows must be an integer from 2 to ' +
+                             str(EXCEL_MAX_ROWS) + ': ' + str(max_rows))
+
+        # Check for existence of file
+        if os.path.isfile(filename):
+            if overwrite:
+                os.remove(filename)
+            else:
+                raise ValueError('File already exists: ' + filename)
+
+        self.max_rows = max_rows
+        self._workbook = xlsxwriter.Workbook(filename, {'constant_memory': True})
+        self._format = None if number_format is None else \
+            self._workbook.add_format({'num_format': number_format})
+        self._worksheet = None
+        self._formatted = set()
+        self.row = 0
+        self.sheets = 0
+        self._add_worksheet()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _add_worksheet(self) -> None:
+        self._worksheet = self._workbook.add_worksheet()
+        self._formatted = set()
+        self.row = 0
+        self.sheets += 1
+
+    def _next_row(self, header = None) -> int:
+        '''
+        Return the index of the row to write, starting a new worksheet with
+        the HEADER row when the current worksheet is full.
+        '''
+        if self.row >= self.max_rows:
+            self._add_worksheet()
+            if header is not None: self._write_cells(self._next_row(), header)
+        self.row += 1
+        return self.row - 1
+
+    def _write_cells(self, row: int, values) -> None:
+        for col, value in enumerate(values):
+            if value is not None:
+                self._worksheet.write(row, col, value)
+
+    def _set_number_format(self, cols) -> None:
+        '''
+        Apply the number format to the columns COLS of the current worksheet.
+        '''
+        if self._format is None: return
+        for col in cols:
+            if col not in self._formatted:
+                self._worksheet.set_column(col, col, None, self._format)
+                self._formatted.add(col)
+
+    def write_row(self, values) -> None:
+        '''
+        Write the VALUES, e.g. a title or column headers, on the next row
+        from its first column. Cells with a value of None are left empty.
+        '''
+        if self._workbook is None:
+            raise ValueError('Excel writer is closed.')
+        self._write_cells(self._next_row(), values)
+
+    def skip_rows(self, n = 1) -> None:
+        '''
+        Leave N empty rows, without starting a new worksheet.
+        '''
+        self.row = min(self.row + n, self.max_rows)
+
+    def write_table(self, columns: list, header = None) -> None:
+        '''
+        Write the sequences of values in COLUMNS, all of the same length,
+        row by row from the first column after the HEADER row, if given.
+        A column of None is left empty. The header is repeated on any new
+        worksheet started for the table, on its first row, which is left
+        empty before a new table so that continued tables can be told apart.
+        '''
+        if self._workbook is None:
+            raise ValueError('Excel writer is closed.')
+        if header is not None:
+            row = self._next_row()
+            if row == 0 and self.sheets > 1: row = self._next_row()
+            self._write_cells(row, header)
+
+        # Columns as lists of Python values, with the method to write them
+        nrows = None
+        cells = []
+        for col, values in enumerate(columns):
+            if values is None: continue
+            array = np.asarray(values)
+            if nrows is None: nrows = len(array)
+            if len(array) != nrows:
+                raise ValueError('Columns have different lengths: ' +
+                                 str(nrows) + ' != ' + str(len(array)))
+            number = np.issubdtype(array.dtype, np.number) and \
+                not np.issubdtype(array.dtype, np.complexfloating)
+            cells.append((col, array.tolist() if number else list(values), number))
+        if nrows is None: return
+
+        numbers = [col for col, values, number in cells if number]
+        sheet = None
+        for i in range(nrows):
+            row = self._next_row(header)
+            if sheet != self.sheets:
+                # Bind the methods of the current worksheet
+                sheet = self.sheets
+                self._set_number_format(numbers)
+                write_number = self._worksheet.write_number
+                write = self._worksheet.write
+            for col, values, number in cells:
+                if number:
+                    write_number(row, col, values[i])
+                else:
+                    write(row, col, values[i])
+
+    def close(self) -> None:
+        '''
+        Finish writing the Excel file.
+        '''
+        if self._workbook is None: return
+        workbook, self._workbook = self._workbook, None
+        workbook.close()
+
+def _write_stats_tables(filename, data, title: str, keys: list, headers: list,
+                        option: dict) -> None:
+    '''
+    Write the statistics KEYS of each dictionary in DATA to an Excel file
+    as done by the WRITE_TAYLOR_STATS and WRITE_TARGET_STATS functions: a
+    TITLE, then for each dictionary its title from option['title'], the
+    column HEADERS and a row of statistics for each data point, labeled
+    with option['label'].
+    '''
+    # Covert data to list if necessary
+    if not type(data) is list: data = [data]
+
+    # The overwrite option is True or False, or 'on' or 'off' when supplied
+    overwrite = option['overwrite'] in (True, 'on')
+    with ExcelStatsWriter(filename, overwrite, option['maxrows'],
+                          option['numberformat']) as writer:
+        # Write title information to file
+        writer.skip_rows(1)
+        writer.write_row([title])
+        writer.skip_rows(1)
+
+        # Write data for each dictionary
+        for i in range(len(data)):
+            if len(option['title']) > 0:
+                # Keep the title on the worksheet of the column headers
+                if writer.row == writer.max_rows - 1: writer.skip_rows(1)
+                writer.write_row([option['title'][i]])
+            else:
+                writer.skip_rows(1)
+
+            # Retrieve input values as list
+            try: iter(data[i][keys[0]])
+            except TypeError:
+                columns = [[data[i][key]] for key in keys]
+            else:
+                columns = [data[i][key] for key in keys]
+            ndata = len(columns[0])
+
+            labels = None
+            if len(option['label']) > 0:
+                if len(option['label']) < ndata:
+                    raise ValueError('Fewer labels than data points: ' +
+                                     str(len(option['label'])) + ' < ' + str(ndata))
+                labels = list(option['label'][:ndata])
+
+            # Write column headers and each row of data
+            writer.write_table([labels] + columns, header = headers)
+            writer.skip_rows(1)
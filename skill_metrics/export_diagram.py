@@ -0,0 +1,37 @@
+import io
+
+from skill_metrics.export_figure import export_figure
+
+def export_diagram(statistics: dict, format = 'png', dpi = None, figsize = None,
+                   **kwargs) -> io.BytesIO:
+    '''
+    Export a Taylor or target diagram to an in-memory buffer.
+
+    Draws the diagram for the STATISTICS provided in a new figure that is
+    not managed by pyplot, renders it in the requested graphics FORMAT into
+    a BytesIO buffer and releases the figure. No file is written.
+
+    INPUTS:
+    statistics : dictionary of statistics for the diagram. A Taylor diagram
+                 is drawn for the keys 'sdev', 'crmsd', 'ccoef' (as returned
+                 by TAYLOR_STATISTICS) and a target diagram for the keys
+                 'bias', 'crmsd', 'rmsd' (as returned by TARGET_STATISTICS).
+    format     : graphics format supported by matplotlib savefig, with or 
+                 without a leading period, e.g. 'png', 'svg', or 'pdf' 
+                 (Default: 'png')
+    dpi        : resolution in dots per inch (Default: rcParams["figure.dpi"])
+    figsize    : figure size in inches (Default: rcParams["figure.figsize"])
+    **kwargs   : options for the TAYLOR_DIAGRAM or TARGET_DIAGRAM function
+
+    OUTPUTS:
+    buffer : io.BytesIO positioned at its start containing the graphic
+
+    EXAMPLE:
+    stats = {'sdev': sdev, 'crmsd': crmsd, 'ccoef': ccoef}
+    svg = sm.export_diagram(stats, 'svg', markerLabel = label).getvalue()
+    '''
+    from skill_metrics.render_diagrams import _plot_diagram
+
+    fig = _plot_diagram(statistics, kwargs, figsize = figsize, dpi = dpi)
+
+    return export_figure(fig, format, dpi, close = True)
@@ -0,0 +1,56 @@
+import io
+
+def _close_figure(fig) -> None:
+    '''
+    Release the memory held by a figure.
+
+    The figure is removed from pyplot if it is managed by pyplot, and its
+    artists are cleared so they can be garbage collected even while a
+    reference to the figure remains.
+    '''
+    if getattr(fig.canvas, 'manager', None) is not None:
+        import matplotlib.pyplot as plt
+        plt.close(fig)
+    fig.clear()
+
+def _get_format(format: str) -> str:
+    '''
+    Return graphics file format without leading period in lower case,
+    e.g. 'png' for '.PNG'.
+    '''
+    return format.lstrip('.').lower()
+
+def export_figure(fig, format = 'png', dpi = None, close = True) -> io.BytesIO:
+    '''
+    Export a figure to an in-memory buffer.
+
+    Renders the figure FIG in the requested graphics FORMAT into a BytesIO
+    buffer instead of writing it to a file. By default the figure is closed
+    afterwards to release its memory.
+
+    INPUTS:
+    fig    : matplotlib.figure.Figure to export, e.g. as returned by plt.gcf()
+    format : graphics format supported by matplotlib savefig, with or without
+             a leading period, e.g. 'png', '.svg', or 'pdf' (Default: 'png')
+    dpi    : resolution in dots per inch (Default: None, as given by
+             rcParams["savefig.dpi"])
+    close  : boolean flag to close the figure after export (Default: True)
+
+    OUTPUTS:
+    buffer : io.BytesIO positioned at its start containing the graphic
+
+    EXAMPLE:
+    sm.taylor_diagram(sdev,crmsd,ccoef)
+    png = sm.export_figure(plt.gcf(), 'png', dpi = 150).getvalue()
+    '''
+
+    buffer = io.BytesIO()
+    if dpi is None:
+        fig.savefig(buffer, format = _get_format(format))
+    else:
+        fig.savefig(buffer, format = _get_format(format), dpi = dpi)
+    buffer.seek(0)
+
+    if close: _close_figure(fig)
+
+    return buffer
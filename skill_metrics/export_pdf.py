@@ -0,0 +1,63 @@
+import io
+
+from skill_metrics.diagram_pdf_writer import DiagramPdfWriter
+
+def export_pdf(pages, output = None, dpi = None, figsize = None):
+    '''
+    Export a sequence of figures or diagrams as a multi-page PDF.
+
+    Each page is rendered and written to OUTPUT as soon as it is obtained
+    from PAGES, after which its figure is closed. Because PAGES is consumed 
+    lazily, a generator can be supplied so that only one page is held in 
+    memory at a time, and OUTPUT may be any writable binary stream, e.g. a 
+    web response, to which the document is streamed incrementally.
+
+    Each element of PAGES may be one of:
+      a matplotlib.figure.Figure, which is closed after it is written
+      a dictionary of statistics for a Taylor or target diagram (see the
+        EXPORT_DIAGRAM function)
+      a (statistics, options) tuple where options is a dictionary of options 
+        for the TAYLOR_DIAGRAM or TARGET_DIAGRAM function
+    Diagrams are drawn in a single figure that is reused for every page (see
+    the DiagramPdfWriter class).
+
+    INPUTS:
+    pages   : iterable of pages as described above
+    output  : writable binary file object or name of PDF file (Default: None,
+              a new io.BytesIO buffer)
+    dpi     : resolution in dots per inch for any rasterized content 
+              (Default: None, as given by rcParams["savefig.dpi"])
+    figsize : figure size in inches for diagram pages 
+              (Default: rcParams["figure.figsize"])
+
+    OUTPUTS:
+    output : OUTPUT, or the io.BytesIO buffer positioned at its start when 
+             OUTPUT is None
+
+    EXAMPLE:
+    pages = ((stats[name], {'titleobs': name}) for name in stations)
+    pdf = sm.export_pdf(pages).getvalue()
+    '''
+    from matplotlib.figure import Figure
+
+    buffer = None
+    if output is None:
+        buffer = io.BytesIO()
+        output = buffer
+
+    with DiagramPdfWriter(output, dpi = dpi, figsize = figsize) as pdf:
+        for page in pages:
+            if isinstance(page, Figure):
+                pdf.add_figure(page)
+            elif isinstance(page, dict):
+                pdf.add_diagram(page)
+            else:
+                statistics, options = page
+                if options is None: options = {}
+                pdf.add_diagram(statistics, **options)
+
+    if buffer is not None:
+        buffer.seek(0)
+        return buffer
+
+    return output
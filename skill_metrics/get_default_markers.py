@@ -1,33 +1,10 @@
 import warnings
 from itertools import cycle, islice, product
-import matplotlib.colors as clr
 
-def get_default_markers(X, option: dict) -> tuple[list, list]:
+def _get_default_symbols_colors(X, option: dict) -> list:
     '''
-    Provides a list of default markers and marker colors.
-    
-    Returns a list of 70 marker symbol & color combinations.
-
-    INPUTS:
-    X      : x-coordinates of markers
-    option : dictionary containing option values. (Refer to 
-        GET_TARGET_DIAGRAM_OPTIONS function for more information.)
-    option['markercolor'] : single color to use for all markers
-    option['markerlabel'] : labels for markers
-    
-    OUTPUTS:
-    marker      : list of marker symbols
-    markercolor : list of marker colors
-
-    Authors:
-    Peter A. Rochford
-    rochford.peter1@gmail.com
-    
-    Mattia Almansi
-    m.almansi@bopen.eu
-
-    Created on Mar 12, 2023
-    Revised on Nov 6, 2025
+    Return the list of (symbol, color) pairs of the default markers, with
+    the colors as given, e.g. 'r', as used by GET_DEFAULT_MARKERS.
     '''
 
     # Define list of marker symbols and colors
@@ -70,9 +47,40 @@ def get_default_markers(X, option: dict) -> tuple[list, list]:
                 UserWarning,
             )
 
+    return list(symbols_colors)
+
+def get_default_markers(X, option: dict) -> tuple[list, list]:
+    '''
+    Provides a list of default markers and marker colors.
+    
+    Returns a list of 70 marker symbol & color combinations.
+
+    INPUTS:
+    X      : x-coordinates of markers
+    option : dictionary containing option values. (Refer to 
+        GET_TARGET_DIAGRAM_OPTIONS function for more information.)
+    option['markercolor'] : single color to use for all markers
+    option['markerlabel'] : labels for markers
+    
+    OUTPUTS:
+    marker      : list of marker symbols
+    markercolor : list of marker colors
+
+    Authors:
+    Peter A. Rochford
+    rochford.peter1@gmail.com
+    
+    Mattia Almansi
+    m.almansi@bopen.eu
+
+    Created on Mar 12, 2023
+    Revised on Nov 6, 2025
+    '''
+    import matplotlib.colors as clr
+
     marker = []
     markercolor = []
-    for symbol, color in symbols_colors:
+    for symbol, color in _get_default_symbols_colors(X, option):
         marker.append(symbol + color)
         markercolor.append(clr.to_rgba(color, option["alpha"])) # include face color transparency
     return marker, markercolor
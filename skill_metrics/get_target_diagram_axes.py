@@ -1,10 +1,15 @@
-import matplotlib.ticker as ticker
 import numpy as np
+import threading
 from math import log10, floor
 
+from skill_metrics.diagram_geometry import nice_ticks
 from skill_metrics.get_axis_tick_label import get_axis_tick_label
 from skill_metrics.use_sci_notation import use_sci_notation
 
+# Number of tick marks from the last call with a usable axis range. Kept per
+# thread so diagrams can be drawn concurrently from a thread pool.
+_saved_ticks = threading.local()
+
 def find_exp(number) -> int:
     base10 = log10(abs(number))
     return floor(base10)
@@ -64,23 +69,22 @@ def get_target_diagram_axes(x,y,option) -> dict:
         maxy = option['axismax']
 
     # Determine default number of tick marks
-    xtickvals = ticker.AutoLocator().tick_values(-1.0*maxx, maxx)
-    ytickvals = ticker.AutoLocator().tick_values(-1.0*maxy, maxy)
+    xtickvals = nice_ticks(-1.0*maxx, maxx)
+    ytickvals = nice_ticks(-1.0*maxy, maxy)
     ntest = np.sum(xtickvals > 0)
     if ntest > 0:
         nxticks = np.sum(xtickvals > 0)
         nyticks = np.sum(ytickvals > 0)
         
-        # Save nxticks and nyticks as function attributes for later 
-        # retrieval in function calls
-        get_target_diagram_axes.nxticks = nxticks
-        get_target_diagram_axes.nyticks = nyticks
+        # Save nxticks and nyticks for later retrieval in function calls
+        _saved_ticks.nxticks = nxticks
+        _saved_ticks.nyticks = nyticks
     else:
-        # Use function attributes for nxticks and nyticks
-        if hasattr(get_target_diagram_axes, 'nxticks') and \
-            hasattr(get_target_diagram_axes, 'nxticks'):
-            nxticks = get_target_diagram_axes.nxticks
-            nyticks = get_target_diagram_axes.nyticks
+        # Use saved values for nxticks and nyticks
+        if hasattr(_saved_ticks, 'nxticks') and \
+            hasattr(_saved_ticks, 'nyticks'):
+            nxticks = _saved_ticks.nxticks
+            nyticks = _saved_ticks.nyticks
         else:
             raise ValueError('No saved values for nxticks & nyticks.')
     
@@ -1,6 +1,4 @@
-import matplotlib.ticker as ticker
-import matplotlib.pyplot as plt
-import numpy as np
+from skill_metrics.diagram_geometry import taylor_axes
 
 def get_taylor_diagram_axes(ax, rho, option) -> dict:
     '''
@@ -36,12 +34,6 @@ def get_taylor_diagram_axes(ax, rho, option) -> dict:
     Revised on Aug 14, 2022
     '''
 
-    axes = {}
-    axes['dx'] = rho[0]
-       
-    axes['tc'] = option['colframe']
-    axes['next'] = 'replace' #needed?
-    
     # make a radial grid
     if option['axismax'] == 0.0:
         maxrho = max(abs(rho))
@@ -52,31 +44,8 @@ def get_taylor_diagram_axes(ax, rho, option) -> dict:
     if option['overlay'] =='off':
         ax.set_xlim(-maxrho, maxrho)
     xt = ax.get_xticks()
-    ticks = sum(xt >= 0)
     
     # Check radial limits and ticks
-    axes['rmin'] = 0; 
-    if option['axismax'] == 0.0:
-        axes['rmax'] = xt[-1]
-        option['axismax'] = axes['rmax']
-    else:
-        axes['rmax'] = option['axismax']
-    rticks = np.amax(ticks-1,axis=0)
-    if rticks > 5: # see if we can reduce the number
-        if rticks % 2 == 0:
-            rticks = rticks/2
-        elif rticks % 3 == 0:
-            rticks = rticks/3
-    axes['rinc']  = (axes['rmax'] - axes['rmin'])/rticks
-    tick  = np.arange(axes['rmin'] + axes['rinc'],
-                      axes['rmax'] + axes['rinc'],
-                      axes['rinc']) 
-    
-    if len(option['tickrms']) == 0:
-        option['tickrms'] = tick
-        option['rincrms'] = axes['rinc']
-    if len(option['tickstd']) == 0:
-        option['tickstd'] = tick
-        option['rincstd'] = axes['rinc']
+    axes = taylor_axes(rho, option, xt)
     
-    return axes
\ No newline at end of file
+    return axes
@@ -1,70 +1,24 @@
-from skill_metrics import check_label_position
-from skill_metrics import check_on_off
-from typing import Union
+from skill_metrics.option_schema import _get_default_options
+from skill_metrics.option_schema import _set_options
+from skill_metrics.read_options_file import read_options_file
 import numpy as np
-import os
-import pandas as pd
-import re
 
-def _calc_rinc(tick : list) -> float:
+def _get_profile_options(kind: str, CORs, kwargs: dict) -> dict:
     '''
-    Calculate axis tick increment given list of tick values.
-    
-    INPUTS:
-    tick: axis values at which to plot grid circles
-
-    return: axis tick increment
+    Get the option values of the OptionProfile given by the 'profile'
+    keyword in KWARGS for a diagram of type KIND, overridden by the other
+    keywords.
     '''
-    rinc  = (max(tick) - min(tick))/ len(tick)
-    return rinc
+    from skill_metrics.option_profile import OptionProfile
 
-def _check_dict_with_keys(variable_name: str, dict_obj: Union[dict, None],
-                          accepted_keys: set, or_none: bool = False) -> None:
-    '''
-    Check if an argument in the form of dictionary has valid keys.
-    :return: None. Raise 'ValueError' if evaluated variable is considered invalid. 
-    '''
-    
-    # if variable is None, check if it can be None
-    if dict_obj is None:
-        if or_none:
-            return None
-        else:
-            raise ValueError('%s cannot be None!' % variable_name)
-    
-    # check if every key provided is valid
-    for key in dict_obj.keys():
-        if key not in accepted_keys:
-            raise ValueError('Unrecognized option of %s: %s' % (variable_name, key))
-        del key
-    
-    return None
-
-def is_int(element):
-    '''
-    Check if variable is an integer. 
-    '''
-    try:
-        int(element)
-        return True
-    except ValueError:
-        return False
-
-def is_float(element):
-    '''
-    Check if variable is a float. 
-    '''
-    try:
-        float(element)
-        return True
-    except ValueError:
-        return False
-
-def is_list_in_string(element):
-    '''
-    Check if variable is list provided as string 
-    '''
-    return bool(re.search(r'\[|\]', element))
+    kwargs = dict(kwargs)
+    profile = kwargs.pop('profile')
+    if not isinstance(profile, OptionProfile):
+        raise ValueError('profile is not an OptionProfile: ' + str(profile))
+    if profile.kind != kind:
+        raise ValueError('Option profile for ' + profile.kind +
+                         ' diagram supplied to ' + kind + ' diagram')
+    return profile.options(CORs, **kwargs)
 
 def _default_options(CORs : list) -> dict:
     '''
@@ -72,7 +26,8 @@ def _default_options(CORs : list) -> dict:
     
     Sets the default optional arguments for the TAYLOR_DIAGRAM 
     function in an OPTION dictionary. Default values are 
-    assigned to selected optional arguments. 
+    assigned to selected optional arguments from the option schema
+    shared with the TARGET_DIAGRAM function (see the OPTION_SCHEMA module). 
     
     INPUTS:
     CORs : values of correlations
@@ -82,6 +37,11 @@ def _default_options(CORs : list) -> dict:
              display_taylor_diagram_options function for more information.)
     option['alpha']           : blending of symbol face color (0.0 
                                 transparent through 1.0 opaque). (Default : 1.0)
+    option['arcresolution']   : resolution of the circles of the diagram, 'auto'
+                                to adapt the number of points to the rendered
+                                size of each circle each time it is drawn or
+                                'fixed' for a fixed number of points
+                                (Default : 'fixed')
     option['axismax']         : maximum for the radial contours
     option['checkstats']      : Check input statistics satisfy Taylor 
                                 relationship (Default : 'off')
@@ -112,6 +72,8 @@ def _default_options(CORs : list) -> dict:
                                 get_default_markers.
     option['default_markers'] : default list of marker colors (Default: None). See function
                                 get_default_markers.
+    option['densitybins']     : number of bins along each axis of the 2-D histogram
+                                when 'markerdisplayed' == 'density' (Default: 100)
     
     option['labelrms']        : RMS axis label (Default: 'RMSD')
     option['labelrmspos']     : Axis label position in RMS circle (Default: 'outside')
@@ -123,9 +85,13 @@ def _default_options(CORs : list) -> dict:
     option['markercolors']    : dictionary with two colors as keys ('face', 'edge')
                                 or None. If None or 'markerlegend' == 'on' then
                                 considers only the value of 'markercolor'. (Default: None)
-    option['markerdisplayed'] : markers to use for individual experiments
+    option['markerdisplayed'] : markers to use for individual experiments: 'marker',
+                                'colorbar' or 'density' (Default: 'marker')
     option['markerlabel']     : name of the experiment to use for marker
     option['markerlabelcolor']: marker label color (Default: 'k')
+    option['markerlabelplacement']: placement of marker labels when 'markerlegend'
+                                is 'off', 'fixed' for above left of the markers or
+                                'auto' to avoid overlaps (Default: 'fixed')
     option['markerlayout']    : matrix layout for markers in legend [nrow, ncolumn] 
                                 (Default [15, no. markers/15] ) 
     option['markerlegend']    : 'on'/'off' switch to display marker legend
@@ -152,6 +118,13 @@ def _default_options(CORs : list) -> dict:
     option['overlay']         : 'on'/'off' switch to overlay current
                                  statistics on Taylor diagram (Default 'off')
                                  Only markers will be displayed.
+    option['preview']         : 'on'/'off' switch to draw a fast preview of the
+                                diagram without any text, e.g. for thumbnails
+                                (Default 'off')
+    option['rasterize']       : artists to rasterize in vector output (PDF, SVG):
+                                'off', 'grid', 'markers' or 'all' (Default 'off')
+    option['rasterthreshold'] : minimum number of markers to rasterize them when
+                                'rasterize' is 'markers' or 'all' (Default 1000)
     option['rincrms']         : axis tick increment for RMS values
     option['rincstd']         : axis tick increment for STD values
     option['rmslabelformat']  : string format for RMS contour labels, e.g. '0:.2f'.
@@ -172,7 +145,7 @@ def _default_options(CORs : list) -> dict:
     option['stylestd']        : line style for STD grid lines 
                                 (Default: dotted ':')
 
-    option['taylor_options_file'] name of CSV file containing values for optional
+    option['taylor_options_file'] name of CSV, JSON or TOML file containing values for optional
                                 arguments of the taylor_diagram function. If no file
                                 suffix is given, a ".csv" is assumed. (Default: empty string '')
 
@@ -208,101 +181,14 @@ def _default_options(CORs : list) -> dict:
     Revised on Sep 12, 2022
     '''
 
-    from matplotlib import rcParams
+    # Set default parameters for all options from the option schema
+    option = _get_default_options('taylor')
 
-    # Set default parameters for all options
-    option = {}
-    option['alpha'] = 1.0
-    option['axismax'] = 0.0
-    option['checkstats'] = 'off'
-    
-    option['cmap'] = 'jet'
-    option['cmap_vmin'] = None
-    option['cmap_vmax'] = None
-    option['cmap_marker'] = 'd'    
-    option['cmapzdata'] = []
-
-    option['colcor'] = (0, 0, 1)   # blue
-    option['colscor'] = None       # if None, considers 'colcor' only
-    option['colobs'] = 'm'         # magenta
-    option['colrms'] = (0, .6, 0)  # medium green
-    option['colstd'] = (0, 0, 0)   # black
-    option['colsstd'] = None       # if None, considers 'colstd' only
-    option['colframe'] = '#000000' # black
-    option['colormap'] = 'on'
-
-    option['default_colors'] = None
-    option['default_markers'] = None
-
-    option['labelrms'] = 'RMSD'
-    option['labelrmspos'] = 'outside'
-
-    option['labelweight'] = 'bold' # weight of the x/y labels ('light', 'normal', 'bold', ...)
-    option['locationcolorbar'] = 'NorthOutside'
-
-    option['markercolor'] = None
-    option['markercolors'] = None  # if None, considers 'markercolor' only
-    option['markerdisplayed'] = 'marker'
-    option['markerlabel'] = ''
-    option['markerlabelcolor'] = 'k'
-    option['markerlayout'] = [15, None]
-    option['markerlegend'] = 'off'
-    option['markerobs'] = 'none'
-    option['markers'] = None
-    option['markersize'] = 10
-    option['markersymbol'] = '.'
-
-    option['titlecorshape'] = "curved"
-                                
     # panels: double (2) or single (1)
     negative = CORs[np.where(CORs < 0.0)]
     option['numberpanels'] = 2 if (len(negative) > 0) else 1
     del negative
 
-    option['overlay'] = 'off'
-    option['rincrms'] = []
-    option['rincstd'] = []
-    option['rmslabelformat'] = '0'
- 
-    option['showlabelscor'] = 'on'
-    option['showlabelsrms'] = 'on'
-    option['showlabelsstd'] = 'on'
-
-    option['stylecor'] = '-.'
-    option['styleobs'] = ''
-    option['stylerms'] = '--'
-    option['stylestd'] = ':'
-
-    option['taylor_options_file'] = ''
-
-    # Note that "0" must be explicitly given or a scientific number is
-    # stored
-    tickval1 = [1, 0.99, 0.95, 0]
-    middle = np.linspace(0.9, 0.1, 9)
-    tickval1[3:3] = middle
-    tickval2 = tickval1[:]
-    values = np.linspace(-0.1,-0.9,9)
-    tickval2.extend(values)
-    tickval2.extend([-0.95, -0.99, -1])
-    option['tickcor'] = (tickval1, tickval2) # store as tuple
-    del tickval1, tickval2, middle, values
-
-    option['tickrms'] = [] 
-    option['tickstd'] = [] 
-    option['tickrmsangle'] = -1
-    option['titlecolorbar'] = ''
-    option['titlecor'] = 'on'
-    option['titleobs'] = ''
-    option['titlerms'] = 'on'
-    option['titlermsdangle'] = 160.0
-    option['titlestd'] = 'on'
- 
-    lineWidth = rcParams.get('lines.linewidth')
-    option['widthcor'] = lineWidth
-    option['widthobs'] = lineWidth
-    option['widthrms'] = lineWidth
-    option['widthstd'] = lineWidth
-                       
     return option
 
 def _get_options(option : dict, **kwargs) -> dict:
@@ -310,7 +196,8 @@ def _get_options(option : dict, **kwargs) -> dict:
     Get values for optional arguments for taylor_diagram function.
     
     Gets the default optional arguments for the TAYLOR_DIAGRAM 
-    function in an OPTION dictionary. 
+    function in an OPTION dictionary. The values are checked by the
+    functions generated from the option schema when it is imported.
     
     INPUTS:
     option  : dictionary containing default option values
@@ -331,100 +218,17 @@ def _get_options(option : dict, **kwargs) -> dict:
     '''
     
     # Check for valid keys and values in dictionary
-    for optname, optvalue in kwargs.items():
-        optname = optname.lower()
-        if optname == 'nonrmsdz':
-            raise ValueError('nonrmsdz is an obsolete option. Use cmapzdata instead.')
-
-        if not optname in option:
-            raise ValueError('Unrecognized option: ' + optname)
-        else:
-            # Replace option value with that from arguments
-            if optname == 'tickcor':
-                list1 = option['tickcor'][0]
-                list2 = option['tickcor'][1]
-                if option['numberpanels'] == 1:
-                    list1 = optvalue
-                else:
-                    list2 = optvalue
-                option['tickcor'] = (list1, list2)
-                del list1, list2
-            else:
-                option[optname] = optvalue
-
-            # Check values for specific options
-            if optname == 'checkstats':
-                option['checkstats'] = check_on_off(option['checkstats'])
-
-            elif optname == 'cmapzdata':
-                if isinstance(option[optname], str):
-                    raise ValueError('cmapzdata cannot be a string!')
-                elif isinstance(option[optname], bool):
-                    raise ValueError('cmapzdata cannot be a boolean!')
-                option['cmapzdata'] = optvalue
-
-            elif optname == 'labelrmspos':
-                option[optname] = check_label_position(option[optname])
-
-            elif optname == 'markerlabel':
-                if type(optvalue) is list:
-                    option['markerlabel'] = optvalue[1:]
-                elif type(optvalue) is dict:
-                    option['markerlabel'] = optvalue
-                else:
-                    raise ValueError('markerlabel value is not a list or dictionary: ' +
-                                     str(optvalue))
-
-            elif optname == 'markerlegend':
-                option['markerlegend'] = check_on_off(option['markerlegend'])
-
-            elif optname == 'overlay':
-                option['overlay'] = check_on_off(option['overlay'])
-
-            elif optname == 'rmslabelformat':
-                # Check for valid string format
-                labelFormat = '{' + optvalue + '}'
-                try:
-                    labelFormat.format(99.0)
-                except ValueError:
-                    raise ValueError('Invalid string format for rmslabelformat: ' + optvalue)
-
-            elif optname in {'showlabelscor', 'showlabelsrms', 'showlabelsstd'}:
-                option[optname] = check_on_off(option[optname])
-
-            elif optname == 'tickrms':
-                option['tickrms'] = np.sort(optvalue)
-                option['rincrms'] = _calc_rinc(option['tickrms'])
-
-            elif optname == 'tickstd':
-                option['tickstd'] = np.sort(optvalue)
-                option['rincstd'] = _calc_rinc(option['tickstd'])
-
-            elif optname in {'titlecor', 'titlerms', 'titlestd'}:
-                option[optname] = check_on_off(option[optname])
-
-            elif optname in {'markercolors', 'colscor', 'colsstd'}:
-                accepted_keys = {
-                    'markercolors': {'face', 'edge'},
-                    'colscor': {'grid', 'title', 'tick_labels'},
-                    'colsstd': {'grid', 'title', 'tick_labels', 'ticks'}
-                }
-                _check_dict_with_keys(optname, option[optname],
-                                      accepted_keys[optname], or_none=True)
-                del accepted_keys
-
-        del optname, optvalue
-
-    return option
+    return _set_options('taylor', option, kwargs)
 
 def _read_options(option : dict, **kwargs) -> dict:
     '''
-    Reads the optional arguments from a CSV file. 
+    Reads the optional arguments from an options file. 
     
     Reads the optional arguments for taylor_diagram function from a 
-    CSV file if a taylor_options_file parameter is provided that contains
-    the name of a valid Comma Separated Value (CSV) file. Otherwise the
-    function returns with no action taken. 
+    CSV, JSON or TOML file if a taylor_options_file parameter is provided
+    that contains the name of a valid file (see READ_OPTIONS_FILE). The
+    values are checked as for keyword arguments. Otherwise the function
+    returns with no action taken. 
     
     INPUTS:
     option  : dictionary containing default option values
@@ -432,9 +236,9 @@ def _read_options(option : dict, **kwargs) -> dict:
     *kwargs : variable-length keyword argument list. One of the keywords 
               must be in the list below for the function to perform any
             action.
-    taylor_options_file : name of CSV file containing values for optional
-                          arguments of the taylor_diagram function. If no file
-                          suffix is given, a ".csv" is assumed. (Default: empty string '')
+    taylor_options_file : name of CSV, JSON or TOML file containing values for
+                          optional arguments of the taylor_diagram function. If no
+                          file suffix is given, a ".csv" is assumed. (Default: empty string '')
         
     OUTPUTS:
     option : dictionary containing option values
@@ -454,77 +258,9 @@ def _read_options(option : dict, **kwargs) -> dict:
             name = optvalue
             break
     if not name: return option
-    
-    # Check if CSV file suffix
-    filename, file_extension = os.path.splitext(name)
-    
-    if file_extension == "":
-        filename = name + '.csv'
-    elif name.endswith('.csv'):
-        filename = name
-    else:
-        raise Exception("Invalid file type: " + name)
-    
-    # Check if file exists
-    if not os.path.isfile(filename):
-        raise Exception("File does not exist: " + filename)
-    
-    # Load object from CSV file
-    objectData = pd.read_csv(filename)
-    
-    # Parse object for keys and values
-    keys = objectData.iloc[:,0]
-    values = objectData.iloc[:,1].tolist()
 
-    # Identify keys requiring special consideration   
-    listkey=['cmapzdata','rincrms','rincstd','tickcor','tickrms','tickstd']
-    tuplekey=['colcor','colrms','colstd']
-    
-    # Process for options read from CSV file
-    for index in range(len(keys)):
-        
-        # Skip assignment if no value provided in CSV file
-        if pd.isna(values[index]):
-            continue
-        
-        # Convert list provided as string
-        if is_list_in_string(values[index]):
-            # Remove brackets
-            values[index] = values[index].replace('[','').replace(']','')
-        
-        if keys[index] in listkey:
-            if pd.isna(values[index]):
-                option[keys[index]]=[]
-            else:
-                # Convert string to list of floats
-                split_string = re.split(' |,', values[index])
-                split_string = ' '.join(split_string).split()
-                option[keys[index]] = [float(x) for x in split_string]
-
-            if keys[index] == 'tickrms':
-                option['rincrms'] = _calc_rinc(option[keys[index]])
-            elif keys[index] == 'tickstd':
-                option['rincstd'] = _calc_rinc(option[keys[index]])
-
-        elif keys[index] in tuplekey:
-            try:
-                option[keys[index]]=eval(values[index])
-            except NameError:
-                raise Exception('Invalid ' + keys[index] + ': '+ values[index])
-        elif keys[index] == 'rmslabelformat':
-            option[keys[index]]=values[index]
-        elif pd.isna(values[index]):
-            option[keys[index]]=''
-        elif is_int(values[index]):
-            option[keys[index]] = int(values[index])
-        elif is_float(values[index]):
-            option[keys[index]] = float(values[index])
-        elif values[index]=='None':
-            option[keys[index]]=None
-        else:
-            option[keys[index]] = values[index]
-        
-    return option
+    # Check the values read from file as for keyword arguments
+    return _get_options(option, **read_options_file(name))
 
 def get_taylor_diagram_options(*args,**kwargs) -> dict:
     '''
@@ -540,6 +276,8 @@ def get_taylor_diagram_options(*args,**kwargs) -> dict:
     *kwargs : variable-length keyword argument list. The keywords by 
               definition are dictionaries with keys that must correspond to 
               one choices given in the _default_options function.
+    profile : OptionProfile object providing the option values, overridden
+              by the other keywords (optional)
     
     OUTPUTS:
     option : dictionary containing option values. (Refer to _default_options
@@ -558,6 +296,11 @@ def get_taylor_diagram_options(*args,**kwargs) -> dict:
     '''
 
     CORs = args[0]
+
+    # Use options of a profile, overridden by the other keywords
+    if 'profile' in kwargs:
+        return _get_profile_options('taylor', CORs, kwargs)
+
     nargin = len(kwargs)
 
     # Set default parameters for all options
@@ -566,35 +309,12 @@ def get_taylor_diagram_options(*args,**kwargs) -> dict:
     # No options requested, so return with only defaults
     if nargin == 0: return option
 
-    #Check to see if the Key for the file exist
-    name = ''
-    for optname, optvalue in kwargs.items():
-        optname = optname.lower()
-        if optname == 'taylor_options_file':
-            name = optvalue 
-            break 
-    
-    if name:
-        # Check if CSV file suffix
-        filename, file_extension = os.path.splitext(name)
-    
-        if file_extension == "":
-            filename = name + '.csv'
-        elif name.endswith('.csv'):
-            filename = name
-        else:
-            raise Exception("Invalid file type: " + name)
-    
-        # Check if file exists
-        if not os.path.isfile(filename):
-            raise Exception("File does not exist: " + filename)
-        
-        # Read the optional arguments for taylor_diagram function from a 
-        # CSV file, if specified. 
-        option = _read_options(option, **kwargs)
+    # Read the optional arguments for taylor_diagram function from a 
+    # file, if specified. 
+    option = _read_options(option, **kwargs)
 
     # Check for valid keys and values in dictionary
-    # Allows user to override options specified in CSV file
+    # Allows user to override options specified in options file
     option = _get_options(option, **kwargs)
                                     
     return option
\ No newline at end of file
@@ -0,0 +1,145 @@
+from types import MappingProxyType
+
+import numpy as np
+
+# Keywords changing the options on which other options depend, requiring
+# all options of a profile to be resolved again when overridden
+_REBUILD_KEYWORDS = {'numberpanels', 'target_options_file', 'taylor_options_file'}
+
+class OptionProfile(object):
+    '''
+    Immutable set of options for Taylor or target diagrams, validated once
+    and reused across many diagrams.
+
+    The options supplied to the TAYLOR_DIAGRAM and TARGET_DIAGRAM functions
+    are completed with their default values and checked on every call,
+    including the reading of any options file. When many diagrams are drawn
+    with the same styling, e.g. in a batch job, this can be done once by
+    building a profile of the options and passing it to the functions
+    instead of the keywords:
+
+    profile = sm.OptionProfile('taylor', markerLabelColor = 'r',
+                               colRMS = 'm', styleRMS = ':')
+    for station in stations:
+        sm.taylor_diagram(sdev[station], crmsd[station], ccoef[station],
+                          profile = profile, markerLabel = labels[station])
+
+    Keywords given together with a profile override the options of the
+    profile for that call only. They are validated and applied to a copy of
+    the options of the profile, which is left unchanged. Overriding
+    'numberPanels' or the options file resolves all options again.
+
+    The default number of panels of a Taylor diagram depends on the
+    correlations of the diagram. It is resolved when the options are first
+    requested for correlations with or without negative values, and kept
+    for later diagrams.
+
+    A profile can be passed in the options of any function accepting the
+    options of the TAYLOR_DIAGRAM or TARGET_DIAGRAM function, e.g. the
+    RENDER_DIAGRAMS and EXPORT_DIAGRAM functions, or the RenderCache class.
+
+    INPUTS:
+    kind     : type of diagram, 'taylor' or 'target'
+    **kwargs : options as described for the TAYLOR_DIAGRAM or
+               TARGET_DIAGRAM function
+
+    ATTRIBUTES:
+    kind     : type of diagram, 'taylor' or 'target'
+    kwargs   : read-only mapping of the options supplied to the profile
+
+    METHODS:
+    options(CORs, **overrides) : dictionary of all option values
+    replace(**kwargs)          : new profile with additional options
+    '''
+
+    __slots__ = ('kind', 'kwargs', '_options', '_fixed_panels')
+
+    def __init__(self, kind, **kwargs):
+        kind = str(kind).lower()
+        if kind not in ('taylor', 'target'):
+            raise ValueError("kind must be 'taylor' or 'target': " + str(kind))
+        if 'profile' in kwargs:
+            raise ValueError('An option profile cannot contain another profile.')
+        object.__setattr__(self, 'kind', kind)
+        object.__setattr__(self, 'kwargs', MappingProxyType(dict(kwargs)))
+        object.__setattr__(self, '_fixed_panels', kind == 'target' or
+                           any(key.lower() == 'numberpanels' for key in kwargs))
+
+        # Resolved options by number of panels, or None when not dependent
+        # on the correlations
+        object.__setattr__(self, '_options', {})
+
+        # Validate options for the most common case of positive correlations
+        self._get_options(None)
+
+    def __setattr__(self, name, value):
+        raise AttributeError('OptionProfile is immutable: cannot set ' + name)
+
+    def __delattr__(self, name):
+        raise AttributeError('OptionProfile is immutable: cannot delete ' + name)
+
+    def __repr__(self):
+        return ('OptionProfile(' + repr(self.kind) +
+                ''.join(', ' + key + ' = ' + repr(value)
+                        for key, value in self.kwargs.items()) + ')')
+
+    def _get_panels(self, CORs):
+        '''
+        Return the key of the resolved options for correlations CORs: None
+        for a target diagram or a given number of panels, otherwise the
+        default number of panels of a Taylor diagram.
+        '''
+        if self._fixed_panels: return None
+        if CORs is None: return 1
+        return 2 if (np.asarray(CORs) < 0.0).any() else 1
+
+    def _get_options(self, CORs) -> MappingProxyType:
+        '''
+        Return the read-only options resolved for the correlations CORs,
+        resolving them on first use.
+        '''
+        panels = self._get_panels(CORs)
+        if panels not in self._options:
+            from skill_metrics.get_target_diagram_options import get_target_diagram_options
+            from skill_metrics.get_taylor_diagram_options import get_taylor_diagram_options
+
+            if self.kind == 'target':
+                option = get_target_diagram_options(**self.kwargs)
+            else:
+                # Correlations giving the default number of panels
+                option = get_taylor_diagram_options(np.array([1.0 if panels != 2 else -1.0]),
+                                                    **self.kwargs)
+            self._options[panels] = MappingProxyType(option)
+
+        return self._options[panels]
+
+    def options(self, CORs = None, **overrides) -> dict:
+        '''
+        Return a new dictionary of the option values of the profile for a
+        diagram with correlations CORs (used only for a Taylor diagram),
+        with the options given in OVERRIDES replacing those of the profile.
+        The dictionary can be modified without affecting the profile.
+        '''
+        if len(overrides) == 0: return dict(self._get_options(CORs))
+
+        if any(key.lower() in _REBUILD_KEYWORDS for key in overrides):
+            return self.replace(**overrides).options(CORs)
+
+        # Apply overrides to a copy of the options
+        if self.kind == 'target':
+            from skill_metrics.get_target_diagram_options import _get_options
+        else:
+            from skill_metrics.get_taylor_diagram_options import _get_options
+        return _get_options(dict(self._get_options(CORs)), **overrides)
+
+    def replace(self, **kwargs):
+        '''
+        Return a new profile with the options of this profile and those
+        given in KWARGS, which take precedence.
+        '''
+        # Keep keywords differing only in case once, with the new value
+        names = {key.lower() for key in kwargs}
+        merged = {key: value for key, value in self.kwargs.items()
+                  if key.lower() not in names}
+        merged.update(kwargs)
+        return OptionProfile(self.kind, **merged)
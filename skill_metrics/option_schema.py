@@ -0,0 +1,591 @@
+import sys
+
+import numpy as np
+
+from skill_metrics import check_label_position
+from skill_metrics import check_on_off
+
+# Diagrams accepting an option
+_BOTH = ('taylor', 'target')
+_TAYLOR = ('taylor',)
+_TARGET = ('target',)
+
+def _calc_rinc(tick : list) -> float:
+    '''
+    Calculate axis tick increment given list of tick values.
+
+    INPUTS:
+    tick: axis values at which to plot grid circles
+
+    return: axis tick increment
+    '''
+    rinc  = (max(tick) - min(tick))/ len(tick)
+    return rinc
+
+def _line_width() -> float:
+    # Default of matplotlib unless already imported, so that the options of
+    # diagrams drawn without matplotlib, e.g. by TAYLOR_DIAGRAM_SVG, do not
+    # import it
+    if not 'matplotlib' in sys.modules: return 1.5
+    return sys.modules['matplotlib'].rcParams.get('lines.linewidth')
+
+def _tick_cor_values() -> tuple:
+    '''
+    Return the default tick values of the correlation coefficients of a
+    Taylor diagram with one and two panels.
+    '''
+    # Note that "0" must be explicitly given or a scientific number is
+    # stored
+    tickval1 = [1, 0.99, 0.95, 0]
+    middle = np.linspace(0.9, 0.1, 9)
+    tickval1[3:3] = middle
+    tickval2 = tickval1[:]
+    values = np.linspace(-0.1,-0.9,9)
+    tickval2.extend(values)
+    tickval2.extend([-0.95, -0.99, -1])
+    return (tickval1, tickval2)
+
+_TICKCOR = _tick_cor_values()
+
+def _tick_cor() -> tuple:
+    return (list(_TICKCOR[0]), list(_TICKCOR[1]))
+
+# Generators of the functions checking the value of an option, called with
+# the option dictionary and the value supplied for the option. Each stores
+# the checked value, and the values of options derived from it, in the
+# dictionary, or raises a ValueError.
+
+def _on_off(key: str):
+    def check(option, value):
+        option[key] = check_on_off(value)
+    return check
+
+def _choice(key: str, values: tuple):
+    choices = ', '.join("'" + value + "'" for value in values[:-1]) + \
+        " or '" + values[-1] + "'"
+    def check(option, value):
+        option[key] = str(value).lower()
+        if option[key] not in values:
+            raise ValueError(key + ' must be ' + choices + ': ' + str(value))
+    return check
+
+def _integer(key: str, minimum: int):
+    kind = 'a positive' if minimum == 1 else 'a non-negative'
+    def check(option, value):
+        if not isinstance(value, (int, np.integer)) or value < minimum:
+            raise ValueError(key + ' must be ' + kind + ' integer: ' + str(value))
+        option[key] = value
+    return check
+
+def _dict_with_keys(key: str, accepted_keys: set):
+    '''
+    Check that the value is None or a dictionary with keys in ACCEPTED_KEYS.
+    '''
+    def check(option, value):
+        if value is not None:
+            for name in value.keys():
+                if name not in accepted_keys:
+                    raise ValueError('Unrecognized option of %s: %s' % (key, name))
+        option[key] = value
+    return check
+
+def _not_string(key: str):
+    def check(option, value):
+        if isinstance(value, str):
+            raise ValueError(key + ' cannot be a string!')
+        elif isinstance(value, bool):
+            raise ValueError(key + ' cannot be a boolean!')
+        option[key] = value
+    return check
+
+def _label_position(key: str):
+    def check(option, value):
+        option[key] = check_label_position(value)
+    return check
+
+def _marker_label(key: str, first: int):
+    '''
+    Check that the value is a list or a dictionary, keeping the items of a
+    list from index FIRST.
+    '''
+    def check(option, value):
+        if type(value) is list:
+            option[key] = value[first:]
+        elif type(value) is dict:
+            option[key] = value
+        else:
+            raise ValueError(key + ' value is not a list or dictionary: ' + str(value))
+    return check
+
+def _string_format(key: str):
+    def check(option, value):
+        # Check for valid string format
+        labelFormat = '{' + value + '}'
+        try:
+            labelFormat.format(99.0)
+        except ValueError:
+            raise ValueError('Invalid string format for ' + key + ': ' + value)
+        option[key] = value
+    return check
+
+def _ticks(key: str, rinc_key: str):
+    '''
+    Sort the tick values and derive the tick increment RINC_KEY from them.
+    '''
+    def check(option, value):
+        option[key] = np.sort(value)
+        option[rinc_key] = _calc_rinc(option[key])
+    return check
+
+def _panel_ticks(key: str):
+    '''
+    Replace the tick values of the panel given by option['numberpanels'].
+    '''
+    def check(option, value):
+        list1, list2 = option[key]
+        if option['numberpanels'] == 1:
+            list1 = value
+        else:
+            list2 = value
+        option[key] = (list1, list2)
+    return check
+
+def _line_spec(key: str):
+    '''
+    Derive option['circlecolor'] and option['circlestyle'] from a line
+    specification, e.g. 'k--' or '--k'.
+    '''
+    def check(option, value):
+        option[key] = value
+        if value[-1].isalpha():
+            option['circlecolor'] = value[-1]
+            option['circlestyle'] = value[0:-1]
+        else:
+            option['circlecolor'] = value[0]
+            option['circlestyle'] = value[1:]
+    return check
+
+def _option(key: str, default, check = None, name: str = None, help = None,
+            diagrams: tuple = _BOTH) -> dict:
+    '''
+    Return the entry of an option in the schema.
+
+    INPUTS:
+    key      : name of the option in lower case
+    default  : default value, or a function returning it when the value is
+               mutable or depends on the rcParams
+    check    : function returned by one of the generators above that checks
+               a value of the option, or None to accept any value
+    name     : name of the option displayed in the help (Default: KEY)
+    help     : description of the option displayed in the help, a string or
+               a dictionary of strings by diagram (Default: not displayed)
+    diagrams : diagrams accepting the option
+    '''
+    return {'key': key, 'default': default, 'check': check,
+            'name': key if name is None else name, 'help': help,
+            'diagrams': diagrams}
+
+_ON_OFF = "'on' / 'off' (default): "
+_OFF_ON = "'on' (default) / 'off': "
+
+_OPTIONS = (
+    _option('alpha', 1.0, name = 'alpha',
+            help = "Blending of symbol face color (0.0 transparent through 1.0 opaque)" +
+            "\n\t\t" + "(Default: 1.0)"),
+    _option('arcresolution', 'fixed', _choice('arcresolution', ('auto', 'fixed')),
+            name = 'arcResolution',
+            help = "'fixed' (default) / 'auto': Adapt number of points of circles to " +
+            "their rendered size each time they are drawn"),
+    _option('axismax', 0.0, name = 'axisMax',
+            help = {'taylor': 'Maximum for the radial contours',
+                    'target': 'Maximum for the Bias & uRMSD axis'}),
+    _option('checkstats', 'off', _on_off('checkstats'), name = 'checkStats',
+            help = _ON_OFF + 'Check input statistics satisfy Taylor relationship',
+            diagrams = _TAYLOR),
+
+    _option('circlecols', None, name = 'circleCols',
+            help = "Dictionary with two possible colors keys ('ticks','tick_labels')" +
+            "\n\t\t or None, if None then considers only the value of 'circlecolor'" +
+            "(Default: None)",
+            diagrams = _TARGET),
+    _option('circlelinespec', 'k--', _line_spec('circlelinespec'), name = 'circleLineSpec',
+            help = "Circle line specification (default dashed black, '--k')",
+            diagrams = _TARGET),
+    _option('circlelinewidth', _line_width, name = 'circleLineWidth',
+            help = 'Circle line width', diagrams = _TARGET),
+    _option('circles', None, name = 'circles',
+            help = 'Define the radii of circles to draw ' +
+            '(default of (maximum RMSDs)*[.7 1], [.7 1] when normalized diagram)',
+            diagrams = _TARGET),
+    # Derived from circlelinespec
+    _option('circlecolor', 'k', name = 'circleColor',
+            help = 'Circle line color specification (default None)',
+            diagrams = _TARGET),
+    _option('circlestyle', '--', name = 'circleStyle',
+            help = 'Line style for circles, e.g. "--" (Default: None)',
+            diagrams = _TARGET),
+
+    _option('cmap', 'jet', name = 'cmap',
+            help = "Choice of colormap. (Default: 'jet')"),
+    _option('cmap_vmin', None, name = 'cmap_vmin',
+            help = 'Minimum range of colormap (Default: None)'),
+    _option('cmap_vmax', None, name = 'cmap_vmax',
+            help = 'Maximum range of colormap (Default: None)'),
+    _option('cmap_marker', 'd', name = 'cmap_marker',
+            help = "Marker to use with colormap (Default: 'd')"),
+    _option('cmapzdata', list, _not_string('cmapzdata'), name = 'cmapZData',
+            help = 'Data values to use for color mapping of markers, e.g. RMSD or BIAS.' +
+            '\n\t\t(Used to make range of RMSDs values appear above color bar.)'),
+
+    _option('colcor', (0, 0, 1), name = 'colCOR',
+            help = 'CORRELATION grid color. Default: blue', diagrams = _TAYLOR),
+    _option('colscor', None,
+            _dict_with_keys('colscor', {'grid', 'title', 'tick_labels'}), name = 'colsCOR',
+            help = "CORRELATION dictionary of grid colors with: " +
+            "'grid', 'tick_labels', 'title' keys/values." +
+            "\n\t\tIf not provided or None, considers the monotonic 'colCOR' argument." +
+            "Default: None",
+            diagrams = _TAYLOR),
+    _option('colobs', 'm', name = 'colObs',
+            help = 'Observation STD color. (Default: magenta)', diagrams = _TAYLOR),
+    _option('colrms', (0, .6, 0), name = 'colRMS',
+            help = 'Color for RMS labels (Default: medium green)', diagrams = _TAYLOR),
+    _option('colstd', (0, 0, 0), name = 'colSTD',
+            help = 'STD grid and tick labels color. (Default: black)', diagrams = _TAYLOR),
+    _option('colsstd', None,
+            _dict_with_keys('colsstd', {'grid', 'title', 'tick_labels', 'ticks'}),
+            name = 'colsSTD',
+            help = "STD dictionary of grid colors with: " +
+            "'grid', 'tick_labels', 'title' keys/values." +
+            "\n\t\tIf not provided or None, considers the monotonic 'colSTD' argument. " +
+            "(Default: None)",
+            diagrams = _TAYLOR),
+    _option('colframe', '#000000', name = 'colFrame',
+            help = "Color for both the y (left) and x (bottom) spines. " +
+            "(Default: '#000000' (black))"),
+    _option('colormap', 'on', name = 'colorMap',
+            help = "'on' (default) / 'off': " +
+            "Switch to map color shading of markers to colormap ('on')\n\t\t" +
+            "or min to max range of RMSDz values ('off')."),
+
+    _option('default_colors', None),
+    _option('default_markers', None),
+    _option('densitybins', 100, _integer('densitybins', 1), name = 'densityBins',
+            help = 'Number of histogram bins along each axis (Default: 100)'),
+
+    _option('equalaxes', 'on', _on_off('equalaxes'), name = 'equalAxes',
+            help = _OFF_ON + 'Set axes to be equal', diagrams = _TARGET),
+
+    _option('labelrms', 'RMSD', name = 'labelRMS',
+            help = "RMS axis label (Default 'RMSD')", diagrams = _TAYLOR),
+    _option('labelrmspos', 'outside', _label_position('labelrmspos'), name = 'labelRMSpos',
+            help = "'outside' (default) / 'inside': Axis label position in RMS circle",
+            diagrams = _TAYLOR),
+    # Weight of the x/y labels ('light', 'normal', 'bold', ...)
+    _option('labelweight', 'bold', name = 'labelWeight',
+            help = 'Weight of the x & y axis labels'),
+    _option('locationcolorbar', 'NorthOutside', name = 'locationColorBar',
+            help = "Location for the colorbar, 'NorthOutside' or 'EastOutside'"),
+
+    _option('markercolor', None, name = 'markerColor',
+            help = 'Single color to use for all markers (Default: None)'),
+    _option('markercolors', None, _dict_with_keys('markercolors', {'face', 'edge'}),
+            name = 'markerColors',
+            help = "Dictionary with up to two colors as keys ('face', 'edge') " +
+            "to use for all markers " +
+            "\n\t\twhen 'markerlegend' == 'off' or None." +
+            "\n\t\tIf None or 'markerlegend' == 'on', then uses only the " +
+            "value of 'markercolor'. (Default: None)"),
+    _option('markerdisplayed', 'marker', name = 'MarkerDisplayed',
+            help = "'marker' (default): Experiments are represented by individual " +
+            "symbols\n\t\t" +
+            "'colorBar': Experiments are represented by a color described " +
+            "in a colorbar\n\t\t" +
+            "'density': Experiments are aggregated into a 2-D histogram " +
+            "shaded by the number\n\t\tof experiments in each bin, " +
+            "described in a colorbar"),
+    # The first label of a Taylor diagram is that of the observation
+    _option('markerlabel', '', _marker_label('markerlabel', 1), name = 'markerLabel',
+            help = 'Labels for markers', diagrams = _TAYLOR),
+    _option('markerlabel', '', _marker_label('markerlabel', 0), name = 'markerLabel',
+            help = 'Labels for markers', diagrams = _TARGET),
+    _option('markerlabelcolor', 'k', name = 'markerLabelColor',
+            help = 'Marker label color (Default: black)'),
+    _option('markerlabelplacement', 'fixed',
+            _choice('markerlabelplacement', ('fixed', 'auto')), name = 'markerLabelPlacement',
+            help = "'fixed' (default) / 'auto': " +
+            'Move marker labels to avoid overlaps when markerLegend is off'),
+    _option('markerlayout', lambda: [15, None], name = 'markerLayout',
+            help = 'Matrix layout for markers in legend [nrow, ncolumn].' + '\n\t\t' +
+            '(Default: [15, no. markers/15])'),
+    _option('markerlegend', 'off', _on_off('markerlegend'), name = 'markerLegend',
+            help = _ON_OFF + 'Use legend for markers'),
+    _option('markerobs', 'none', name = 'markerObs',
+            help = 'Marker to use for x-axis indicating observed STD.' +
+            "\n\t\tA choice of 'None' will suppress appearance of marker. (Default None)",
+            diagrams = _TAYLOR),
+    _option('markerobs', 'none', diagrams = _TARGET),
+    _option('markers', None, name = 'markers',
+            help = 'Dictionary providing individual control of the marker ' +
+            'label, label color, symbol, size, face color, and edge color' +
+            ' (Default: None)'),
+    _option('markersize', 10, name = 'markerSize', help = 'Marker size (Default: 10)'),
+    _option('markersymbol', '.', name = 'markerSymbol',
+            help = "Marker symbol (Default: '.')", diagrams = _TAYLOR),
+    _option('markersymbol', 'o', name = 'markerSymbol',
+            help = "Marker symbol (Default: 'o')", diagrams = _TARGET),
+
+    _option('normalized', 'off', _on_off('normalized'), name = 'normalized',
+            help = _ON_OFF + 'normalized target diagram', diagrams = _TARGET),
+    # Default depends on the correlations, set by _default_options
+    _option('numberpanels', None, name = 'numberPanels',
+            help = '1 or 2: Panels to display (1 for ' +
+            'positive correlations, 2 for positive and negative' +
+            ' correlations). \n\t\tDefault value depends on ' +
+            'correlations (CORs)',
+            diagrams = _TAYLOR),
+
+    _option('obsuncertainty', 0.0, name = 'obsUncertainty',
+            help = 'Observational Uncertainty (default of 0)', diagrams = _TARGET),
+    _option('overlay', 'off', _on_off('overlay'), name = 'overlay',
+            help = {'taylor': _ON_OFF + 'Switch to overlay current statistics on ' +
+                    'Taylor diagram. \n\t\tOnly markers will be displayed.',
+                    'target': _ON_OFF + 'Switch to overlay current statistics on ' +
+                    'target diagram. \n\t\tOnly markers will be displayed.'}),
+    _option('preview', 'off', _on_off('preview'), name = 'preview',
+            help = _ON_OFF + 'Switch to draw a fast preview without any text for thumbnails'),
+    _option('rasterize', 'off', _choice('rasterize', ('off', 'grid', 'markers', 'all')),
+            name = 'rasterize',
+            help = "'off' (default) / 'grid' / 'markers' / 'all': " +
+            'Rasterize grid and/or markers in vector output (PDF, SVG)'),
+    _option('rasterthreshold', 1000, _integer('rasterthreshold', 0), name = 'rasterThreshold',
+            help = 'Minimum number of markers to rasterize them (Default: 1000)'),
+    # Derived from tickrms and tickstd
+    _option('rincrms', list, name = 'rincRMS',
+            help = 'Axis tick increment for RMS values', diagrams = _TAYLOR),
+    _option('rincstd', list, name = 'rincSTD',
+            help = 'Axis tick increment for STD values', diagrams = _TAYLOR),
+    _option('rmslabelformat', '0', _string_format('rmslabelformat'), name = 'rmsLabelFormat',
+            help = "String format for RMS contour labels, e.g. '0:.2f'.\n\t\t" +
+            "(Default '0', format as specified by str function.)",
+            diagrams = _TAYLOR),
+
+    _option('showlabelscor', 'on', _on_off('showlabelscor'), name = 'showlabelsCOR',
+            help = _OFF_ON + 'Show the CORRELATION tick labels', diagrams = _TAYLOR),
+    _option('showlabelsrms', 'on', _on_off('showlabelsrms'), name = 'showlabelsRMS',
+            help = _OFF_ON + 'Show the RMS tick labels', diagrams = _TAYLOR),
+    _option('showlabelsstd', 'on', _on_off('showlabelsstd'), name = 'showlabelsSTD',
+            help = _OFF_ON + 'Show the STD tick labels', diagrams = _TAYLOR),
+
+    _option('stylebias', '-.', diagrams = _TARGET),
+    _option('stylecor', '-.', name = 'styleCOR',
+            help = 'Line style of the CORRELATION grid', diagrams = _TAYLOR),
+    _option('styleobs', '', name = 'styleObs',
+            help = "Line style for observation grid line. A choice of empty string ('')" +
+            "\n\t\twill suppress appearance of the grid line. (Default: '')",
+            diagrams = _TAYLOR),
+    _option('stylerms', '--', name = 'styleRMS',
+            help = 'Line style of the RMS grid', diagrams = _TAYLOR),
+    _option('stylestd', ':', name = 'styleSTD',
+            help = 'Line style of the STD grid', diagrams = _TAYLOR),
+
+    _option('target_options_file', '', name = 'target_options_file',
+            help = 'name of CSV, JSON or TOML file containing values for optional ' +
+            'arguments' +
+            '\n\t\t' + 'of the target_diagram function. If no file suffix is given,' +
+            '\n\t\t' + "a '.csv' is assumed. (Default: empty string '')",
+            diagrams = _TARGET),
+    _option('taylor_options_file', '', name = 'taylor_options_file',
+            help = 'name of CSV, JSON or TOML file containing values for optional ' +
+            'arguments' +
+            '\n\t\t' + 'of the taylor_diagram function. If no file suffix is given,' +
+            '\n\t\t' + "a '.csv' is assumed. (Default: empty string '')",
+            diagrams = _TAYLOR),
+
+    _option('tickcor', _tick_cor, _panel_ticks('tickcor'), name = 'tickCOR',
+            help = 'Tick values for correlation coefficients of the panels given by' +
+            "\n\t\t'numberPanels'",
+            diagrams = _TAYLOR),
+    _option('tickrms', list, _ticks('tickrms', 'rincrms'), name = 'tickRMS',
+            help = 'RMS values to plot grid circles from observation point',
+            diagrams = _TAYLOR),
+    _option('tickstd', list, _ticks('tickstd', 'rincstd'), name = 'tickSTD',
+            help = 'STD values to plot gridding circles from origin',
+            diagrams = _TAYLOR),
+    _option('tickrmsangle', -1, name = 'tickRMSangle',
+            help = 'Angle for RMS tick labels with the ' +
+            'observation point. Default: 135 deg.',
+            diagrams = _TAYLOR),
+    _option('ticks', list, name = 'ticks',
+            help = 'Define tick positions (default is that used by axis function)',
+            diagrams = _TARGET),
+    _option('titlecolorbar', '', name = 'titleColorBar', help = 'Title of the colorbar.'),
+    _option('titlecor', 'on', _on_off('titlecor'), name = 'titleCOR',
+            help = _OFF_ON + 'Show CORRELATION axis title', diagrams = _TAYLOR),
+    _option('titlecorshape', 'curved', name = 'titleCORshape',
+            help = "The shape of the label 'correlation coefficient'. " +
+            "\n\t\tAccepted values are 'curved' or 'linear' (Default: 'curved'),",
+            diagrams = _TAYLOR),
+    _option('titleobs', '', name = 'titleOBS',
+            help = "Label for observation point (Default: '')", diagrams = _TAYLOR),
+    _option('titlerms', 'on', _on_off('titlerms'), name = 'titleRMS',
+            help = _OFF_ON + 'Show RMSD axis title', diagrams = _TAYLOR),
+    _option('titlermsdangle', 160.0, name = 'titleRMSDangle',
+            help = "Angle at which to display the 'RMSD' label for the\n\t\t" +
+            'RMSD contours (Default: 160 degrees)',
+            diagrams = _TAYLOR),
+    _option('titlestd', 'on', _on_off('titlestd'), name = 'titleSTD',
+            help = _OFF_ON + 'Show STD axis title', diagrams = _TAYLOR),
+
+    _option('widthcor', _line_width, name = 'widthCOR',
+            help = 'Line width of the COR grid', diagrams = _TAYLOR),
+    _option('widthobs', _line_width, name = 'widthOBS',
+            help = 'Line width for observation grid line', diagrams = _TAYLOR),
+    _option('widthrms', _line_width, name = 'widthRMS',
+            help = 'Line width of the RMS grid', diagrams = _TAYLOR),
+    _option('widthstd', _line_width, name = 'widthSTD',
+            help = 'Line width of the STD grid', diagrams = _TAYLOR),
+
+    _option('xticklabelpos', list, name = 'xtickLabelPos',
+            help = 'position of the tick labels along the x-axis (empty by default)',
+            diagrams = _TARGET),
+    _option('yticklabelpos', list, name = 'ytickLabelPos',
+            help = 'position of the tick labels along the y-axis (empty by default)',
+            diagrams = _TARGET),
+)
+
+# Sections of the help of each diagram as (heading, option keys). Headings
+# ending with a colon start a group of sections.
+_HELP_SECTIONS = {
+    'taylor': (
+        ('General options:', ('alpha', 'axismax', 'arcresolution', 'colframe',
+                              'colormap', 'labelweight', 'numberpanels', 'overlay',
+                              'preview', 'rasterize', 'rasterthreshold')),
+        ("OPTIONS when 'colormap' == 'on'", ('cmap', 'cmap_marker', 'cmap_vmax',
+                                             'cmap_vmin')),
+        ('Marker options:', ('markerdisplayed',)),
+        ("OPTIONS when 'MarkerDisplayed' == 'marker'",
+         ('markercolor', 'markercolors', 'markerlabel', 'markerlabelcolor',
+          'markerlabelplacement', 'markerlayout', 'markerlegend', 'markers',
+          'markersize', 'markersymbol')),
+        ("OPTIONS when 'MarkerDisplayed' == 'colorbar'", ('cmapzdata', 'locationcolorbar',
+                                                          'titlecolorbar')),
+        ("OPTIONS when 'MarkerDisplayed' == 'density'", ('densitybins',)),
+        ('RMS axis options:', ('colrms', 'labelrms', 'labelrmspos', 'rincrms',
+                               'rmslabelformat', 'showlabelsrms', 'stylerms', 'tickrms',
+                               'tickrmsangle', 'titlerms', 'titlermsdangle', 'widthrms')),
+        ('STD axis options:', ('colstd', 'colsstd', 'rincstd', 'showlabelsstd',
+                               'stylestd', 'tickstd', 'titlestd', 'widthstd')),
+        ('CORRELATION axis options:', ('colcor', 'colscor', 'showlabelscor', 'stylecor',
+                                       'tickcor', 'titlecor', 'titlecorshape', 'widthcor')),
+        ('Observation Point options:', ('colobs', 'markerobs', 'styleobs', 'titleobs',
+                                        'widthobs')),
+        ('CONTROL options:', ('checkstats',)),
+        ('Plotting Options from File:', ('taylor_options_file',)),
+    ),
+    'target': (
+        ('General options:', ('colormap', 'overlay', 'preview', 'rasterize',
+                              'rasterthreshold')),
+        ("OPTIONS when 'colormap' == 'on'", ('cmap', 'cmap_marker', 'cmap_vmax',
+                                             'cmap_vmin')),
+        ('Marker options:', ('markerdisplayed',)),
+        ("OPTIONS when 'MarkerDisplayed' == 'marker'",
+         ('markercolor', 'markercolors', 'markerlabel', 'markerlabelcolor',
+          'markerlabelplacement', 'markerlayout', 'markerlegend', 'markers',
+          'markersize', 'markersymbol')),
+        ("OPTIONS when 'MarkerDisplayed' == 'colorbar'", ('cmapzdata', 'locationcolorbar',
+                                                          'titlecolorbar')),
+        ("OPTIONS when 'MarkerDisplayed' == 'density'", ('densitybins',)),
+        ('Axes options:', ('axismax', 'arcresolution', 'colframe', 'equalaxes',
+                           'labelweight', 'ticks', 'xticklabelpos', 'yticklabelpos')),
+        ('Diagram options:', ('alpha', 'circles', 'circlecolor', 'circlecols',
+                              'circlelinespec', 'circlelinewidth', 'circlestyle',
+                              'normalized', 'obsuncertainty')),
+        ('Plotting Options from File:', ('target_options_file',)),
+    ),
+}
+
+def _compile_schema(kind: str) -> tuple:
+    '''
+    Return the entries of the options of diagram KIND by key, their constant
+    default values, the functions returning their other default values and
+    their checks by key.
+    '''
+    entries = {}
+    for entry in _OPTIONS:
+        if kind not in entry['diagrams']: continue
+        if entry['key'] in entries:
+            raise ValueError('Duplicate option in schema: ' + entry['key'])
+        entries[entry['key']] = entry
+
+    constants = {key: entry['default'] for key, entry in entries.items()
+                 if not callable(entry['default'])}
+    factories = tuple((key, entry['default']) for key, entry in entries.items()
+                      if callable(entry['default']))
+    checks = {key: entry['check'] for key, entry in entries.items()}
+
+    # Every option in the help must be documented in the schema
+    for heading, keys in _HELP_SECTIONS[kind]:
+        for key in keys:
+            if key not in entries or entries[key]['help'] is None:
+                raise ValueError('Undocumented option in help: ' + key)
+
+    return entries, constants, factories, checks
+
+# Compiled schema of each diagram
+_COMPILED = {kind: _compile_schema(kind) for kind in _BOTH}
+
+def _get_default_options(kind: str) -> dict:
+    '''
+    Return a new dictionary of the default values of the options of
+    diagram KIND.
+    '''
+    entries, constants, factories, checks = _COMPILED[kind]
+    option = dict(constants)
+    for key, factory in factories:
+        option[key] = factory()
+    return option
+
+def _set_options(kind: str, option: dict, kwargs: dict) -> dict:
+    '''
+    Check the values of the options in KWARGS, whose names are not case
+    sensitive, for diagram KIND and store them in OPTION together with the
+    values of the options derived from them.
+
+    Each option is checked by the function generated for it from the
+    schema when this module is imported, so that checking an option takes
+    a single dictionary lookup and function call. An unrecognized option
+    or invalid value raises a ValueError.
+    '''
+    checks = _COMPILED[kind][3]
+    for optname, optvalue in kwargs.items():
+        optname = optname.lower()
+        if optname == 'nonrmsdz':
+            raise ValueError('nonrmsdz is an obsolete option. Use cmapzdata instead.')
+
+        try:
+            check = checks[optname]
+        except KeyError:
+            raise ValueError('Unrecognized option: ' + optname)
+        if check is None:
+            option[optname] = optvalue
+        else:
+            check(option, optvalue)
+
+    return option
+
+def _display_options(kind: str) -> None:
+    '''
+    Displays the options of diagram KIND described in the schema, each
+    option name on a line by itself followed by its description on the
+    following line.
+    '''
+    entries = _COMPILED[kind][0]
+    for i, (heading, keys) in enumerate(_HELP_SECTIONS[kind]):
+        if i > 0 and heading.endswith(':'): print('')
+        print(heading)
+        for key in keys:
+            text = entries[key]['help']
+            if isinstance(text, dict): text = text[kind]
+            print("\t'%s'" % entries[key]['name'])
+            print('\t\t%s' % text)
@@ -1,5 +1,7 @@
-import matplotlib.pyplot as plt
-import matplotlib
+from skill_metrics.diagram_arcs import _plot_arc
+from skill_metrics.diagram_geometry import _TARGET_STEP, circle, target_circles
+from functools import partial
+import matplotlib.axes
 import numpy as np
 
 def pol2cart(phi, rho):
@@ -49,36 +51,23 @@ def overlay_target_diagram_circles(ax: matplotlib.axes.Axes, option: dict) -> No
         prochford@thesymplectic.com
     '''
 
-    theta = np.arange(0, 2*np.pi, 0.01)
-    unit = np.ones(len(theta))
+    circles = target_circles(option)
+    step = _TARGET_STEP
+
     # 1 - reference circle if normalized
-    if option['normalized'] == 'on':
-        rho = unit
-        X, Y = pol2cart(theta, rho)
-        ax.plot(X, Y, 'k', 'LineWidth', option['circleLineWidth'])
+    if circles['reference'] is not None:
+        _plot_arc(ax, 'target', option, partial(circle, 1.0, step),
+                  color = 'k', linewidth = option['circlelinewidth'])
 
-    # Set range for target circles
-    if option['normalized'] == 'on':
-        circles = [.5, 1]
-    else:
-        if option['circles'] is None:
-            circles = [option['axismax'] * x for x in [.7, 1]]
-        else:
-            circles = np.asarray(option['circles'])
-            index = np.where(circles <= option['axismax'])
-            circles = [option['circles'][i] for i in index[0]]
-    
     # 2 - secondary circles
-    for c in circles:
-        rho = c * unit
-        X, Y = pol2cart(theta, rho)
-        ax.plot(X, Y, linestyle=option['circlestyle'],
-                color=option['circlecolor'],
-                linewidth=option['circlelinewidth'])
-    del c
+    for radius in circles['radius']:
+        _plot_arc(ax, 'target', option, partial(circle, radius, step),
+                  linestyle=option['circlestyle'],
+                  color=option['circlecolor'],
+                  linewidth=option['circlelinewidth'])
 
     # 3 - Observational Uncertainty threshold
-    if option['obsuncertainty'] > 0:
-        rho = option['obsuncertainty'] * unit
-        X, Y = pol2cart(theta, rho)
-        ax.plot(X, Y, '--b')
+    if circles['uncertainty'] is not None:
+        _plot_arc(ax, 'target', option,
+                  partial(circle, option['obsuncertainty'], step),
+                  linestyle = '--', color = 'b')
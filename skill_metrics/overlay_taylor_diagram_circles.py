@@ -1,6 +1,9 @@
 from skill_metrics import get_from_dict_or_default
-import numpy as np
-import matplotlib
+from skill_metrics.diagram_arcs import _plot_arc
+from skill_metrics.diagram_geometry import taylor_rms_arc, taylor_rms_arcs
+from skill_metrics.diagram_geometry import taylor_std_arc, taylor_std_arcs
+from functools import partial
+import matplotlib.axes
 
 def overlay_taylor_diagram_circles(ax: matplotlib.axes.Axes, axes: dict,
                                         option: dict) -> None:
@@ -45,64 +48,31 @@ def overlay_taylor_diagram_circles(ax: matplotlib.axes.Axes, axes: dict,
         adlzanchetta@gmail.com
     '''
 
-    th = np.arange(0, 2*np.pi, np.pi/150)
-    xunit = np.cos(th)
-    yunit = np.sin(th)
-
-    # now really force points on x/y axes to lie on them exactly
-    inds = range(0,len(th),(len(th)-1) // 4)
-    xunit[inds[1:5:2]] = np.zeros(2)
-    yunit[inds[0:6:2]] = np.zeros(3)
-    
     # DRAW RMS CIRCLES:
-    # ANGLE OF THE TICK LABELS
-    if option['tickrmsangle'] > 0:
-        tickRMSAngle = option['tickrmsangle']
-    else:
-        phi = np.arctan2(option['tickstd'][-1],axes['dx'])
-        tickRMSAngle = 180 - np.rad2deg(phi)
-    
-    cst = np.cos(tickRMSAngle*np.pi/180)
-    snt = np.sin(tickRMSAngle*np.pi/180)
-    radius = np.sqrt(axes['dx']**2+axes['rmax']**2 - 
-                     2*axes['dx']*axes['rmax']*xunit)
-
-    # Define label format
-    labelFormat = '{' + option['rmslabelformat'] + '}'
+    rms = taylor_rms_arcs(axes, option)
     fontSize = matplotlib.rcParams.get('font.size') + 2
     
-    for iradius in option['tickrms']:
-        phi = th[np.where(radius >= iradius)]
-        if len(phi) != 0:
-            phi = phi[0]
-            ig = np.where(iradius*np.cos(th)+axes['dx'] <=
-                          axes['rmax']*np.cos(phi))
-            hhh = ax.plot(xunit[ig]*iradius+axes['dx'],yunit[ig]*iradius,
-                          linestyle = option['stylerms'],color = option['colrms'],
-                          linewidth = option['widthrms'])
-            if option['showlabelsrms'] == 'on':
-                rt = (iradius+option['rincrms']/20)
-                if option['tickrmsangle'] > 90:
-                    xtextpos = (rt + abs(cst)*axes['rinc']/5)*cst + axes['dx']
-                    ytextpos = (rt + abs(cst)*axes['rinc']/5)*snt
-                else:
-                    xtextpos = rt*cst + axes['dx']
-                    ytextpos = rt*snt
-
-                ax.text(xtextpos, ytextpos, labelFormat.format(iradius),
-                        horizontalalignment = 'center', verticalalignment = 'center',
-                        color = option['colrms'], rotation = tickRMSAngle - 90,
-                        fontsize = fontSize)
+    for i, radius in enumerate(rms['radius']):
+        hhh = _plot_arc(ax, 'taylor', option, partial(taylor_rms_arc, axes, radius),
+                        linestyle = option['stylerms'],color = option['colrms'],
+                        linewidth = option['widthrms'])
+        if option['showlabelsrms'] == 'on':
+            xtextpos, ytextpos = rms['labelxy'][i]
+            ax.text(xtextpos, ytextpos, rms['labels'][i],
+                    horizontalalignment = 'center', verticalalignment = 'center',
+                    color = option['colrms'], rotation = rms['angle'] - 90,
+                    fontsize = fontSize)
     
     # DRAW STD CIRCLES:
     # draw radial circles
+    std = taylor_std_arcs(option)
     grid_color = get_from_dict_or_default(option, 'colstd', 'colsstd', 'grid')
-    for i in option['tickstd']:
-        hhh = ax.plot(xunit*i, yunit*i,
-                      linestyle=option['stylestd'],
-                      color=grid_color,
-                      linewidth=option['widthstd'])
-        del i
+    for radius in std['radius']:
+        hhh = _plot_arc(ax, 'taylor', option, partial(taylor_std_arc, radius),
+                        linestyle=option['stylestd'],
+                        color=grid_color,
+                        linewidth=option['widthstd'])
+        del radius
 
     # Set tick values for axes
     tickValues = []
@@ -118,10 +88,10 @@ def overlay_taylor_diagram_circles(ax: matplotlib.axes.Axes, axes: dict,
     hhh[0].set_linestyle('-') # Make outermost STD circle solid
     
     # Draw circle for outer boundary
-    i = option['axismax']
-    hhh = ax.plot(xunit*i, yunit*i, 
-                  linestyle = option['stylestd'],
-                  color = grid_color,
-                  linewidth = option['widthstd'])
+    hhh = _plot_arc(ax, 'taylor', option,
+                    partial(taylor_std_arc, option['axismax']),
+                    linestyle = option['stylestd'],
+                    color = grid_color,
+                    linewidth = option['widthstd'])
 
     return None
\ No newline at end of file
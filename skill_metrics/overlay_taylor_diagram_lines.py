@@ -1,6 +1,6 @@
+from skill_metrics.diagram_geometry import taylor_cor_rays
 from skill_metrics.get_from_dict_or_default import get_from_dict_or_default
-import numpy as np
-import matplotlib
+import matplotlib.axes
 
 
 def overlay_taylor_diagram_lines(ax: matplotlib.axes.Axes, axes: dict,
@@ -40,41 +40,30 @@ def overlay_taylor_diagram_lines(ax: matplotlib.axes.Axes, axes: dict,
    '''
 
     # Get common information
-    corr = option['tickcor'][option['numberpanels']-1]
-    th  = np.arccos(corr)
-    cst, snt = np.cos(th), np.sin(th)
-    del th
+    cor = taylor_cor_rays(axes, option)
     
     # DRAW CORRELATION LINES EMANATING FROM THE ORIGIN:
-    cs = np.append(-1.0*cst, cst)
-    sn = np.append(-1.0*snt, snt)
     lines_col = get_from_dict_or_default(option, 'colcor', 'colscor', 'grid')
-    for i, val in enumerate(cs):
-        ax.plot([0, axes['rmax']*cs[i]],
-                 [0, axes['rmax']*sn[i]], 
+    for segment in cor['segments']:
+        ax.plot(segment[:,0],
+                 segment[:,1], 
                  linestyle = option['stylecor'],
                  color = lines_col,
                  linewidth = option['widthcor'])
-        del i, val
-    del lines_col, sn, cs
+        del segment
+    del lines_col
     
     # annotate them in correlation coefficient
     if option['showlabelscor'] == 'on':
         ticklabels_col = get_from_dict_or_default(option, 'colcor', 'colscor', 'tick_labels')
         fontSize = matplotlib.rcParams.get('font.size')
-        rt = 1.05 * axes['rmax']
-        for i, cc in enumerate(corr):
-            if option['numberpanels'] == 2:
-                x = (1.05+abs(cst[i])/30)*axes['rmax']*cst[i]
-            else:
-                x = rt*cst[i]
-            y = rt*snt[i]
+        for (x, y), label in zip(cor['labelxy'], cor['labels']):
             ax.text(x, y,
-                    str(round(cc, 2)),
+                    label,
                     horizontalalignment = 'center',
                     color = ticklabels_col,
                     fontsize = fontSize)
-            del i, cc
-        del fontSize, rt, ticklabels_col
+            del x, y, label
+        del fontSize, ticklabels_col
 
     return None
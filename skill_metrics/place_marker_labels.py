@@ -0,0 +1,181 @@
+from collections import defaultdict
+import math
+
+import matplotlib.axes
+import matplotlib.markers
+from matplotlib.font_manager import FontProperties
+from matplotlib.textpath import text_to_path
+import numpy as np
+
+# Candidate positions of a label relative to its marker in order of
+# preference, as (x direction, y direction, horizontal alignment, vertical
+# alignment). The first is the fixed position above and to the left of the
+# marker used when labels are not placed automatically.
+_CANDIDATES = ((-1, 1, 'right', 'bottom'), (1, 1, 'left', 'bottom'),
+               (-1, -1, 'right', 'top'), (1, -1, 'left', 'top'),
+               (-1, 0, 'right', 'center'), (1, 0, 'left', 'center'),
+               (0, 1, 'center', 'bottom'), (0, -1, 'center', 'top'))
+
+# Fractions of the width and height of a label to the left of and below its
+# anchor for each alignment
+_HALIGN = {'left': 0.0, 'center': 0.5, 'right': 1.0}
+_VALIGN = {'bottom': 0.0, 'center': 0.5, 'top': 1.0}
+
+def _get_candidate_offsets(width, height, gap) -> list:
+    '''
+    Return the offsets in pixels of the lower left corner of a label of size
+    WIDTH x HEIGHT from the center of its marker for each candidate
+    position.
+    '''
+    return [(dx*gap - _HALIGN[halign]*width, dy*gap - _VALIGN[valign]*height)
+            for dx, dy, halign, valign in _CANDIDATES]
+
+def _get_label_size(text: str, prop: FontProperties, advances: dict) -> tuple:
+    '''
+    Return the width and height in points of a single line of TEXT in the
+    font PROP, summing the advances of its characters held in the
+    dictionary ADVANCES for the font. The height is that of a line of text
+    as used by matplotlib.
+    '''
+    if len(advances) == 0:
+        advances[''] = text_to_path.get_text_width_height_descent('lp', prop,
+                                                                  ismath = False)[1]
+    width = 0.0
+    for char in text:
+        if char not in advances:
+            advances[char] = text_to_path.get_text_width_height_descent(
+                char, prop, ismath = False)[0]
+        width += advances[char]
+    return width, advances['']
+
+class _GridIndex(object):
+    '''
+    Spatial index of boxes in a uniform grid of square cells, each holding
+    the boxes that intersect it.
+    '''
+
+    def __init__(self, cellsize):
+        self.cellsize = cellsize
+        self.cells = defaultdict(list)
+
+    def _cells(self, box):
+        i0, j0 = math.floor(box[0]/self.cellsize), math.floor(box[1]/self.cellsize)
+        i1, j1 = math.floor(box[2]/self.cellsize), math.floor(box[3]/self.cellsize)
+        return ((i, j) for i in range(i0, i1 + 1) for j in range(j0, j1 + 1))
+
+    def insert(self, box) -> None:
+        for cell in self._cells(box):
+            self.cells[cell].append(box)
+
+    def intersects(self, box) -> bool:
+        '''
+        Return True if BOX intersects any box in the index.
+        '''
+        xmin, ymin, xmax, ymax = box
+        for cell in self._cells(box):
+            for other in self.cells.get(cell, ()):
+                if xmin < other[2] and other[0] < xmax and \
+                   ymin < other[3] and other[1] < ymax:
+                    return True
+        return False
+
+def place_marker_labels(ax: matplotlib.axes.Axes, markers: list, labels: list) -> int:
+    '''
+    Places the labels of markers on a pattern diagram to avoid collisions.
+
+    When many markers are labeled, the labels drawn at a fixed offset from
+    their markers overlap each other and the neighboring markers. This
+    function moves each label to one of eight candidate positions around
+    its marker: above left (the fixed position), above right, below left,
+    below right, left, right, above and below. The labels are placed in
+    turn, each at the first candidate position that does not overlap any
+    marker, any label already placed or the edge of the axes. A label with
+    no such position is left at its fixed position and is not avoided by
+    the labels placed after it. It is called by the
+    PLOT_PATTERN_DIAGRAM_MARKERS function when option['markerlabelplacement']
+    is 'auto'.
+
+    The boxes of the markers and placed labels are held in a spatial index
+    of uniform grid cells, so that each candidate position is only tested
+    against the boxes nearby, and a few thousand labels are placed in a
+    fraction of a second. The size of a label is measured from the advances
+    of the characters of its font without drawing it. The positions are
+    computed for the current size of the axes in the figure, and kept in
+    data coordinates when the figure is resized.
+
+    INPUTS:
+    ax      : matplotlib.axes.Axes object containing the markers and labels
+    markers : list of the Line2D handles of the markers, one for each point
+    labels  : list of the Text handles of the marker labels, one for each
+              point, or None where a point is not labeled
+
+    OUTPUTS:
+    noverlap : number of labels that could not be placed without overlap
+    '''
+    points = [(marker, label) for marker, label in zip(markers, labels)
+              if label is not None and label.get_visible() and marker.get_visible()]
+    if len(points) == 0: return 0
+
+    # Positions of the axes, markers and labeled markers in pixels
+    ax.apply_aspect()
+    transform = ax.transData
+    bounds = ax.get_window_extent().extents
+    centers = transform.transform([(marker.get_xdata()[0], marker.get_ydata()[0])
+                                   for marker in markers if marker.get_visible()])
+    anchors = transform.transform([(marker.get_xdata()[0], marker.get_ydata()[0])
+                                   for marker, label in points])
+    # Size of the markers in pixels, all drawn with the same symbol
+    pixels = ax.figure.dpi/72.0
+    marker = points[0][0]
+    style = matplotlib.markers.MarkerStyle(marker.get_marker())
+    extent = max(style.get_path().transformed(style.get_transform()).get_extents().size)
+    msize = (extent*marker.get_markersize() + marker.get_markeredgewidth())*pixels
+    gap = 0.5*msize
+
+    # Sizes of the labels in pixels from the font metrics
+    advances = defaultdict(dict)
+    sizes = []
+    for marker, label in points:
+        prop = label.get_fontproperties()
+        sizes.append(_get_label_size(label.get_text(), prop, advances[prop]))
+    sizes = pixels*np.array(sizes)
+
+    # Index markers in grid cells about the size of a label
+    extent = np.median(sizes, axis = 0)
+    index = _GridIndex(max(0.5*extent[0], extent[1], msize, 1.0))
+    for x, y in centers:
+        index.insert((x - 0.5*msize, y - 0.5*msize, x + 0.5*msize, y + 0.5*msize))
+
+    # Greedy placement of labels in order
+    noverlap = 0
+    placed = []
+    for (marker, label), (x, y), (width, height) in zip(points, anchors, sizes):
+        # Take first candidate position inside the axes without overlap
+        offsets = _get_candidate_offsets(width, height, gap)
+        for k, (dx, dy) in enumerate(offsets):
+            box = (x + dx, y + dy, x + dx + width, y + dy + height)
+            if box[0] >= bounds[0] and box[1] >= bounds[1] and \
+               box[2] <= bounds[2] and box[3] <= bounds[3] and \
+               not index.intersects(box):
+                break
+        else:
+            # Keep fixed position of label, leaving it out of the index to
+            # bound the number of boxes in crowded cells
+            noverlap += 1
+            continue
+
+        index.insert(box)
+        halign, valign = _CANDIDATES[k][2:]
+        placed.append((label, (box[0] + _HALIGN[halign]*width,
+                               box[1] + _VALIGN[valign]*height), halign, valign))
+
+    # Move labels to anchors in data coordinates
+    if len(placed) == 0: return noverlap
+    positions = transform.inverted().transform([anchor for label, anchor, halign, valign
+                                                in placed])
+    for (label, anchor, halign, valign), position in zip(placed, positions):
+        label.set_position(position)
+        label.set_horizontalalignment(halign)
+        label.set_verticalalignment(valign)
+
+    return noverlap
@@ -1,11 +1,10 @@
-import matplotlib
-import matplotlib.pyplot as plt
+import matplotlib.axes
 from matplotlib import rcParams
 from matplotlib import ticker
 import math
 
 def plot_pattern_diagram_colorbar(ax: matplotlib.axes.Axes, X, Y, Z,
-                                  option: dict) -> None:
+                                  option: dict):
     '''
     Plots color markers on a pattern diagram shaded according to a 
     supplied value.
@@ -41,7 +40,8 @@ def plot_pattern_diagram_colorbar(ax: matplotlib.axes.Axes, X, Y, Z,
     option['titleColorBar'] : title for the color bar
     
     OUTPUTS:
-    None.
+    hp : PathCollection handle returned by the scatter function
+    hc : Colorbar handle returned by the colorbar function
     
     Created on Nov 30, 2016
     Revised on Jan 1, 2019
@@ -58,15 +58,30 @@ def plot_pattern_diagram_colorbar(ax: matplotlib.axes.Axes, X, Y, Z,
             c defines the sequence of numbers to be mapped to colors 
               using the cmap and norm
     '''
-    fontSize = rcParams.get('font.size')
-    cxscale = fontSize/10 # scale color bar by font size
     markerSize = option['markersize']*8
 
-    hp = plt.scatter(X,Y, s=markerSize, c=Z, marker=option['cmap_marker'],
+    hp = ax.scatter(X,Y, s=markerSize, c=Z, marker=option['cmap_marker'],
                      cmap=option['cmap'], vmin=option['cmap_vmin'],
                      vmax=option['cmap_vmax'])
     hp.set_facecolor(hp.get_edgecolor())
     
+    # Add color bar to plot
+    hc = _add_colorbar(ax, hp, Z, option)
+
+    return hp, hc
+
+def _add_colorbar(ax, hp, Z, option):
+    '''
+    Add a color bar for the color shading of a plot.
+
+    Adds a color bar for the plot handle HP to the axes AX at the location
+    given by option['locationcolorbar'], with its range and tick labels
+    determined by option['colormap'] and the values Z. Returns the handle
+    of the color bar.
+    '''
+    fontSize = rcParams.get('font.size')
+    cxscale = fontSize/10 # scale color bar by font size
+
     # Set parameters for color bar location
     location = option['locationcolorbar'].lower()
     xscale= 1.0
@@ -90,7 +105,7 @@ def plot_pattern_diagram_colorbar(ax: matplotlib.axes.Axes, X, Y, Z,
     # Add color bar to plot
     if option['colormap'] == 'on':
         # map color shading of markers to colormap 
-        hc = plt.colorbar(hp,orientation = orientation, aspect = aspect,
+        hc = ax.figure.colorbar(hp,orientation = orientation, aspect = aspect,
                           fraction = fraction, pad=0.06, ax = ax)
 
         # Limit number of ticks on color bar to reasonable number
@@ -100,8 +115,8 @@ def plot_pattern_diagram_colorbar(ax: matplotlib.axes.Axes, X, Y, Z,
     elif option['colormap'] == 'off':
         # map color shading of markers to min to max range of Z values
         if len(Z) > 1:
-            ax.clim(min(Z), max(Z))
-            hc = ax.colorbar(hp,orientation = orientation, aspect = aspect,
+            hp.set_clim(min(Z), max(Z))
+            hc = ax.figure.colorbar(hp,orientation = orientation, aspect = aspect,
                             fraction = fraction, pad=0.06, ticks=[min(Z), max(Z)],
                             ax = ax)
             
@@ -132,7 +147,9 @@ def plot_pattern_diagram_colorbar(ax: matplotlib.axes.Axes, X, Y, Z,
             hc.set_label(option['titlecolorbar'],fontsize=fontSize, 
                          labelpad=labelpad, y=1.05, rotation=0)
     else:
-        hc.set_label(hc,'Color Scale',fontsize=fontSize)
+        hc.set_label('Color Scale',fontsize=fontSize)
+
+    return hc
 
 def _getColorBarLocation(hc,option,**kwargs):
     '''
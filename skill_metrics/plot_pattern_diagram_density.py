@@ -0,0 +1,92 @@
+import matplotlib.axes
+import numpy as np
+
+from skill_metrics.plot_pattern_diagram_colorbar import _add_colorbar
+
+def _get_density(kind: str, X, Y, option: dict) -> tuple:
+    '''
+    Bin points of a pattern diagram into a 2-D histogram.
+
+    The (X,Y) locations are counted in option['densitybins'] bins along each
+    axis of the diagram. Bins outside the disk of radius option['axismax'],
+    i.e. outside the quarter or half disk of a Taylor diagram or the outer
+    circle of a target diagram, and bins without any points are masked.
+
+    INPUTS:
+    kind   : type of diagram, 'taylor' or 'target'
+    X      : x-coordinates of points
+    Y      : y-coordinates of points
+    option : dictionary containing option values
+
+    OUTPUTS:
+    xedges : bin edges along x-axis
+    yedges : bin edges along y-axis
+    counts : masked array of number of points in each bin with shape
+             (len(yedges)-1, len(xedges)-1)
+    '''
+    limit = option['axismax']
+    nbins = option['densitybins']
+
+    # Set extent of diagram
+    if kind == 'taylor':
+        xmin = -limit if option['numberpanels'] == 2 else 0.0
+        ymin = 0.0
+    else:
+        xmin, ymin = -limit, -limit
+    xedges = np.linspace(xmin, limit, nbins + 1)
+    yedges = np.linspace(ymin, limit, nbins + 1)
+
+    counts = np.histogram2d(np.ravel(Y), np.ravel(X), bins = (yedges, xedges))[0]
+
+    # Mask bins outside disk and bins without any points
+    xcenter = 0.5*(xedges[:-1] + xedges[1:])
+    ycenter = 0.5*(yedges[:-1] + yedges[1:])
+    outside = np.hypot(xcenter[np.newaxis,:], ycenter[:,np.newaxis]) > limit
+    counts = np.ma.masked_where(outside | (counts == 0), counts)
+
+    return xedges, yedges, counts
+
+def plot_pattern_diagram_density(ax: matplotlib.axes.Axes, kind: str, X, Y,
+                                 option: dict):
+    '''
+    Plots the density of points on a pattern diagram.
+
+    Plots the number of points in bins of a 2-D histogram of their (X,Y)
+    locations on a Taylor or target diagram instead of individual markers.
+    The histogram is drawn as a single mesh shaded according to the number
+    of points in each bin, with the values indicated via a color bar on the
+    plot. The time to draw the diagram is therefore independent of the
+    number of points, making it suitable for very large numbers of points,
+    e.g. the statistics of every grid cell of a model.
+
+    The histogram has option['densitybins'] bins along each axis and is
+    clipped to the quarter or half disk of a Taylor diagram or the outer
+    circle of a target diagram. Bins without any points are not shaded.
+
+    The color range is controlled by option['colormap'] as described for
+    the PLOT_PATTERN_DIAGRAM_COLORBAR function, and the color bar is titled
+    using the content of option['titleColorBar'] (if non-empty string).
+
+    INPUTS:
+    ax     : matplotlib.axes.Axes object in which the diagram is plotted
+    kind   : type of diagram, 'taylor' or 'target'
+    X      : x-coordinates of points
+    Y      : y-coordinates of points
+    option : dictionary containing option values.
+    option['axismax']     : maximum for the X & Y values
+    option['densitybins'] : number of histogram bins along each axis
+
+    OUTPUTS:
+    hm : QuadMesh handle returned by the pcolormesh function
+    hc : Colorbar handle returned by the colorbar function
+    '''
+
+    xedges, yedges, counts = _get_density(kind, X, Y, option)
+
+    hm = ax.pcolormesh(xedges, yedges, counts, cmap=option['cmap'],
+                       vmin=option['cmap_vmin'], vmax=option['cmap_vmax'])
+
+    # Add color bar to plot
+    hc = _add_colorbar(ax, hm, counts.compressed(), option)
+
+    return hm, hc
@@ -2,12 +2,13 @@ from skill_metrics import get_from_dict_or_default
 from skill_metrics import add_legend
 from skill_metrics import get_default_markers
 from skill_metrics import get_single_markers
+from skill_metrics import place_marker_labels
 
 import matplotlib.colors as clr
-import matplotlib
+import matplotlib.axes
 import warnings
 
-def plot_pattern_diagram_markers(ax: matplotlib.axes.Axes, X, Y, option: dict):
+def plot_pattern_diagram_markers(ax: matplotlib.axes.Axes, X, Y, option: dict) -> tuple[list, list]:
     '''
     Plots color markers on a pattern diagram in the provided subplot axis.
     
@@ -32,9 +33,22 @@ def plot_pattern_diagram_markers(ax: matplotlib.axes.Axes, X, Y, option: dict):
     option['axismax'] : maximum for the X & Y values. Used to limit
         maximum distance from origin to display markers
     option['markerlabel'] : labels for markers
+    option['markerlabelplacement'] : 'fixed' or 'auto' placement of the
+        labels for markers (Refer to PLACE_MARKER_LABELS function)
     
     OUTPUTS:
-    None
+    markers : list of the Line2D plot handles of the markers, one for each
+              point. Markers outside the axis limits are hidden.
+    labels  : list of the Text handles of the marker labels, one for each
+              point, or None where a point is not labeled
+
+    Markers of points outside the axis limits are created hidden rather
+    than skipped, so that the UPDATE_POINTS method of the DiagramHandle
+    class can move them into view later. They are not drawn, but remain in
+    ax.lines. When option['markerlegend'] is 'off' and option['markerlabel']
+    is a list, the labels of these points are also created hidden and
+    remain in ax.texts. Code iterating over the artists of the axes should
+    check their get_visible().
 
     Authors:
     Peter A. Rochford
@@ -68,6 +82,10 @@ def plot_pattern_diagram_markers(ax: matplotlib.axes.Axes, X, Y, option: dict):
             raise ValueError('Insufficient number of marker labels provided.\n' +
                              'target: No. labels=' + str(numberLabel) + ' > No. markers= 70')
     
+    # Plot handles for each marker and its text label
+    markers = []
+    labels = [None]*len(X)
+
     if option['markerlegend'] == 'on':
         # Check that marker labels have been provided
         if option['markerlabel'] == '' and option['markers'] == None:
@@ -82,40 +100,45 @@ def plot_pattern_diagram_markers(ax: matplotlib.axes.Axes, X, Y, option: dict):
             # Define default markers (function)
             marker, markercolor = get_default_markers(X, option)
         
-            # Plot markers at data points
+            # Plot markers at data points, hiding those outside axis limits
             labelcolor = []
             markerlabel = []
             for i, xval in enumerate(X):
-                if abs(X[i]) <= limit and abs(Y[i]) <= limit:
-                    h = ax.plot(X[i],Y[i],marker[i], markersize = markerSize,
-                         markerfacecolor = markercolor[i],
-                         markeredgecolor = markercolor[i][0:3] + (1.0,),
-                         markeredgewidth = 2)
+                inrange = abs(X[i]) <= limit and abs(Y[i]) <= limit
+                h = ax.plot(X[i],Y[i],marker[i], markersize = markerSize,
+                     markerfacecolor = markercolor[i],
+                     markeredgecolor = markercolor[i][0:3] + (1.0,),
+                     markeredgewidth = 2, visible = inrange)
+                markers.append(h[0])
+                if inrange:
                     hp += tuple(h)
                     labelcolor.append(option['markerlabelcolor'])
                     markerlabel.append(option['markerlabel'][i])
 
         else:
             # Obtain markers from option['markers']
-            labels, labelcolor, marker, markersize, markerfacecolor, markeredgecolor = \
-                get_single_markers(option['markers'])
+            markerlabels, labelcolor, marker, markersize, markerfacecolor, \
+                markeredgecolor = get_single_markers(option['markers'])
         
-            # Plot markers at data points
+            # Plot markers at data points, hiding those outside axis limits
             markerlabel = []
             for i, xval in enumerate(X):
-                if abs(X[i]) <= limit and abs(Y[i]) <= limit:
-                    h = ax.plot(X[i],Y[i],marker[i], markersize = markersize[i],
-                         markerfacecolor = markerfacecolor[i],
-                         markeredgecolor = markeredgecolor[i],
-                         markeredgewidth = 2)
+                inrange = abs(X[i]) <= limit and abs(Y[i]) <= limit
+                h = ax.plot(X[i],Y[i],marker[i], markersize = markersize[i],
+                     markerfacecolor = markerfacecolor[i],
+                     markeredgecolor = markeredgecolor[i],
+                     markeredgewidth = 2, visible = inrange)
+                markers.append(h[0])
+                if inrange:
                     hp += tuple(h)
-                    markerlabel.append(labels[i])
+                    markerlabel.append(markerlabels[i])
 
         # Add legend
         if len(markerlabel) == 0:
             warnings.warn('No markers within axis limit ranges.')
         else:
-            add_legend(markerlabel, labelcolor, option, rgba, markerSize, fontSize, hp)
+            add_legend(markerlabel, labelcolor, option, rgba, markerSize, fontSize, hp,
+                       ax = ax)
     else:
         # Plot markers as dots of a single color with accompanying labels
 
@@ -137,30 +160,40 @@ def plot_pattern_diagram_markers(ax: matplotlib.axes.Axes, X, Y, option: dict):
         labelcolor = []
         for i in range(len(X)):
             xval, yval = X[i], Y[i]
-            if abs(xval) <= limit and abs(yval) <= limit:
-                # Plot marker
-                ax.plot(xval, yval, option['markersymbol'],
+            inrange = abs(xval) <= limit and abs(yval) <= limit
+
+            # Plot marker, hiding it if outside axis limits
+            h = ax.plot(xval, yval, option['markersymbol'],
                         markersize=markerSize,
                         markerfacecolor=face_color,
-                        markeredgecolor=edge_color)
-                labelcolor.append(option['markerlabelcolor'])
-                
-                # Check if marker labels provided
-                if type(option['markerlabel']) is list:
-                    # Label marker
-                    ax.text(xval-xoffset, yval, option['markerlabel'][i],
-                            color=option['markerlabelcolor'],
-                            verticalalignment='bottom',
-                            horizontalalignment='right',
-                            fontsize=fontSize)
+                        markeredgecolor=edge_color, visible=inrange)
+            markers.append(h[0])
+            if inrange: labelcolor.append(option['markerlabelcolor'])
+
+            # Check if marker labels provided
+            if type(option['markerlabel']) is list:
+                # Label marker
+                labels[i] = ax.text(xval-xoffset, yval, option['markerlabel'][i],
+                                    color=option['markerlabelcolor'],
+                                    verticalalignment='bottom',
+                                    horizontalalignment='right',
+                                    fontsize=fontSize, visible=inrange)
 
             del i, xval, yval
 
+        # Move labels to avoid overlaps if requested
+        if type(option['markerlabel']) is list and \
+                option['markerlabelplacement'] == 'auto':
+            place_marker_labels(ax, markers, labels)
+
         # Add legend if labels provided as dictionary
         markerlabel = option['markerlabel']
         marker_label_color = clr.to_rgb(edge_color) + (alpha,)
         if type(markerlabel) is dict:
-            add_legend(markerlabel, labelcolor, option, marker_label_color, markerSize, fontSize)
+            add_legend(markerlabel, labelcolor, option, marker_label_color, markerSize,
+                       fontSize, ax = ax)
+
+    return markers, labels
 
 
 def _disp(text):
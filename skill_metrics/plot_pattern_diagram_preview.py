@@ -0,0 +1,219 @@
+from matplotlib.collections import LineCollection, PathCollection
+import matplotlib.axes
+import matplotlib.colors
+import matplotlib.markers
+from matplotlib.transforms import IdentityTransform
+import numpy as np
+
+from skill_metrics.diagram_arcs import _get_arc_scale
+from skill_metrics.diagram_geometry import get_target_diagram_geometry
+from skill_metrics.diagram_geometry import get_taylor_diagram_geometry
+from skill_metrics.diagram_geometry import taylor_axes
+from skill_metrics.diagram_handle import DiagramHandle
+from skill_metrics.diagram_markers import _get_markers
+from skill_metrics.get_from_dict_or_default import get_from_dict_or_default
+
+def _get_preview_scale(ax: matplotlib.axes.Axes, kind: str, option: dict):
+    '''
+    Get the number of pixels per data unit of the circles of a preview. The
+    axes of a preview fill their position without any layout, so the scale
+    is final once allowing for a higher resolution when saving the figure.
+    '''
+    scale = _get_arc_scale(ax, kind, option)
+    savedpi = matplotlib.rcParams['savefig.dpi']
+    if scale is not None and isinstance(savedpi, (int, float)) and \
+       savedpi > ax.figure.dpi:
+        scale *= savedpi/ax.figure.dpi
+
+    return scale
+
+def _get_taylor_lines(geometry: dict, option: dict) -> list:
+    '''
+    Return the lines of the grid of a Taylor diagram as a list of
+    (segment, color, linewidth, linestyle) tuples.
+    '''
+    lines = []
+    for arc in geometry['rms']['arcs']:
+        lines.append((arc, option['colrms'], option['widthrms'], option['stylerms']))
+
+    std = geometry['std']
+    grid_color = get_from_dict_or_default(option, 'colstd', 'colsstd', 'grid')
+    for i, arc in enumerate(std['arcs']):
+        # Make outermost STD circle solid
+        style = '-' if i == len(std['arcs']) - 1 else option['stylestd']
+        lines.append((arc, grid_color, option['widthstd'], style))
+    lines.append((std['boundary'], grid_color, option['widthstd'], option['stylestd']))
+
+    lines_col = get_from_dict_or_default(option, 'colcor', 'colscor', 'grid')
+    for segment in geometry['cor']['segments']:
+        lines.append((segment, lines_col, option['widthcor'], option['stylecor']))
+
+    # Axes of the diagram
+    rmax = geometry['axes']['rmax']
+    xmin = -rmax if option['numberpanels'] == 2 else 0.0
+    lines.append((np.array([[xmin, 0.0], [rmax, 0.0]]), 'k', 1.0, '-'))
+    if option['numberpanels'] == 1:
+        lines.append((np.array([[0.0, 0.0], [0.0, rmax]]), 'k', 1.0, '-'))
+
+    if option['styleobs'] != '':
+        lines.append((geometry['obs'], option['colobs'], option['widthobs'],
+                      option['styleobs']))
+
+    return lines
+
+def _get_target_lines(geometry: dict, option: dict) -> list:
+    '''
+    Return the circles and axes of a target diagram as a list of
+    (segment, color, linewidth, linestyle) tuples.
+    '''
+    lines = []
+    circles = geometry['circles']
+    if circles['reference'] is not None:
+        lines.append((circles['reference'], 'k', option['circlelinewidth'], '-'))
+    for arc in circles['arcs']:
+        lines.append((arc, option['circlecolor'], option['circlelinewidth'],
+                      option['circlestyle']))
+    if circles['uncertainty'] is not None:
+        lines.append((circles['uncertainty'], 'b', 1.0, '--'))
+
+    if option['overlay'] == 'off':
+        # Axes through origin
+        xtick, ytick = geometry['axes']['xtick'], geometry['axes']['ytick']
+        lines.append((np.array([[xtick[0], 0.0], [xtick[-1], 0.0]]), 'k', 1.0, '-'))
+        lines.append((np.array([[0.0, ytick[0]], [0.0, ytick[-1]]]), 'k', 1.0, '-'))
+
+    return lines
+
+def _add_markers(ax: matplotlib.axes.Axes, X, Y, symbol, size, facecolor,
+                 edgecolor = 'face', **kwargs) -> PathCollection:
+    '''
+    Add markers of a single SYMBOL at (X,Y) to AX as a PathCollection,
+    without the processing of the arguments done by the scatter function.
+    Unfilled markers are drawn in the face color.
+    '''
+    marker = matplotlib.markers.MarkerStyle(symbol)
+    path = marker.get_path().transformed(marker.get_transform())
+    if not marker.is_filled():
+        facecolor, edgecolor = 'none', facecolor
+    collection = PathCollection([path], sizes = [size], facecolors = facecolor,
+                                edgecolors = edgecolor,
+                                linewidths = [matplotlib.rcParams['lines.linewidth']],
+                                offsets = np.column_stack((X, Y)),
+                                offset_transform = ax.transData, **kwargs)
+    collection.set_transform(IdentityTransform())
+    return ax.add_collection(collection, autolim = False)
+
+def _plot_preview_points(ax: matplotlib.axes.Axes, kind: str, X, Y, Z,
+                         option: dict) -> tuple:
+    '''
+    Plot the data points of a preview as a single collection, returning
+    the scatter and mesh handles.
+    '''
+    lowcase = option['markerdisplayed'].lower()
+    size = option['markersize']**2
+
+    if lowcase == 'marker':
+        # Use colors of markers, but the symbol of the first marker
+        markers = _get_markers(X, Y, option)[0]
+        facecolor = [marker['facecolor'] if marker['alpha'] is None else
+                     matplotlib.colors.to_rgba(marker['facecolor'], marker['alpha'])
+                     for marker in markers]
+        edgecolor = [marker['edgecolor'] for marker in markers]
+        symbol = markers[0]['symbol'] if len(markers) > 0 else 'o'
+        scatter = _add_markers(ax, X, Y, symbol, size, facecolor, edgecolor)
+        return scatter, None
+    elif lowcase == 'colorbar':
+        # Color shading of markers without a color bar
+        Z = np.asarray(Z, dtype = float)
+        if option['colormap'] == 'off':
+            vmin, vmax = None, None
+        else:
+            vmin, vmax = option['cmap_vmin'], option['cmap_vmax']
+        scatter = _add_markers(ax, X, Y, option['cmap_marker'], size, None,
+                               cmap = option['cmap'],
+                               norm = matplotlib.colors.Normalize(vmin, vmax))
+        scatter.set_array(Z)
+        return scatter, None
+    elif lowcase == 'density':
+        from skill_metrics.plot_pattern_diagram_density import _get_density
+
+        # Density of points without a color bar
+        xedges, yedges, counts = _get_density(kind, X, Y, option)
+        mesh = ax.pcolormesh(xedges, yedges, counts, cmap = option['cmap'],
+                             vmin = option['cmap_vmin'], vmax = option['cmap_vmax'])
+        return None, mesh
+    else:
+        raise ValueError('Unrecognized option: ' + option['markerdisplayed'])
+
+def plot_pattern_diagram_preview(ax: matplotlib.axes.Axes, kind: str,
+                                 statistics: tuple, option: dict) -> DiagramHandle:
+    '''
+    Plots a fast, low-resolution preview of a Taylor or target diagram.
+
+    Draws a simplified diagram for thumbnails, e.g. for gallery pages of
+    many diagrams, where the time to draw the full diagram dominates. All
+    text (tick labels, axis titles, marker labels, legend and color bar) is
+    omitted, the grid is drawn as a single LineCollection with circles
+    sampled at a resolution adapted to the size of the axes, and the data
+    points are drawn as a single collection. The axes fill their position
+    in the figure without any frame. It is called by the TAYLOR_DIAGRAM and
+    TARGET_DIAGRAM functions when option['preview'] is 'on'. Markers
+    outside the axis limits are clipped rather than hidden.
+
+    In 'marker' mode the points keep their colors but are all drawn with
+    the symbol of the first point.
+
+    INPUTS:
+    ax         : matplotlib.axes.Axes object in which the diagram is plotted
+    kind       : type of diagram, 'taylor' or 'target'
+    statistics : tuple of the statistics (STDs,RMSs,CORs) of a Taylor
+                 diagram or (Bs,RMSDs,RMSDz) of a target diagram, as
+                 described for the TAYLOR_DIAGRAM or TARGET_DIAGRAM function
+    option     : dictionary containing option values as returned by the
+                 GET_TAYLOR_DIAGRAM_OPTIONS or GET_TARGET_DIAGRAM_OPTIONS
+                 function
+
+    OUTPUTS:
+    handle : DiagramHandle object holding the artists of the preview
+    '''
+
+    if kind == 'taylor':
+        STDs, RMSs, CORs = statistics
+        axes = taylor_axes(STDs, option)
+        geometry = get_taylor_diagram_geometry(STDs, CORs, option, axes,
+                                               _get_preview_scale(ax, kind, option))
+        lines = _get_taylor_lines(geometry, option) if option['overlay'] == 'off' else []
+        # Note that only rho[1:N] and theta[1:N] are plotted.
+        Z = RMSs[1:] if len(option['cmapzdata']) == 0 else option['cmapzdata'][1:]
+        rmax = axes['rmax']
+        xlim = (-rmax if option['numberpanels'] == 2 else 0.0, rmax)
+        ylim = (0.0, rmax)
+    else:
+        from skill_metrics.get_target_diagram_axes import get_target_diagram_axes
+
+        Bs, RMSDs, RMSDz = statistics
+        axes = get_target_diagram_axes(RMSDs, Bs, option)
+        geometry = get_target_diagram_geometry(Bs, RMSDs, option, axes,
+                                               _get_preview_scale(ax, kind, option))
+        lines = _get_target_lines(geometry, option)
+        Z = RMSDz if len(option['cmapzdata']) == 0 else option['cmapzdata']
+        xlim = (axes['xtick'][0], axes['xtick'][-1])
+        ylim = (axes['ytick'][0], axes['ytick'][-1])
+
+    grid = []
+    if len(lines) > 0:
+        segments, colors, widths, styles = zip(*lines)
+        grid.append(ax.add_collection(LineCollection(segments, colors = colors,
+                                                     linewidths = widths,
+                                                     linestyles = list(styles)),
+                                      autolim = False))
+
+    X, Y = geometry['points'][:,0], geometry['points'][:,1]
+    scatter, mesh = _plot_preview_points(ax, kind, X, Y, Z, option)
+
+    ax.set_xlim(xlim)
+    ax.set_ylim(ylim)
+    ax.set_aspect('equal', adjustable = 'box')
+    ax.set_axis_off()
+
+    return DiagramHandle(ax, kind, axes, option, grid, scatter = scatter, mesh = mesh)
@@ -1,7 +1,6 @@
-import matplotlib.pyplot as plt
 from matplotlib import rcParams
 from matplotlib.ticker import ScalarFormatter
-import matplotlib
+import matplotlib.axes
 
 def plot_target_axes(ax: matplotlib.axes.Axes, axes: dict) -> list:
     '''
@@ -1,7 +1,7 @@
 from matplotlib import rcParams
 from skill_metrics.get_axis_tick_label import get_axis_tick_label
 from skill_metrics import get_from_dict_or_default
-import matplotlib
+import matplotlib.axes
 import numpy as np
 
 def plot_taylor_axes(ax: matplotlib.axes.Axes, axes: dict, option: dict) \
@@ -1,5 +1,7 @@
-import numpy as np
-import matplotlib
+from skill_metrics.diagram_arcs import _plot_arc
+from skill_metrics.diagram_geometry import circle
+from functools import partial
+import matplotlib.axes
 
 def plot_taylor_obs(ax: matplotlib.axes.Axes, axes_handle: list, obsSTD,
                        axes_info: dict, option: dict) -> None:
@@ -58,8 +60,6 @@ def plot_taylor_obs(ax: matplotlib.axes.Axes, axes_handle: list, obsSTD,
     
     if option['styleobs'] != '':
         # Draw circle for observation STD
-        theta = np.arange(0, 2*np.pi, np.pi/150)
-        xunit = obsSTD*np.cos(theta)
-        yunit = obsSTD*np.sin(theta)
-        ax.plot(xunit,yunit,linestyle=option['styleobs'],
-                 color = option['colobs'],linewidth = option['widthobs'])
+        _plot_arc(ax, 'taylor', option, partial(circle, obsSTD),
+                  linestyle=option['styleobs'],
+                  color = option['colobs'],linewidth = option['widthobs'])
@@ -0,0 +1,64 @@
+import matplotlib.text
+
+def rasterize_diagram(handle) -> list:
+    '''
+    Rasterize the grid and/or markers of a Taylor or target diagram.
+
+    Vector output (PDF, SVG, PS) of diagrams with dense grids or many
+    markers can be very large and slow to display. This function renders
+    the selected artists of the diagram as a bitmap embedded in the vector
+    output, while the text, tick labels and axes remain vectors. It is
+    called by the TAYLOR_DIAGRAM and TARGET_DIAGRAM functions according to
+    the 'rasterize' option.
+
+    The artists are rasterized in place, so that they keep their stacking
+    order, and consecutive rasterized artists are drawn as a single bitmap.
+    The markers are only rasterized when their number reaches
+    option['rasterthreshold'].
+
+    The rasterized artists are drawn at the resolution of the saved figure,
+    i.e. the dpi argument of savefig or else rcParams['savefig.dpi'], e.g.
+    plt.savefig('taylor.pdf', dpi = 300). Rasterization has no effect on
+    bitmap output, e.g. PNG.
+
+    Rasterizing only the grid ('grid') does not make files smaller: the
+    bitmap of the grid is slightly larger than its few vector lines (about
+    6% for a Taylor diagram with 3000 markers saved to PDF). Use 'markers'
+    or 'all' to reduce the size of files of diagrams with many markers.
+
+    INPUTS:
+    handle : DiagramHandle object returned by the TAYLOR_DIAGRAM or
+             TARGET_DIAGRAM function
+    handle.options['rasterize']       : 'off', 'grid', 'markers' or 'all'
+    handle.options['rasterthreshold'] : minimum number of markers to
+                                        rasterize them
+
+    OUTPUTS:
+    artists : list of artists rasterized
+    '''
+    option = handle.options
+    rasterize = option['rasterize']
+    artists = []
+    if rasterize == 'off': return artists
+
+    if rasterize in ('grid', 'all'):
+        # Rasterize grid lines and circles, keeping the text of the grid as
+        # vectors
+        grid = [artist for artist in handle.grid
+                if not isinstance(artist, matplotlib.text.Text)]
+        for artist in grid: artist.set_rasterized(True)
+        artists += grid
+
+    if rasterize in ('markers', 'all'):
+        if handle.mesh is not None:
+            markers, npoints = [handle.mesh], handle.mesh.get_array().size
+        elif handle.scatter is not None:
+            markers = [handle.scatter]
+            npoints = len(handle.scatter.get_offsets())
+        else:
+            markers, npoints = handle.markers, len(handle.markers)
+        if npoints >= option['rasterthreshold']:
+            for artist in markers: artist.set_rasterized(True)
+            artists += markers
+
+    return artists
@@ -0,0 +1,74 @@
+import json
+import os
+
+import numpy as np
+
+from skill_metrics.write_dataset import _FORMAT, _MANIFEST, _VERSION
+
+def _read_entry(dirname: str, entry: dict, mmap: bool):
+    '''
+    Return the value of the ENTRY of the manifest of a dataset, memory
+    mapping the files of its arrays if MMAP is True.
+    '''
+    if entry['type'] == 'group':
+        return {name: _read_entry(dirname, item, mmap)
+                for name, item in entry['items'].items()}
+    if entry['type'] == 'array':
+        filename = os.path.join(dirname, entry['file'])
+        if mmap and np.prod(entry['shape']) > 0:
+            return np.load(filename, mmap_mode = 'r', allow_pickle = False)
+        return np.load(filename, allow_pickle = False)
+    return entry['value']
+
+def read_dataset(dirname, key = None, mmap = True):
+    '''
+    Read a dataset from a directory written by the WRITE_DATASET function.
+
+    Reads the dataset in directory DIRNAME, or only its entry KEY, and
+    returns the data as dictionaries of arrays and values. Objects that were
+    written, such as a Container of dictionaries, are returned as
+    dictionaries of their attributes, e.g. data['ref']['data'] for the
+    attribute data.ref['data']. The entry KEY is given by the keys leading
+    to it separated by '/', e.g. 'ref' for the dictionary of the reference
+    data or 'ref/data' for the array of its data.
+
+    The arrays are memory mapped by default, so that reading them is
+    immediate whatever their size: only the parts of an array that are
+    used are read from disk, e.g. the values of a single station.
+
+    INPUTS:
+    dirname : name of dataset directory
+    key     : key of the entry to read, or None to read the whole dataset
+              (Default: None)
+    mmap    : boolean flag to memory map the arrays as read-only arrays
+              rather than reading them into memory (Default: True)
+
+    OUTPUTS:
+    data : dictionary of the data of the dataset, or the value of the
+           entry KEY
+    '''
+
+    # Check if dataset exists
+    filename = os.path.join(dirname, _MANIFEST)
+    if not os.path.isfile(filename):
+        raise ValueError('Dataset does not exist: ' + dirname)
+
+    with open(filename) as file:
+        manifest = json.load(file)
+    if not isinstance(manifest, dict) or manifest.get('format') != _FORMAT:
+        raise ValueError('Directory does not contain a dataset: ' + dirname)
+    if not isinstance(manifest.get('version'), int) or \
+       manifest['version'] > _VERSION:
+        raise ValueError('Dataset ' + dirname + ' has version ' +
+                         str(manifest.get('version')) + ', this package reads ' +
+                         'versions up to ' + str(_VERSION))
+
+    # Find entry of key
+    entry = manifest['data']
+    if key is not None:
+        for name in key.strip('/').split('/'):
+            if entry['type'] != 'group' or not name in entry['items']:
+                raise ValueError('Entry not in dataset ' + dirname + ': ' + key)
+            entry = entry['items'][name]
+
+    return _read_entry(dirname, entry, mmap)
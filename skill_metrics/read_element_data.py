@@ -0,0 +1,135 @@
+import os
+import re
+
+import numpy as np
+import pandas as pd
+
+# Types of the standard columns of observation and prediction files
+_DTYPES = {'data': np.float64, 'latitude': np.float64, 'longitude': np.float64,
+           'depth': np.float64, 'jday': np.float64, 'station': str, 'units': str}
+
+# Column header with units, e.g. 'data (cell/L)'
+_UNITS_HEADER = re.compile(r'^\s*(.*?)\s*\((.*)\)\s*$')
+
+def _get_header_names(filename: str) -> tuple:
+    '''
+    Return the column headers of a CSV file, their names without units and
+    the units given in the headers, e.g. 'data' and 'cell/L' for the header
+    'data (cell/L)'.
+    '''
+    headers = list(pd.read_csv(filename, nrows = 0).columns)
+    names, units = [], {}
+    for header in headers:
+        match = _UNITS_HEADER.match(header)
+        if match is None:
+            names.append(header.strip())
+        else:
+            names.append(match.group(1))
+            units[match.group(1)] = match.group(2)
+    return headers, names, units
+
+def _get_columns(frame: pd.DataFrame, names: dict, units: dict,
+                 filename: str) -> dict:
+    '''
+    Return the columns of the data FRAME as arrays by their NAMES, and the
+    UNITS of the columns, including those of the data given in a column of
+    units.
+    '''
+    columns = {names[header]: frame[header].to_numpy() for header in frame.columns}
+    units = dict(units)
+    if 'units' in columns:
+        values = pd.unique(columns.pop('units'))
+        if len(values) > 1:
+            raise ValueError('Units vary within file ' + filename + ': ' +
+                             ', '.join(map(str, values)))
+        if len(values) == 1: units.setdefault('data', values[0])
+    columns['units'] = units
+    return columns
+
+def read_element_data(name, usecols = None, dtype = None, chunksize = None):
+    '''
+    Read observation or prediction data from a Comma Separated Value (CSV)
+    file into typed columns.
+
+    Each column of the file is returned as a NumPy array rather than a list,
+    so that it is held in the compact form expected by the statistics
+    functions, e.g. TAYLOR_STATISTICS and TARGET_STATISTICS, which use the
+    arrays without copying them. The standard columns have fixed types:
+    data, latitude, longitude, depth and jday are float64 arrays, station
+    is an array of strings. The types of other columns are inferred.
+
+    The units of the columns are returned as metadata in a dictionary
+    rather than as a column. They are taken from a units column, which
+    must hold a single value giving the units of the data, or from the
+    column headers, e.g. 'data (cell/L)', in which case the units are
+    removed from the column name. An example of the format of a CSV file
+    is
+
+    data        latitude    longitude    depth    jday            units
+    52.9110002  43.161833   -69.576667   -1       3045.255556     cell/L
+    1.431675565 43.161833   -69.576667   -10      3045.255556     cell/L
+    ...
+    0.360104567 42.964333   -69.7645     -30      3045.979861     cell/L
+
+    The data are returned as
+
+    data['data']     = array([52.9110002, 1.431675565, ..., 0.360104567])
+    data['latitude'] = array([43.161833, 43.161833, ..., 42.964333])
+    ...
+    data['units']    = {'data': 'cell/L'}
+
+    INPUTS:
+    name      : name of CSV file with or without suffix, e.g. pred1.csv or
+                pred1
+    usecols   : list of the names of the columns to read, without their
+                units, or None to read all the columns (Default: None)
+    dtype     : dictionary of the types of columns, e.g. {'data': np.float32},
+                replacing the standard types (Default: None)
+    chunksize : number of rows to read at a time, or None to read the whole
+                file (Default: None)
+
+    OUTPUTS:
+    data : dictionary of an array of the values of each column, with the
+           dictionary of the units of the columns under the key 'units', or
+           with CHUNKSIZE an iterator over such dictionaries for each chunk
+           of rows
+    '''
+
+    # Check if CSV file suffix
+    file_name, file_extension = os.path.splitext(name)
+    if file_extension == '':
+        filename = name + '.csv'
+    elif file_extension == '.csv':
+        filename = name
+    else:
+        raise ValueError('Invalid file type: ' + name)
+
+    # Check if file exists
+    if not os.path.isfile(filename):
+        raise ValueError('File does not exist: ' + filename)
+
+    # Select the columns and their types by their names without units
+    headers, names, units = _get_header_names(filename)
+    columns = list(zip(headers, names))
+    if usecols is not None:
+        missing = [column for column in usecols if not column in names]
+        if len(missing) > 0:
+            raise ValueError('Columns not in file ' + filename + ': ' +
+                             ', '.join(missing))
+        columns = [(header, column) for header, column in columns
+                   if column in usecols]
+    headers = [header for header, column in columns]
+    names = dict(columns)
+    units = {column: unit for column, unit in units.items()
+             if column in names.values()}
+
+    types = dict(_DTYPES)
+    if dtype is not None: types.update(dtype)
+    types = {header: types[column] for header, column in names.items()
+             if column in types}
+
+    frames = pd.read_csv(filename, usecols = headers, dtype = types,
+                         chunksize = chunksize)
+    if chunksize is None:
+        return _get_columns(frames, names, units, filename)
+    return (_get_columns(frame, names, units, filename) for frame in frames)
@@ -0,0 +1,221 @@
+import csv
+import json
+import os
+import re
+import threading
+
+# Options holding lists of numbers
+_LIST_KEYS = {'circles', 'cmapzdata', 'rincrms', 'rincstd', 'tickcor', 'tickrms',
+              'tickstd'}
+
+# Options holding colors, given as a color name or an RGB tuple
+_TUPLE_KEYS = {'colcor', 'colrms', 'colstd'}
+
+# Options kept as strings
+_STRING_KEYS = {'rmslabelformat'}
+
+# Suffixes of the supported formats
+_FORMATS = ('.csv', '.json', '.toml')
+
+# Parsed options files by absolute path, with their modification time and size
+_cache = {}
+_cache_lock = threading.Lock()
+
+def _is_int(text: str) -> bool:
+    try:
+        int(text)
+        return True
+    except ValueError:
+        return False
+
+def _is_float(text: str) -> bool:
+    try:
+        float(text)
+        return True
+    except ValueError:
+        return False
+
+def _parse_scalar(text: str):
+    '''
+    Convert TEXT to an int, float or None if it represents one, otherwise
+    return it as a string.
+    '''
+    if _is_int(text):
+        return int(text)
+    elif _is_float(text):
+        return float(text)
+    elif text == 'None':
+        return None
+    else:
+        return text
+
+def _parse_numbers(key: str, value) -> list:
+    '''
+    Convert VALUE to a list of floats. A string may hold numbers separated
+    by commas and/or spaces, optionally enclosed in brackets.
+    '''
+    if isinstance(value, str):
+        value = re.split(r'[\s,]+', value.replace('[', ' ').replace(']', ' ').strip())
+        value = [] if value == [''] else value
+    elif not isinstance(value, (list, tuple)):
+        value = [value]
+    try:
+        return [float(x) for x in value]
+    except (TypeError, ValueError):
+        raise ValueError('Invalid ' + key + ', expected list of numbers: ' + str(value))
+
+def _parse_color(key: str, value):
+    '''
+    Convert VALUE to a color name or a tuple of numbers, e.g. '0, .6, 0'
+    or '(0, .6, 0)' to (0, 0.6, 0).
+    '''
+    if isinstance(value, (list, tuple)):
+        items = list(value)
+    else:
+        items = [item.strip() for item in
+                 str(value).strip().strip('()[]').split(',')]
+        if len(items) == 1:
+            # Color name, with or without quotes
+            color = items[0].strip('\'"')
+            import matplotlib.colors
+            if not matplotlib.colors.is_color_like(color):
+                raise ValueError('Invalid ' + key + ': ' + str(value))
+            return color
+        if not all(_is_float(item) for item in items):
+            raise ValueError('Invalid ' + key + ': ' + str(value))
+        items = [_parse_scalar(item) for item in items]
+    if not all(isinstance(item, (int, float)) and not isinstance(item, bool)
+               for item in items):
+        raise ValueError('Invalid ' + key + ': ' + str(value))
+    return tuple(items)
+
+def _parse_text(key: str, text: str):
+    '''
+    Convert the string TEXT read from a CSV file to the value of option KEY.
+    '''
+    if key in _LIST_KEYS:
+        return _parse_numbers(key, text)
+    elif key in _TUPLE_KEYS:
+        return _parse_color(key, text)
+    elif key in _STRING_KEYS:
+        return text
+    elif text.startswith('[') and text.endswith(']'):
+        items = [item.strip() for item in text[1:-1].split(',')]
+        return [] if items == [''] else [_parse_scalar(item) for item in items]
+    else:
+        return _parse_scalar(text)
+
+def _parse_typed(key: str, value):
+    '''
+    Convert the VALUE read from a JSON or TOML file to the value of option
+    KEY.
+    '''
+    if key in _LIST_KEYS:
+        return _parse_numbers(key, value)
+    elif key in _TUPLE_KEYS:
+        return _parse_color(key, value)
+    else:
+        return value
+
+def _read_csv(filename: str) -> dict:
+    '''
+    Read options from a CSV file with a header row, the option names in
+    the first column and their values in the second. Options with an
+    empty or 'None' value are skipped.
+    '''
+    options = {}
+    with open(filename, newline = '', encoding = 'utf-8-sig') as file:
+        rows = csv.reader(file)
+        next(rows, None)
+        for row in rows:
+            if len(row) < 2 or row[0].strip() == '': continue
+            key, text = row[0].strip().lower(), row[1].strip()
+            if text in ('', 'None'): continue
+            options[key] = _parse_text(key, text)
+    return options
+
+def _read_mapping(filename: str, format: str) -> dict:
+    '''
+    Read options from a JSON object or the top-level table of a TOML file.
+    '''
+    if format == '.json':
+        with open(filename, encoding = 'utf-8-sig') as file:
+            data = json.load(file)
+    else:
+        try:
+            import tomllib
+        except ImportError:
+            try:
+                import tomli as tomllib
+            except ImportError:
+                raise ImportError('Reading TOML options files requires Python 3.11 ' +
+                                  'or the tomli package.')
+        with open(filename, 'rb') as file:
+            data = tomllib.load(file)
+
+    if not isinstance(data, dict):
+        raise ValueError('Options file does not contain an object of options: ' +
+                         filename)
+    return {str(key).lower(): _parse_typed(str(key).lower(), value)
+            for key, value in data.items() if value != 'None'}
+
+def read_options_file(name: str) -> dict:
+    '''
+    Reads the values of options for a Taylor or target diagram from a file.
+
+    Reads the options given to the TAYLOR_DIAGRAM or TARGET_DIAGRAM
+    function through the 'taylor_options_file' or 'target_options_file'
+    option. The format is given by the suffix of the file name:
+
+    .csv  : Comma Separated Value file with a header row, the option names
+            in the first column and their values in the second. Further
+            columns, e.g. notes, are ignored.
+    .json : JSON object of option names and values
+    .toml : TOML file with the option names and values at the top level
+
+    If no suffix is given, ".csv" is assumed. Option names are converted
+    to lower case. Values in a CSV file are converted to numbers, lists
+    (e.g. tickRMS, "[0.0, 1.0, 2.0]") and colors (e.g. colRMS, "0, .6, 0"
+    or "m") as appropriate, without evaluating them as Python expressions.
+    Options with the value "None", or an empty value in a CSV file, are
+    skipped so that they keep their default value.
+
+    The parsed file is cached by its absolute path, and read again only
+    when its modification time or size changes, so that many diagrams can
+    be drawn with the same options file at no cost.
+
+    INPUTS:
+    name : name of the options file
+
+    OUTPUTS:
+    options : dictionary of option names and values, which can be modified
+              without affecting the cache
+    '''
+    filename = os.path.expanduser(str(name))
+    format = os.path.splitext(filename)[1].lower()
+    if format == '':
+        filename += '.csv'
+        format = '.csv'
+    elif format not in _FORMATS:
+        raise ValueError('Invalid file type: ' + str(name))
+
+    filename = os.path.abspath(filename)
+    try:
+        status = os.stat(filename)
+    except FileNotFoundError:
+        raise FileNotFoundError('File does not exist: ' + filename)
+    stamp = (status.st_mtime_ns, status.st_size)
+
+    with _cache_lock:
+        entry = _cache.get(filename)
+    if entry is None or entry[0] != stamp:
+        if format == '.csv':
+            options = _read_csv(filename)
+        else:
+            options = _read_mapping(filename, format)
+        entry = (stamp, options)
+        with _cache_lock:
+            _cache[filename] = entry
+
+    return {key: list(value) if isinstance(value, list) else value
+            for key, value in entry[1].items()}
@@ -0,0 +1,39 @@
+from skill_metrics.stats_file_reader import _read_stats_tables
+
+def read_taylor_stats(filename):
+    '''
+    Read statistics used in a Taylor diagram from a file.
+
+    This function reads from a file FILENAME the statistics used to create
+    a Taylor diagram that were written by the WRITE_TAYLOR_STATS function
+    to an Excel file, or by the StatsStreamWriter class to a CSV, Parquet
+    or Feather file. The statistics are returned as arrays in dictionaries
+    like those supplied to the WRITE_TAYLOR_STATS function, together with
+    the TITLE and LABEL of each data set, so that a diagram can be plotted
+    again, e.g. with a new styling, without recalculating the statistics:
+
+    stats = sm.read_taylor_stats('taylor_stats.xlsx')[0]
+    sm.taylor_diagram(stats['sdev'], stats['crmsd'], stats['ccoef'],
+                      markerLabel = stats['label'])
+
+    Each column of statistics is converted to an array at once, so that
+    files of many thousands of data points are read in a fraction of a
+    second. Tables continued on further worksheets of an Excel file are
+    joined back together. The data sets of a file written by the
+    StatsStreamWriter class are the groups of rows written by each call of
+    its WRITE method.
+
+    INPUTS:
+    filename : name of statistics file, with the suffix '.xlsx', '.csv',
+               '.parquet', '.feather' or '.arrow'
+
+    OUTPUTS:
+    data : list of a dictionary of the statistics for each data set
+    data[i]['sdev']  : Standard deviations (sigma)
+    data[i]['crmsd'] : Centered Root Mean Square Difference (CRMSD)
+    data[i]['ccoef'] : Correlation Coefficient (r)
+    data[i]['title'] : title descriptor of the data set, '' if none
+    data[i]['label'] : list of the label of each data point, empty if none
+    '''
+    headers = ['Description','Standard Deviation','CRMSD','Correlation Coeff.']
+    return _read_stats_tables(filename, ['sdev', 'crmsd', 'ccoef'], headers)
@@ -0,0 +1,295 @@
+from collections import OrderedDict
+import hashlib
+import numbers
+import os
+import re
+import threading
+
+import numpy as np
+
+from skill_metrics.export_diagram import export_diagram
+from skill_metrics.export_figure import _get_format
+
+# Version of the layout of the cache, changed to invalidate existing entries
+_CACHE_VERSION = 1
+
+# Pattern of the names of files held in a cache directory
+_ENTRY_PATTERN = re.compile(r'^[0-9a-f]{64}\.[0-9a-z]+$')
+
+# Prefixes of rcParams that do not affect the rendered graphic
+_IGNORED_RCPARAMS = ('animation.', 'keymap.', 'macosx.', 'tk.', 'webagg.',
+                     'backend', 'interactive', 'savefig.directory', 'toolbar')
+
+def _update_hash(h, value) -> None:
+    '''
+    Add a canonical representation of VALUE to the hash H. Dictionaries are
+    hashed in order of their keys and arrays by their type, shape and data,
+    so equal inputs always give the same hash.
+    '''
+    if value is None:
+        h.update(b'N')
+    elif isinstance(value, (bool, np.bool_)):
+        h.update(b'B1' if value else b'B0')
+    elif isinstance(value, numbers.Integral):
+        h.update(b'I' + str(int(value)).encode() + b';')
+    elif isinstance(value, numbers.Real):
+        h.update(b'F' + repr(float(value)).encode() + b';')
+    elif isinstance(value, str):
+        data = value.encode('utf-8')
+        h.update(b'S' + str(len(data)).encode() + b':' + data)
+    elif isinstance(value, np.ndarray):
+        array = np.ascontiguousarray(value)
+        if array.dtype == object:
+            _update_hash(h, array.tolist())
+        else:
+            h.update(b'A' + array.dtype.str.encode() + str(array.shape).encode())
+            h.update(array.tobytes())
+    elif isinstance(value, (list, tuple)):
+        h.update((b'L' if isinstance(value, list) else b'T') +
+                 str(len(value)).encode() + b':')
+        for item in value: _update_hash(h, item)
+    elif isinstance(value, dict):
+        h.update(b'D' + str(len(value)).encode() + b':')
+        for key in sorted(value, key = str):
+            _update_hash(h, str(key))
+            _update_hash(h, value[key])
+    elif isinstance(value, (set, frozenset)):
+        _update_hash(h, sorted(value, key = repr))
+    else:
+        # e.g. a Colormap, identified by its type and name
+        name = getattr(value, 'name', None)
+        if not isinstance(name, str): name = repr(value)
+        _update_hash(h, ('O', type(value).__qualname__, name))
+
+def _get_rcparams() -> dict:
+    '''
+    Return the rcParams that affect the rendered graphic.
+    '''
+    from matplotlib import rcParams
+
+    return {key: rcParams[key] for key in rcParams
+            if not key.startswith(_IGNORED_RCPARAMS)}
+
+def _resolve_options(statistics: dict, kwargs: dict) -> dict:
+    '''
+    Return the options used to draw the diagram for STATISTICS, including
+    the default values of options that are not given in KWARGS.
+    '''
+    from skill_metrics.get_target_diagram_options import get_target_diagram_options
+    from skill_metrics.get_taylor_diagram_options import get_taylor_diagram_options
+    from skill_metrics.render_diagrams import _get_diagram_type
+
+    if _get_diagram_type(statistics) == 'taylor':
+        return get_taylor_diagram_options(np.asarray(statistics['ccoef']), **kwargs)
+    else:
+        return get_target_diagram_options(**kwargs)
+
+class RenderCache(object):
+    '''
+    Content-addressed cache of rendered Taylor and target diagrams on disk.
+
+    Diagrams are identified by a SHA-256 hash of their statistics, their
+    options resolved with all default values, the output format, size and
+    resolution, the matplotlib version and the rcParams affecting the
+    graphic. A diagram rendered before with the same inputs is read from
+    the cache without drawing it. Otherwise it is drawn as done by the
+    EXPORT_DIAGRAM function and stored in the cache.
+
+    The total size of the cached files is bounded by MAX_BYTES. When it is
+    exceeded the least recently used files are deleted. The order of use is
+    kept in memory and recorded in the modification times of the files, so
+    it is preserved when the cache directory is opened again.
+
+    cache = sm.RenderCache('diagram_cache', max_bytes = 500*2**20)
+    for station in stations:
+        cache.save(statistics[station], station + '.png', markerLabel = label)
+    print(cache.stats())
+
+    INPUTS:
+    directory : name of directory holding the cached files, created if it
+                does not exist
+    max_bytes : maximum total size in bytes of the cached files
+                (Default: 256 MiB)
+
+    ATTRIBUTES:
+    hits      : number of diagrams read from the cache
+    misses    : number of diagrams rendered
+    evictions : number of files deleted to bound the size of the cache
+
+    METHODS:
+    key(statistics, format, dpi, figsize, **kwargs)    : hash of a diagram
+    render(statistics, format, dpi, figsize, **kwargs) : bytes of a diagram
+    save(statistics, filename, dpi, figsize, **kwargs) : write a diagram to
+                                                         file
+    get(key, format) / put(key, format, data)          : access the cache
+                                                         directly
+    stats()                                            : cache statistics
+    clear()                                            : delete all files
+    '''
+
+    def __init__(self, directory, max_bytes = 256*2**20):
+        if max_bytes <= 0:
+            raise ValueError('max_bytes must be positive: ' + str(max_bytes))
+        self.directory = os.path.expanduser(str(directory))
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+        self._bytes = 0
+
+        # Index of cached files from least to most recently used
+        os.makedirs(self.directory, exist_ok = True)
+        entries = []
+        with os.scandir(self.directory) as scan:
+            for entry in scan:
+                if _ENTRY_PATTERN.match(entry.name) and entry.is_file():
+                    status = entry.stat()
+                    entries.append((status.st_mtime, entry.name, status.st_size))
+        self._index = OrderedDict()
+        for mtime, name, size in sorted(entries):
+            self._index[name] = size
+            self._bytes += size
+        with self._lock:
+            self._evict()
+
+    def _path(self, name: str) -> str:
+        return os.path.join(self.directory, name)
+
+    def _evict(self) -> None:
+        '''
+        Delete least recently used files until the cache fits in max_bytes.
+        '''
+        while self._bytes > self.max_bytes and len(self._index) > 0:
+            name, size = self._index.popitem(last = False)
+            self._bytes -= size
+            self.evictions += 1
+            try:
+                os.remove(self._path(name))
+            except FileNotFoundError:
+                pass
+
+    def key(self, statistics: dict, format = 'png', dpi = None, figsize = None,
+            **kwargs) -> str:
+        '''
+        Return the hash identifying the diagram for STATISTICS drawn with the
+        options in KWARGS, as a string of 64 hexadecimal digits.
+        '''
+        import matplotlib
+
+        h = hashlib.sha256()
+        _update_hash(h, (_CACHE_VERSION, matplotlib.__version__, _get_format(format),
+                         dpi, figsize))
+        _update_hash(h, {key: np.asarray(value) for key, value in statistics.items()})
+        _update_hash(h, _resolve_options(statistics, kwargs))
+        _update_hash(h, _get_rcparams())
+
+        return h.hexdigest()
+
+    def get(self, key: str, format = 'png'):
+        '''
+        Return the bytes of the graphic cached for KEY in FORMAT, or None if
+        it is not in the cache. The hit and miss counts are not changed.
+        '''
+        name = key + '.' + _get_format(format)
+        with self._lock:
+            if name not in self._index: return None
+            try:
+                with open(self._path(name), 'rb') as file:
+                    data = file.read()
+                os.utime(self._path(name))
+            except FileNotFoundError:
+                # Deleted by another process
+                self._bytes -= self._index.pop(name)
+                return None
+            self._index.move_to_end(name)
+
+        return data
+
+    def put(self, key: str, format, data: bytes) -> None:
+        '''
+        Store the bytes DATA of a graphic in FORMAT for KEY, evicting least
+        recently used files as needed. Graphics larger than the cache are
+        not stored.
+        '''
+        if len(data) > self.max_bytes: return
+
+        name = key + '.' + _get_format(format)
+        path = self._path(name)
+        temp = path + '.' + str(os.getpid()) + '.' + str(threading.get_ident()) + '.tmp'
+        with open(temp, 'wb') as file:
+            file.write(data)
+        os.replace(temp, path)
+
+        with self._lock:
+            self._bytes += len(data) - self._index.pop(name, 0)
+            self._index[name] = len(data)
+            self._evict()
+
+    def _render(self, statistics: dict, format, dpi, figsize, kwargs) -> tuple:
+        '''
+        Return the bytes of a diagram and True if they were read from the
+        cache, counting the hit or miss.
+        '''
+        key = self.key(statistics, format, dpi, figsize, **kwargs)
+        data = self.get(key, format)
+        with self._lock:
+            if data is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        if data is not None: return data, True
+
+        data = export_diagram(statistics, format, dpi, figsize, **kwargs).getvalue()
+        self.put(key, format, data)
+
+        return data, False
+
+    def render(self, statistics: dict, format = 'png', dpi = None, figsize = None,
+               **kwargs) -> bytes:
+        '''
+        Return the bytes of the diagram for STATISTICS in FORMAT, read from
+        the cache or rendered by the EXPORT_DIAGRAM function and stored in
+        the cache. The arguments are those of the EXPORT_DIAGRAM function.
+        '''
+        return self._render(statistics, format, dpi, figsize, kwargs)[0]
+
+    def save(self, statistics: dict, filename, dpi = None, figsize = None,
+             **kwargs) -> bool:
+        '''
+        Write the diagram for STATISTICS to FILENAME in the format given by
+        its suffix, e.g. 'taylor1.png', using the cache. Returns True if the
+        diagram was read from the cache.
+        '''
+        format = os.path.splitext(str(filename))[1]
+        if format == '':
+            raise ValueError('File name has no suffix for the format: ' + str(filename))
+
+        data, hit = self._render(statistics, format, dpi, figsize, kwargs)
+        with open(filename, 'wb') as file:
+            file.write(data)
+
+        return hit
+
+    def stats(self) -> dict:
+        '''
+        Return the hit, miss and eviction counts, the number of cached files
+        and their total size in bytes.
+        '''
+        with self._lock:
+            return {'hits': self.hits, 'misses': self.misses,
+                    'evictions': self.evictions, 'entries': len(self._index),
+                    'bytes': self._bytes, 'max_bytes': self.max_bytes}
+
+    def clear(self) -> None:
+        '''
+        Delete all cached files. The hit and miss counts are not changed.
+        '''
+        with self._lock:
+            for name in self._index:
+                try:
+                    os.remove(self._path(name))
+                except FileNotFoundError:
+                    pass
+            self._index.clear()
+            self._bytes = 0
@@ -0,0 +1,171 @@
+from concurrent.futures import ThreadPoolExecutor
+from matplotlib import rcParams
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+import numpy as np
+
+from skill_metrics.check_on_off import check_on_off
+from skill_metrics.target_diagram import target_diagram
+from skill_metrics.taylor_diagram import taylor_diagram
+
+# Default figure size in inches of previews drawn with option 'preview'
+_PREVIEW_FIGSIZE = (1.6, 1.2)
+
+def _get_diagram_type(statistics: dict) -> str:
+    '''
+    Determine the type of diagram from the keys of a statistics dictionary.
+
+    Returns 'taylor' for the keys returned by the TAYLOR_STATISTICS function
+    ('sdev', 'crmsd', 'ccoef') and 'target' for the keys returned by the
+    TARGET_STATISTICS function ('bias', 'crmsd', 'rmsd').
+    '''
+    if all(key in statistics for key in ('sdev', 'crmsd', 'ccoef')):
+        return 'taylor'
+    elif all(key in statistics for key in ('bias', 'crmsd', 'rmsd')):
+        return 'target'
+    else:
+        raise ValueError("Statistics must contain keys ('sdev', 'crmsd', 'ccoef') " +
+                         "or ('bias', 'crmsd', 'rmsd'): " + str(list(statistics.keys())))
+
+def _draw_diagram(ax, statistics: dict, options: dict):
+    '''
+    Draw a Taylor or target diagram in the provided axes.
+
+    The type of diagram is determined from the keys of STATISTICS. The
+    OPTIONS dictionary is passed as keyword arguments to the TAYLOR_DIAGRAM
+    or TARGET_DIAGRAM function.
+    '''
+    if options is None: options = {}
+
+    if _get_diagram_type(statistics) == 'taylor':
+        return taylor_diagram(ax, np.asarray(statistics['sdev']),
+                              np.asarray(statistics['crmsd']),
+                              np.asarray(statistics['ccoef']), **options)
+    else:
+        return target_diagram(ax, np.asarray(statistics['bias']),
+                              np.asarray(statistics['crmsd']),
+                              np.asarray(statistics['rmsd']), **options)
+
+def _new_figure(figsize = None, dpi = None) -> Figure:
+    '''
+    Create a figure attached to an Agg canvas without using pyplot.
+    '''
+    figure = Figure(figsize = figsize, dpi = dpi)
+    FigureCanvasAgg(figure)
+    return figure
+
+def _is_preview(options: dict) -> bool:
+    '''
+    Return True if OPTIONS request a preview of the diagram.
+    '''
+    if options is None: return False
+
+    # Option names are not case sensitive, e.g. 'Preview'
+    options = {key.lower(): value for key, value in options.items()}
+    if 'preview' in options: return check_on_off(options['preview']) == 'on'
+    if options.get('profile') is not None:
+        return options['profile'].options()['preview'] == 'on'
+    return False
+
+def _plot_diagram(statistics: dict, options: dict, figure = None, figsize = None,
+                  dpi = None):
+    '''
+    Draw a single diagram in a figure attached to an Agg canvas.
+
+    A new figure is created unless one is supplied in FIGURE, in which case
+    it is cleared and reused. The figure is returned.
+
+    A preview is drawn in axes filling the figure, which is small unless
+    FIGSIZE is given. When a figure holding a previous preview is reused,
+    only the artists of that preview are removed and its axes are reused.
+    '''
+    preview = _is_preview(options)
+    if figure is None:
+        if preview and figsize is None: figsize = _PREVIEW_FIGSIZE
+        figure = _new_figure(figsize, dpi)
+    elif preview and len(figure.axes) == 1 and figure.axes[0].get_label() == 'preview':
+        # Remove artists of previous preview
+        ax = figure.axes[0]
+        for artist in ax.collections[:]: artist.remove()
+        _draw_diagram(ax, statistics, options)
+        return figure
+    else:
+        # Clear figure and undo any subplot adjustments made for a legend
+        figure.clear()
+        figure.subplots_adjust(**{key: rcParams['figure.subplot.' + key] for key in
+                                  ('left', 'bottom', 'right', 'top', 'wspace', 'hspace')})
+
+    if preview:
+        ax = figure.add_axes((0, 0, 1, 1), label = 'preview')
+    else:
+        ax = figure.add_subplot(1, 1, 1)
+    _draw_diagram(ax, statistics, options)
+
+    return figure
+
+def _render_diagram(statistics: dict, options: dict, filename, figure = None,
+                    figsize = None, dpi = None):
+    '''
+    Render a single diagram to FILENAME.
+
+    A new figure is created unless one is supplied in FIGURE, in which case
+    it is cleared and reused. The figure is returned.
+    '''
+    figure = _plot_diagram(statistics, options, figure, figsize, dpi)
+    if dpi is None:
+        figure.savefig(filename)
+    else:
+        figure.savefig(filename, dpi = dpi)
+
+    return figure
+
+def render_diagrams(jobs, max_workers = None, figsize = None, dpi = None) -> list:
+    '''
+    Render many Taylor or target diagrams concurrently using a thread pool.
+
+    Each diagram is drawn into its own matplotlib Figure attached to an Agg
+    canvas and written to file. The pyplot state machine is never used, so
+    the diagrams can be drawn simultaneously by the worker threads.
+
+    INPUTS:
+    jobs        : iterable of (statistics, options, filename) tuples
+      statistics : dictionary of statistics for the diagram. A Taylor diagram
+                   is drawn for the keys 'sdev', 'crmsd', 'ccoef' (as returned
+                   by TAYLOR_STATISTICS) and a target diagram for the keys
+                   'bias', 'crmsd', 'rmsd' (as returned by TARGET_STATISTICS).
+      options    : dictionary of options passed as keywords to the
+                   TAYLOR_DIAGRAM or TARGET_DIAGRAM function, or None
+      filename   : name of graphics file with suffix of a format supported
+                   by matplotlib savefig, e.g. 'taylor1.png'
+    max_workers : maximum number of threads (Default: None, as chosen by
+                  concurrent.futures.ThreadPoolExecutor)
+    figsize     : figure size in inches (Default: rcParams["figure.figsize"],
+                  or 1.6 x 1.2 inches for a preview)
+    dpi         : resolution in dots per inch (Default: rcParams["figure.dpi"])
+
+    OUTPUTS:
+    filenames : list of names of the files written, in the order of JOBS
+
+    EXAMPLE:
+    jobs = [(taylor_stats, {'markerlabel': label}, 'taylor1.png'),
+            (target_stats, {'circles': [20, 40]}, 'target1.png')]
+    render_diagrams(jobs, max_workers = 4)
+
+    Thumbnails are rendered much faster by drawing previews, without any
+    text, in a small figure:
+    jobs = [(taylor_stats, {'preview': 'on'}, 'thumb1.png')]
+    '''
+
+    filenames = []
+    with ThreadPoolExecutor(max_workers = max_workers) as executor:
+        futures = []
+        for statistics, options, filename in jobs:
+            futures.append(executor.submit(_render_diagram, statistics, options,
+                                           filename, figsize = figsize, dpi = dpi))
+            filenames.append(filename)
+
+        # Wait for completion, raising the first error encountered
+        for future in futures:
+            future.result()
+
+    return filenames
@@ -1,10 +1,49 @@
-def report_duplicate_stats(duplicates):
+import numpy as np
+
+from skill_metrics import check_on_off
+
+def _get_groups(first: np.ndarray, second: np.ndarray) -> list:
+    '''
+    Return the groups of points connected by the pairs of duplicates with
+    indices FIRST and SECOND, as arrays of indices ordered by decreasing
+    size of group.
+    '''
+    points, pairs = np.unique(np.concatenate((first, second)), return_inverse = True)
+    a, b = pairs[:len(first)], pairs[len(first):]
+
+    # Propagate the smallest label through each group
+    labels = np.arange(len(points))
+    while True:
+        low = np.minimum(labels[a], labels[b])
+        new = labels.copy()
+        np.minimum.at(new, a, low)
+        np.minimum.at(new, b, low)
+        new = new[new]
+        if np.array_equal(new, labels): break
+        labels = new
+
+    order = np.argsort(labels, kind = 'stable')
+    groups = np.split(points[order], np.flatnonzero(np.diff(labels[order])) + 1)
+    groups.sort(key = len, reverse = True)
+    return groups
+
+def report_duplicate_stats(duplicates, summary = 'off', max_lines = 10):
     '''
     Reports list of pairs of statistics that are duplicates.
 
+    Prints each pair of duplicate statistics, or with SUMMARY = 'on' a
+    summary suited to the large number of pairs found for many points: the
+    number of pairs and of points involved, and the largest groups of
+    points connected by duplicate pairs with the statistics of their first
+    point.
+
     INPUTS:
     DUPLICATES : List of tuples of paired statistics that are duplicates produced
                  by the check_duplicate_stats function
+    SUMMARY    : 'on' / 'off' switch to report a summary of the duplicates
+                 (Default: 'off')
+    MAX_LINES  : maximum number of groups, and of indices per group, listed
+                 in the summary (Default: 10)
 
     OUTPUTS:
     None
@@ -19,8 +58,29 @@ def report_duplicate_stats(duplicates):
 
     if len(duplicates) == 0: return
 
-    # Report duplicates to screen
-    print('Duplicate pairs of statistics:')
+    if check_on_off(summary) == 'off':
+        # Report duplicates to screen
+        print('Duplicate pairs of statistics:')
+        for pair in duplicates:
+            print(str(pair))
+        return
+
+    # Summarize duplicates by groups of connected points
+    first = np.array([pair[0] for pair in duplicates])
+    second = np.array([pair[1] for pair in duplicates])
+    groups = _get_groups(first, second)
+    values = {}
     for pair in duplicates:
-        print(str(pair))
+        values.setdefault(pair[0], pair[2])
 
+    npoints = sum(len(group) for group in groups)
+    print('Duplicate pairs of statistics: ' + str(len(duplicates)) + ' pairs of ' +
+          str(npoints) + ' points in ' + str(len(groups)) + ' groups')
+    print('Largest groups of duplicate statistics:')
+    for group in groups[:max_lines]:
+        indices = ', '.join(str(index) for index in group[:max_lines].tolist())
+        if len(group) > max_lines: indices += ', ...'
+        stats = '(' + ', '.join('%.4g' % value for value in values[group[0]]) + ')'
+        print(str(len(group)) + ' points ' + stats + ': ' + indices)
+    if len(groups) > max_lines:
+        print('... ' + str(len(groups) - max_lines) + ' more groups')
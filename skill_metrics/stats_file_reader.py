@@ -0,0 +1,244 @@
+import csv
+import os
+import posixpath
+import xml.etree.ElementTree as ET
+import zipfile
+
+import numpy as np
+
+from skill_metrics.stats_stream_writer import _COLUMNS
+from skill_metrics.stats_stream_writer import _FORMATS
+from skill_metrics.stats_stream_writer import _GROUP_COLUMN
+from skill_metrics.stats_stream_writer import _LABEL_COLUMNS
+from skill_metrics.stats_stream_writer import _import_pyarrow
+
+# Namespaces of the XML parts of an Excel file
+_MAIN = '{http://schemas.openxmlformats.org/spreadsheetml/2006/main}'
+_RELS = '{http://schemas.openxmlformats.org/package/2006/relationships}'
+_DOCREL = '{http://schemas.openxmlformats.org/officeDocument/2006/relationships}'
+
+def _get_column_index(ref: str) -> int:
+    '''
+    Return the index of the column of the cell reference REF, e.g. 2 for 'C7'.
+    '''
+    index = 0
+    for char in ref:
+        if not char.isalpha(): break
+        index = 26*index + ord(char.upper()) - ord('A') + 1
+    return index - 1
+
+def _get_text(element) -> str:
+    '''
+    Return the text of a string item of an Excel file, joining its runs.
+    '''
+    return ''.join(text.text or '' for text in element.iter(_MAIN + 't'))
+
+def _get_sheet_paths(book: zipfile.ZipFile) -> list:
+    '''
+    Return the paths of the worksheets of the Excel file BOOK in their order
+    in the workbook.
+    '''
+    rels = ET.fromstring(book.read('xl/_rels/workbook.xml.rels'))
+    targets = {rel.get('Id'): rel.get('Target') for rel in rels.iter(_RELS + 'Relationship')}
+    paths = []
+    for sheet in ET.fromstring(book.read('xl/workbook.xml')).iter(_MAIN + 'sheet'):
+        target = targets[sheet.get(_DOCREL + 'id')]
+        if target.startswith('/'):
+            paths.append(target[1:])
+        else:
+            paths.append(posixpath.normpath(posixpath.join('xl', target)))
+    return paths
+
+def _get_row_cells(row, shared: list) -> dict:
+    '''
+    Return the values of the cells of the XML ROW of a worksheet by column.
+    '''
+    cells = {}
+    for cell in row.iter(_MAIN + 'c'):
+        kind = cell.get('t', 'n')
+        if kind == 'inlineStr':
+            cells[_get_column_index(cell.get('r'))] = _get_text(cell)
+            continue
+        value = cell.find(_MAIN + 'v')
+        if value is None or value.text is None: continue
+        col = _get_column_index(cell.get('r'))
+        if kind == 's':
+            cells[col] = shared[int(value.text)]
+        elif kind == 'n':
+            cells[col] = float(value.text)
+        elif kind == 'b':
+            cells[col] = value.text == '1'
+        elif kind == 'str':
+            cells[col] = value.text
+    return cells
+
+def _read_xlsx_rows(filename: str):
+    '''
+    Generate the (sheet, row, cells) of the rows of an Excel file in order,
+    where CELLS are the values of the non-empty cells of the row by column.
+    Empty rows are skipped. The worksheets are parsed incrementally.
+    '''
+    with zipfile.ZipFile(filename) as book:
+        shared = []
+        if 'xl/sharedStrings.xml' in book.namelist():
+            strings = ET.fromstring(book.read('xl/sharedStrings.xml'))
+            shared = [_get_text(item) for item in strings.iter(_MAIN + 'si')]
+
+        for sheet, path in enumerate(_get_sheet_paths(book)):
+            with book.open(path) as file:
+                for event, element in ET.iterparse(file):
+                    if element.tag == _MAIN + 'row':
+                        cells = _get_row_cells(element, shared)
+                        if len(cells) > 0:
+                            yield sheet, int(element.get('r')) - 1, cells
+                        element.clear()
+
+def _get_label(value) -> str:
+    if value is None: return ''
+    if isinstance(value, str): return value
+    return '%g' % value
+
+def _get_labels(values: list) -> list:
+    '''
+    Return the labels VALUES as strings, or an empty list if there are none.
+    '''
+    labels = [_get_label(value) for value in values]
+    return labels if any(label != '' for label in labels) else []
+
+def _read_excel_tables(filename: str, keys: list, headers: list) -> list:
+    '''
+    Read the tables of statistics written by the WRITE_TAYLOR_STATS and
+    WRITE_TARGET_STATS functions, with the column HEADERS, from an Excel
+    file. Returns a dictionary for each table of the values of the
+    statistics KEYS, and its title and labels.
+    '''
+    tables = []
+    current = None
+    last = None
+    previous = None
+    for sheet, row, cells in _read_xlsx_rows(filename):
+        if cells.get(0) == headers[0]:
+            if [cells.get(col) for col in range(len(headers))] != headers:
+                raise ValueError('Statistics in file ' + filename + ' have the ' +
+                                 'headers ' + str(list(cells.values())) +
+                                 ', expected ' + str(headers))
+
+            # A header on the first row of a later worksheet continues a table
+            if not (row == 0 and sheet > 0 and current is not None):
+                title = ''
+                if previous is not None and previous[:2] == (sheet, row - 1) and \
+                   list(previous[2]) == [0] and isinstance(previous[2][0], str):
+                    title = previous[2][0]
+                current = {'title': title, 'label': [],
+                           'values': [[] for key in keys]}
+                tables.append(current)
+        elif current is not None and last == (sheet, row - 1):
+            # Row of data following the header or another row of data
+            current['label'].append(cells.get(0))
+            for col, values in enumerate(current['values'], 1):
+                values.append(cells.get(col, np.nan))
+        else:
+            current = None
+        last = (sheet, row)
+        previous = (sheet, row, cells)
+
+    if len(tables) == 0:
+        raise ValueError('No statistics with the headers ' + str(headers) +
+                         ' in file ' + filename)
+
+    data = []
+    for table in tables:
+        stats = {key: np.array(values, dtype = float)
+                 for key, values in zip(keys, table['values'])}
+        stats['title'] = table['title']
+        stats['label'] = _get_labels(table['label'])
+        data.append(stats)
+    return data
+
+def _read_stats_columns(filename: str, format: str) -> dict:
+    '''
+    Return the columns of a file written by the StatsStreamWriter class,
+    the group indices as an integer array, the titles and labels as arrays
+    of strings and the metrics as float arrays.
+    '''
+    if format == 'csv':
+        with open(filename, newline = '') as file:
+            rows = csv.reader(file)
+            header = next(rows, None)
+            if header is None or header[:len(_COLUMNS)] != _COLUMNS:
+                raise ValueError('File is not a statistics file, header must ' +
+                                 'start with ' + ','.join(_COLUMNS) + ': ' +
+                                 filename)
+            values = list(zip(*rows))
+        if len(values) == 0: values = [()]*len(header)
+        columns = {}
+        for name, column in zip(header, values):
+            if name == _GROUP_COLUMN:
+                columns[name] = np.array(column, dtype = np.int64)
+            elif name in _LABEL_COLUMNS:
+                columns[name] = np.array(column, dtype = object)
+            else:
+                columns[name] = np.array(column, dtype = float)
+        return columns
+
+    pyarrow = _import_pyarrow()
+    if format == 'parquet':
+        import pyarrow.parquet
+        table = pyarrow.parquet.read_table(filename)
+    else:
+        import pyarrow.feather
+        table = pyarrow.feather.read_table(filename, memory_map = True)
+    columns = {}
+    for name in table.column_names:
+        if name in _LABEL_COLUMNS:
+            columns[name] = np.array(table.column(name).to_pylist(), dtype = object)
+        else:
+            columns[name] = table.column(name).to_numpy()
+    return columns
+
+def _read_stats_groups(filename: str, format: str, keys: list) -> list:
+    '''
+    Read the statistics KEYS of each group of rows from a file written by
+    the StatsStreamWriter class, i.e. the rows written by each call of its
+    WRITE method.
+    '''
+    columns = _read_stats_columns(filename, format)
+    missing = [name for name in _COLUMNS + keys if not name in columns]
+    if len(missing) > 0:
+        raise ValueError('Statistics missing from file ' + filename + ': ' +
+                         ', '.join(missing))
+
+    # Split the rows into consecutive groups with the same index, so that
+    # groups with the same title are kept apart
+    groups = columns[_GROUP_COLUMN]
+    titles = columns['title']
+    bounds = np.flatnonzero(groups[1:] != groups[:-1]) + 1
+    bounds = np.concatenate(([0], bounds, [len(groups)]))
+
+    data = []
+    for first, last in zip(bounds[:-1], bounds[1:]):
+        if last == first: continue
+        stats = {key: columns[key][first:last] for key in keys}
+        stats['title'] = '' if titles[first] is None else str(titles[first])
+        stats['label'] = _get_labels(columns['label'][first:last].tolist())
+        data.append(stats)
+    return data
+
+def _read_stats_tables(filename: str, keys: list, headers: list) -> list:
+    '''
+    Read the statistics KEYS of each data set from an Excel file written by
+    the WRITE_TAYLOR_STATS and WRITE_TARGET_STATS functions, whose tables
+    have the column HEADERS, or from a file written by the StatsStreamWriter
+    class.
+    '''
+    if not os.path.isfile(filename):
+        raise ValueError('File does not exist: ' + filename)
+
+    suffix = os.path.splitext(filename)[1].lower()
+    if suffix in _FORMATS:
+        return _read_stats_groups(filename, _FORMATS[suffix], keys)
+    elif suffix in ('.xlsx', '.xlsm'):
+        return _read_excel_tables(filename, keys, headers)
+    else:
+        raise ValueError('Unsupported statistics file format: ' + filename +
+                         '\nSupported suffixes are .xlsx, ' + ', '.join(_FORMATS))
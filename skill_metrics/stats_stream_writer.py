@@ -0,0 +1,247 @@
+import csv
+import os
+
+import numpy as np
+
+# Suffixes of the supported formats
+_FORMATS = {'.csv': 'csv', '.parquet': 'parquet', '.feather': 'feather',
+            '.arrow': 'feather'}
+
+# Columns preceding the metrics in every file: the index of the group of
+# rows written by each call of WRITE, followed by its title and labels
+_GROUP_COLUMN = 'group'
+_LABEL_COLUMNS = ['title', 'label']
+_COLUMNS = [_GROUP_COLUMN] + _LABEL_COLUMNS
+
+def _import_pyarrow():
+    '''
+    Return the pyarrow module, required for the Parquet and Feather formats.
+    '''
+    try:
+        import pyarrow
+    except ImportError:
+        raise ImportError('Writing Parquet or Feather statistics files requires ' +
+                          'the pyarrow package.')
+    return pyarrow
+
+def _read_csv_header(filename: str) -> tuple:
+    '''
+    Return the metrics in the header of an existing CSV statistics file and
+    the number of groups of rows in the file, or (None, 0) if the file is
+    empty.
+    '''
+    with open(filename, newline = '') as file:
+        rows = csv.reader(file)
+        header = next(rows, None)
+        if header is None: return None, 0
+        if header[:len(_COLUMNS)] != _COLUMNS:
+            raise ValueError('File is not a statistics file, header must start ' +
+                             'with ' + ','.join(_COLUMNS) + ': ' + filename)
+
+        # Continue the numbering of the groups after the last row
+        last = None
+        for last in rows: pass
+    groups = 0 if last is None else int(last[0]) + 1
+    return header[len(_COLUMNS):], groups
+
+class StatsStreamWriter(object):
+    '''
+    Stream statistics to a CSV, Parquet or Feather file.
+
+    Statistics are written group by group as they are calculated, e.g. by
+    a batch job processing one experiment at a time, so that they need not
+    be held in memory and have no limit on their number of rows, unlike an
+    Excel worksheet. Each call of the WRITE method writes the statistics of
+    a dictionary, such as those supplied to the WRITE_TAYLOR_STATS and
+    WRITE_TARGET_STATS functions, as one group of rows: a CSV block or a
+    Parquet row group, which is flushed to the file at once.
+
+    Every file has the same typed columns: an int64 'group' column holding
+    the index of the call of WRITE that wrote each row, counted from 0,
+    'title' and 'label' strings and a float64 column for each metric, in
+    the order of METRICS. The groups are kept apart when the file is read
+    by the READ_TAYLOR_STATS and READ_TARGET_STATS functions, even if they
+    have the same title.
+    Parquet and Feather files can be read by pandas, pyarrow or polars
+    without conversion, e.g. pyarrow.feather.read_table(filename,
+    memory_map = True) maps a Feather file without copying it. The Parquet
+    and Feather formats require the pyarrow package.
+
+    With APPEND = True, the statistics are added to an existing CSV file,
+    whose header must list the same metrics, and the index of the groups
+    continues from the last group of the file. Parquet and Feather files
+    cannot be extended once closed, so an open writer is kept for the
+    whole job and appends a row group at each call of WRITE:
+
+    with sm.StatsStreamWriter('stats.parquet', overwrite = True) as writer:
+        for expt in experiments:
+            writer.write(stats[expt], title = expt, label = stations)
+
+    INPUTS:
+    filename  : name of the file, whose suffix selects its format: '.csv',
+                '.parquet', '.feather' or '.arrow' (Arrow IPC file, the
+                format of Feather files)
+    metrics   : list of the names of the metrics, or None for the keys of
+                the first dictionary written or the metrics of the file
+                appended to (Default: None)
+    append    : boolean flag to append to an existing CSV file
+                (Default: False)
+    overwrite : boolean flag to overwrite an existing file (Default: False)
+
+    ATTRIBUTES:
+    metrics : names of the metrics, None until known
+    rows    : number of rows written
+    groups  : number of groups of rows in the file
+
+    METHODS:
+    write(data, title, label) : write the statistics of a dictionary
+    close()                   : finish writing the file
+    '''
+
+    def __init__(self, filename, metrics = None, append = False, overwrite = False):
+        suffix = os.path.splitext(filename)[1].lower()
+        if not suffix in _FORMATS:
+            raise ValueError('Unsupported statistics file format: ' + filename +
+                             '\nSupported suffixes are ' + ', '.join(_FORMATS))
+        self.format = _FORMATS[suffix]
+        self.filename = filename
+        self.metrics = None if metrics is None else [str(name) for name in metrics]
+        self.rows = 0
+        self.groups = 0
+        self._file = None
+        self._csv = None
+        self._writer = None
+        self._schema = None
+        self._closed = False
+
+        exists = os.path.isfile(filename)
+        if self.format != 'csv':
+            _import_pyarrow()
+            if append and exists:
+                raise ValueError('Cannot append to an existing ' + self.format +
+                                 ' file, keep the writer open instead: ' + filename)
+
+        # Check for existence of file
+        if exists and append and self.format == 'csv':
+            existing, self.groups = _read_csv_header(filename)
+            if existing is not None:
+                if self.metrics is not None and self.metrics != existing:
+                    raise ValueError('Metrics differ from those of file ' +
+                                     filename + ': ' + str(self.metrics) +
+                                     ' != ' + str(existing))
+                self.metrics = existing
+                self._open_csv('a', header = False)
+        elif exists:
+            if overwrite:
+                os.remove(filename)
+            else:
+                raise ValueError('File already exists: ' + filename)
+
+        if self.metrics is not None and self._file is None: self._open()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _open_csv(self, mode: str, header: bool = True) -> None:
+        self._file = open(self.filename, mode, newline = '')
+        self._csv = csv.writer(self._file)
+        if header:
+            self._csv.writerow(_COLUMNS + self.metrics)
+            self._file.flush()
+
+    def _open(self) -> None:
+        '''
+        Create the file with the columns of the metrics.
+        '''
+        if self.format == 'csv':
+            self._open_csv('a')
+            return
+
+        pyarrow = _import_pyarrow()
+        self._schema = pyarrow.schema(
+            [(_GROUP_COLUMN, pyarrow.int64())] +
+            [(name, pyarrow.string()) for name in _LABEL_COLUMNS] +
+            [(name, pyarrow.float64()) for name in self.metrics])
+        if self.format == 'parquet':
+            import pyarrow.parquet
+            self._writer = pyarrow.parquet.ParquetWriter(self.filename, self._schema)
+        else:
+            import pyarrow.ipc
+            self._writer = pyarrow.ipc.new_file(self.filename, self._schema)
+
+    def _get_columns(self, data: dict) -> tuple:
+        '''
+        Return the number of rows and the values of each metric in DATA as
+        float64 arrays, with NaN for the metrics missing from DATA.
+        '''
+        unknown = [key for key in data if not key in self.metrics]
+        if len(unknown) > 0:
+            raise ValueError('Statistics not in the metrics of file ' +
+                             self.filename + ': ' + ', '.join(map(str, unknown)))
+
+        values = {key: np.ravel(np.asarray(value, dtype = float))
+                  for key, value in data.items()}
+        lengths = {len(value) for value in values.values()}
+        if len(lengths) > 1:
+            raise ValueError('Statistics have different lengths: ' +
+                             str(sorted(lengths)))
+        nrows = lengths.pop() if len(lengths) > 0 else 0
+
+        columns = [values[name] if name in values else
+                   np.full(nrows, np.nan) for name in self.metrics]
+        return nrows, columns
+
+    def write(self, data: dict, title: str = '', label = None) -> None:
+        '''
+        Write the statistics in the dictionary DATA, e.g. data['sdev'], as
+        a group of rows, one for each data point, with the index of the
+        group, the TITLE and the LABEL of each data point, if given.
+        '''
+        if self._closed:
+            raise ValueError('Statistics writer is closed.')
+        if self.metrics is None:
+            self.metrics = [str(key) for key in data]
+            self._open()
+
+        nrows, columns = self._get_columns(data)
+        if nrows == 0: return
+        if label is None:
+            labels = [''] * nrows
+        else:
+            if isinstance(label, str): label = [label]
+            if len(label) < nrows:
+                raise ValueError('Fewer labels than data points: ' +
+                                 str(len(label)) + ' < ' + str(nrows))
+            labels = [str(name) for name in label[:nrows]]
+        groups = [self.groups] * nrows
+        titles = [str(title)] * nrows
+
+        if self.format == 'csv':
+            self._csv.writerows(zip(groups, titles, labels,
+                                    *[column.tolist() for column in columns]))
+            self._file.flush()
+        else:
+            pyarrow = _import_pyarrow()
+            table = pyarrow.Table.from_arrays(
+                [pyarrow.array(groups, pyarrow.int64()),
+                 pyarrow.array(titles, pyarrow.string()),
+                 pyarrow.array(labels, pyarrow.string())] +
+                [pyarrow.array(column, pyarrow.float64()) for column in columns],
+                schema = self._schema)
+            self._writer.write_table(table)
+        self.rows += nrows
+        self.groups += 1
+
+    def close(self) -> None:
+        '''
+        Finish writing the file.
+        '''
+        if self._closed: return
+        self._closed = True
+        if self._file is not None:
+            self._file.close()
+        if self._writer is not None:
+            self._writer.close()
@@ -1,136 +1,19 @@
-from array import array
-import matplotlib.pyplot as plt
-import numbers
+from typing import Optional
+
 import numpy as np
 
+from skill_metrics import DiagramHandle
+from skill_metrics.diagram_arguments import _ensure_np_array_or_die
 from skill_metrics import get_target_diagram_axes
 from skill_metrics import get_target_diagram_options
+from skill_metrics.option_schema import _display_options
 from skill_metrics import overlay_target_diagram_circles
 from skill_metrics import plot_pattern_diagram_colorbar
+from skill_metrics import plot_pattern_diagram_density
 from skill_metrics import plot_pattern_diagram_markers
+from skill_metrics import plot_pattern_diagram_preview
 from skill_metrics import plot_target_axes
-
-def _display_target_diagram_options():
-    '''
-    Displays available options for TARGET_DIAGRAM function.
-    '''
-
-    _disp('General options:')
-    _dispopt("'colormap'","'on'/ 'off' (default): "  + 
-        "Switch to map color shading of markers to colormap ('on')\n\t\t"  +
-        "or min to max range of RMSDz values ('off').")
-    _dispopt("'overlay'","'on' / 'off' (default): " + 
-            'Switch to overlay current statistics on target diagram. ' +
-            '\n\t\tOnly markers will be displayed.')
-    _disp("OPTIONS when 'colormap' == 'on'")
-    _dispopt("'cmap'","Choice of colormap. (Default: 'jet')")
-    _dispopt("'cmap_marker'","Marker to use with colormap (Default: 'd')")
-    _dispopt("'cmap_vmax'","Maximum range of colormap (Default: None)")
-    _dispopt("'cmap_vmax'","Minimum range of colormap (Default: None)")
-    _disp('')
-    
-    _disp('Marker options:')
-    _dispopt("'MarkerDisplayed'", 
-        "'marker' (default): Experiments are represented by individual symbols\n\t\t" +
-        "'colorBar': Experiments are represented by a color described " + 
-        'in a colorbar')
-    
-    _disp("OPTIONS when 'MarkerDisplayed' == 'marker'")
-    _dispopt("'markerColor'",'Single color to use for all markers'  +
-         ' (Default: None)')
-    _dispopt("'markerColors'","Dictionary with two colors as keys ('face', 'edge')" +
-             "or None." + "\n\t\t" + 
-             "If None or 'markerlegend' == 'on' then considers only the value of " + 
-             "'markerColor'. (Default: None)")
-    _dispopt("'markerLabel'",'Labels for markers')
-    _dispopt("'markerLabelColor'",'Marker label color (Default: black)')
-    _dispopt("'markerLayout'","Matrix layout for markers in legend [nrow, ncolumn]." + "\n\t\t" + 
-             "(Default: [15, no. markers/15])'")
-    _dispopt("'markerLegend'","'on' / 'off' (default): Use legend for markers'")
-
-    _dispopt("'markers'",'Dictionary providing individual control of the marker ' +
-              'label, label color, symbol, size, face color, and edge color'  +
-         ' (Default: none)')
-
-    _dispopt("'markerSize'",'Marker size (Default: 10)')
-    _dispopt("'markerSymbol'","Marker symbol (Default: '.')")
-    
-    _disp("OPTIONS when 'MarkerDisplayed' == 'colorbar'")
-    _dispopt("'cmapZData'","Data values to use for " +
-            'color mapping of markers, e.g. RMSD or BIAS.\n\t\t' +
-            '(Used to make range of RMSDs values appear above color bar.)')
-    _dispopt("'locationColorBar'","Location for the colorbar, 'NorthOutside' " +
-             "or 'EastOutside'")
-    _dispopt("'titleColorBar'",'Title of the colorbar.')
-    _disp('')
-     
-    _disp('Axes options:')
-    _dispopt("'axismax'",'Maximum for the Bias & uRMSD axis')
-    _dispopt("'colFrame'",'Color for the y and x spines')
-    _dispopt("'equalAxes'","'on' (default) / 'off': Set axes to be equal")
-    _dispopt("'labelWeight'","Weight of the x & y axis labels")
-    _dispopt("'ticks'",'Define tick positions ' +
-            '(default is that used by axis function)')
-    _dispopt("'xtickLabelPos'",'position of the tick labels ' +
-            'along the x-axis (empty by default)')
-    _dispopt("'ytickLabelPos'",'position of the tick labels ' +
-            'along the y-axis (empty by default)')
-    _disp('')
-     
-    _disp('Diagram options:')
-    _dispopt("'alpha'","Blending of symbol face color (0.0 transparent through 1.0 opaque)" +
-             "\n\t\t" + "(Default: 1.0)")
-    _dispopt("'circles'",'Define the radii of circles to draw ' +
-            '(default of (maximum RMSDs)*[.7 1], [.7 1] when normalized diagram)')
-    _dispopt("'circleColor'",'Circle line color specification (default None)')
-    _dispopt("'circleCols'","Dictionary with two possible colors keys ('ticks'," +
-             "'tick_labels')" +
-             "\n\t\t or None, if None then considers only the value of 'circlecolor'" +
-             "(Default: None)")
-    _dispopt("'circleLineSpec'",'Circle line specification (default ' +
-            "dashed black, '--k')")
-    _dispopt("'circleLineWidth'",'Circle line width')
-    _dispopt("'circleStyle'",'Line style for circles, e.g. "--" (Default: None)')
-    _dispopt("'normalized'","'on' / 'off' (default): normalized target diagram")
-    _dispopt("'obsUncertainty'",'Observational Uncertainty (default of 0)')
-     
-    _disp('Plotting Options from File:')
-    _dispopt("'target_options_file'","name of CSV file containing values for optional" +
-             " arguments" +
-             "\n\t\t" + "of the target_diagram function. If no file suffix is given," +
-             "\n\t\t" + "a '.csv' is assumed. (Default: empty string '')")
-
-def _disp(text):
-    print(text)
-
-def _dispopt(optname,optval):
-    '''
-    Displays option name and values
-
-    This is a support function for the DISPLAY_TARGET_DIAGRAM_OPTIONS function.
-    It displays the option name OPTNAME on a line by itself followed by its 
-    value OPTVAL on the following line.
-    '''
-
-    _disp('\t%s' % optname)
-    _disp('\t\t%s' % optval)
-
-def _ensure_np_array_or_die(v, label: str) -> np.ndarray:
-    '''
-    Check variable is correct data type.
-     
-    v: Value to be ensured
-    label: Python data type
-    '''
-
-    ret_v = v
-    if isinstance(ret_v, array):
-        ret_v = np.array(v)
-    if isinstance(ret_v, numbers.Number):
-        ret_v = np.array(v, ndmin=1)
-    if not isinstance(ret_v, np.ndarray):
-        raise ValueError('Argument {0} is not a numeric array: {1}'.format(label, v))
-    return ret_v
+from skill_metrics import rasterize_diagram
 
 def _get_target_diagram_arguments(*args):
     '''
@@ -157,10 +40,11 @@ def _get_target_diagram_arguments(*args):
     nargin = len(args)
     if nargin == 0:
         # Display options list
-        _display_target_diagram_options()
+        _display_options('target')
         return [], [], [], []
     elif nargin == 3:
         bs, rmsds, rmsdz = args
+        import matplotlib.pyplot as plt
         CAX = plt.gca()
     elif nargin == 4:
         CAX, bs, rmsds, rmsdz = args
@@ -177,7 +61,7 @@ def _get_target_diagram_arguments(*args):
 
     return CAX, Bs, RMSDs, RMSDz
 
-def target_diagram(*args, **kwargs):
+def target_diagram(*args, **kwargs) -> Optional[DiagramHandle]:
     '''
     Plot a target diagram from statistics of different series.
     
@@ -189,7 +73,19 @@ def target_diagram(*args, **kwargs):
     
     target_diagram(Bs,RMSDs,RMSDz,markerdisplayed='marker')
     
+    The diagram is drawn in the current pyplot axes unless a 
+    matplotlib.axes.Axes object is supplied as an additional first 
+    argument:
+    
+    target_diagram(ax,Bs,RMSDs,RMSDz,keyword=value)
+    
+    In the latter case only the supplied axes and its figure are used and
+    the pyplot state machine is never touched, so diagrams can be drawn 
+    into independent Figure objects, e.g. from a thread pool (see the 
+    RENDER_DIAGRAMS function).
+    
     INPUTS:
+    ax    : matplotlib.axes.Axes object in which to draw the diagram (optional)
     Bs    : Bias (B) or Normalized Bias (B*). Plotted along y-axis
             as "Bias".
     RMSDs : unbiased Root-Mean-Square Difference (RMSD') or normalized
@@ -198,7 +94,12 @@ def target_diagram(*args, **kwargs):
     RMSDz : total Root-Mean-Square Difference (RMSD). Labeled on plot as "RMSD".
     
     OUTPUTS:
-    None.
+    handle : DiagramHandle object holding the artists of the diagram, its
+             axes geometry and options. The markers can be moved to new
+             statistics without redrawing the diagram by calling
+             handle.update_points(Bs,RMSDs,RMSDz).
+             None when called without arguments to display the
+             list of options.
     
     LIST OF OPTIONS:
     For an exhaustive list of options to customize your diagram, call the 
@@ -207,6 +108,12 @@ def target_diagram(*args, **kwargs):
     >>> import skill_metrics as sm
     >>> sm.target_diagram()
     
+    Options validated once can be reused for many diagrams by supplying an
+    OptionProfile object with the keyword profile, e.g.
+    
+    profile = sm.OptionProfile('target', markerLabelColor = 'r')
+    sm.target_diagram(..., profile = profile, markerLabel = labels)
+    
     Reference:
  
     Jolliff, J. K., J. C. Kindle, I. Shulman, B. Penta, M. Friedrichs, 
@@ -233,27 +140,50 @@ def target_diagram(*args, **kwargs):
     # Get options
     options = get_target_diagram_options(**kwargs)
 
+    if options['preview'] == 'on':
+        # Draw simplified diagram for thumbnails
+        return plot_pattern_diagram_preview(ax, 'target', (Bs, RMSDs, RMSDz),
+                                            options)
+
     #  Get axis values for plot
     axes = get_target_diagram_axes(RMSDs,Bs,options)
 
+    # Record existing artists to identify those of the axes and circles
+    children = set(ax.get_children())
+
     # Overlay circles
     overlay_target_diagram_circles(ax, options)
 
     # Modify axes for target diagram (no overlay)
     if options['overlay'] == 'off': plot_target_axes(ax, axes)
 
+    grid = [artist for artist in ax.get_children() if artist not in children]
+    del children
+
     # Plot data points
+    markers, labels, scatter, mesh, colorbar = None, None, None, None, None
     lowcase = options['markerdisplayed'].lower()
     if lowcase == 'marker':
-        plot_pattern_diagram_markers(ax,RMSDs,Bs,options)
+        markers, labels = plot_pattern_diagram_markers(ax,RMSDs,Bs,options)
     elif lowcase == 'colorbar':
         nZdata = len(options['cmapzdata'])
         if nZdata == 0:
             # Use Centered Root Mean Square Difference for colors
-            plot_pattern_diagram_colorbar(ax, RMSDs, Bs, RMSDz, options)
+            scatter, colorbar = plot_pattern_diagram_colorbar(ax, RMSDs, Bs, RMSDz, options)
         else:
             # Use provided cmapzdata values for colors
-            plot_pattern_diagram_colorbar(ax, RMSDs, Bs, options['cmapzdata'], options)
+            scatter, colorbar = plot_pattern_diagram_colorbar(ax, RMSDs, Bs,
+                                                              options['cmapzdata'], options)
+    elif lowcase == 'density':
+        mesh, colorbar = plot_pattern_diagram_density(ax, 'target', RMSDs, Bs, options)
     else:
         raise ValueError('Unrecognized option: ' + 
                          options['markerdisplayed'])
+
+    handle = DiagramHandle(ax, 'target', axes, options, grid, markers, labels,
+                           scatter, colorbar, mesh)
+
+    # Rasterize grid and/or markers in vector output if requested
+    rasterize_diagram(handle)
+
+    return handle
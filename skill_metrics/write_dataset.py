@@ -0,0 +1,142 @@
+import datetime
+import json
+import numbers
+import os
+import re
+import shutil
+
+import numpy as np
+
+# Name of the manifest of a dataset directory, and the format and version
+# of datasets written
+_MANIFEST = 'manifest.json'
+_FORMAT = 'SkillMetrics dataset'
+_VERSION = 1
+
+def _is_dataset(dirname: str) -> bool:
+    '''
+    Return True if DIRNAME is a directory holding a dataset.
+    '''
+    filename = os.path.join(dirname, _MANIFEST)
+    if not os.path.isfile(filename): return False
+    try:
+        with open(filename) as file:
+            manifest = json.load(file)
+    except ValueError:
+        return False
+    return isinstance(manifest, dict) and manifest.get('format') == _FORMAT
+
+def _to_array(values, key: str) -> np.ndarray:
+    '''
+    Return the VALUES of the entry KEY as an array that can be stored without
+    pickling: dates and times as datetime64 arrays, times of day as strings.
+    '''
+    array = np.asarray(values)
+    if array.dtype != object: return array
+
+    items = array.ravel().tolist()
+    if all(isinstance(item, datetime.datetime) for item in items):
+        return array.astype('datetime64[us]')
+    if all(isinstance(item, datetime.date) for item in items):
+        return array.astype('datetime64[D]')
+    if all(isinstance(item, datetime.time) for item in items):
+        return np.array([item.isoformat() for item in items]).reshape(array.shape)
+    if all(isinstance(item, str) for item in items):
+        return array.astype(str)
+    raise ValueError('Cannot store values of mixed or unsupported types in ' +
+                     'entry: ' + key)
+
+def _get_file_name(index: int, key: str) -> str:
+    '''
+    Return the name of the file of the INDEX-th array, from its KEY.
+    '''
+    name = re.sub(r'[^A-Za-z0-9_.-]', '_', key.replace('/', '.'))
+    return '%05d_%s.npy' % (index, name)
+
+def _write_entry(dirname: str, value, key: str, files: list) -> dict:
+    '''
+    Write the VALUE of entry KEY of a dataset, returning its description in
+    the manifest. Dictionaries and objects are written as groups of entries,
+    arrays and lists as files in DIRNAME, and other values in the manifest.
+    '''
+    if not isinstance(value, (dict, list, tuple, np.ndarray, str, bytes)) and \
+       hasattr(value, '__dict__'):
+        # Object holding data as attributes, e.g. a container of dictionaries
+        value = vars(value)
+
+    if isinstance(value, dict):
+        items = {}
+        for name, item in value.items():
+            name = str(name)
+            path = name if key == '' else key + '/' + name
+            items[name] = _write_entry(dirname, item, path, files)
+        return {'type': 'group', 'items': items}
+
+    if isinstance(value, (list, tuple, np.ndarray)):
+        array = _to_array(value, key)
+        filename = _get_file_name(len(files), key)
+        np.save(os.path.join(dirname, filename), array, allow_pickle = False)
+        files.append(filename)
+        return {'type': 'array', 'file': filename, 'dtype': array.dtype.str,
+                'shape': list(array.shape)}
+
+    if isinstance(value, np.generic): value = value.item()
+    if value is None or isinstance(value, (str, bool, numbers.Integral)):
+        return {'type': 'value', 'value': value}
+    if isinstance(value, numbers.Real):
+        return {'type': 'value', 'value': float(value)}
+    raise ValueError('Cannot store value of type ' + type(value).__name__ +
+                     ' in entry: ' + key)
+
+def write_dataset(dirname, data, overwrite = False):
+    '''
+    Write a dataset to a directory in a portable binary format.
+
+    This function writes the contents of DATA, e.g. a dictionary of the
+    dictionaries of observations and predictions used in the examples,
+    to a directory DIRNAME, from which they are read back with the
+    READ_DATASET function. Unlike a pickle file, the dataset does not
+    depend on the version of Python or on the classes of the objects
+    written, and each series can be read on its own by memory mapping its
+    file, so that a station is read from a large archive without loading
+    the whole archive.
+
+    The directory holds a manifest.json file describing the structure of
+    the data and a NumPy .npy file for each array. DATA is written as
+    follows:
+
+    dictionaries : groups of entries, keeping their keys
+    objects      : groups of entries of their attributes, e.g. a Container
+    arrays       : .npy files, with lists converted to arrays and dates and
+                   times converted to datetime64 arrays, and times of day
+                   converted to strings, e.g. '06:08:00'
+    scalars      : strings, numbers, booleans and None in the manifest
+
+    The manifest records the version of the format so that later versions
+    of the package can read datasets written by earlier versions. It is
+    written last, so that an incomplete dataset cannot be read.
+
+    INPUTS:
+    dirname   : name of dataset directory
+    data      : dictionary or object of the data to write
+    overwrite : boolean flag to overwrite an existing dataset (Default: False)
+
+    OUTPUTS:
+    None.
+    '''
+
+    # Check for existence of directory
+    if os.path.exists(dirname):
+        if not overwrite:
+            raise ValueError('Dataset already exists: ' + dirname)
+        if not _is_dataset(dirname):
+            raise ValueError('Cannot overwrite directory that is not a dataset: ' +
+                             dirname)
+        shutil.rmtree(dirname)
+    os.makedirs(dirname)
+
+    files = []
+    tree = _write_entry(dirname, data, '', files)
+    manifest = {'format': _FORMAT, 'version': _VERSION, 'data': tree}
+    with open(os.path.join(dirname, _MANIFEST), 'w') as file:
+        json.dump(manifest, file, indent = 1)
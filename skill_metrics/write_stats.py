@@ -1,5 +1,7 @@
-import os
-import xlsxwriter
+import numpy as np
+
+from skill_metrics.excel_stats_writer import EXCEL_MAX_ROWS
+from skill_metrics.excel_stats_writer import ExcelStatsWriter
 
 def write_stats(filename,data,**kwargs):
     '''
@@ -27,7 +29,14 @@ def write_stats(filename,data,**kwargs):
    
     title = title : title descriptor data set, e.g. 'Expt. 01.0'
     overwrite = boolean : true/false flag to overwrite Excel file
+    maxrows = maxrows : maximum number of rows of each worksheet
+                        (Default: 1048576, the limit of Excel)
+    numberformat = format : Excel number format of the statistics, e.g.
+                            '0.000' (Default: None)
   
+    A statistic with several values, e.g. one for each of several cases,
+    is written in a row with a column for each case.
+
     Author: Peter A. Rochford
         Symplectic, LLC
         www.thesymplectic.com
@@ -37,41 +46,30 @@ def write_stats(filename,data,**kwargs):
     '''
 
     option = get_write_stats_options(**kwargs)
-    
-    # Check for existence of file
-    if os.path.isfile(filename):
-        if option['overwrite']:
-            os.remove(filename)
+
+    # Values of each statistic for each case
+    rows = [[key] + np.ravel(value).tolist() for key, value in data.items()]
+
+    # The overwrite option is True or False, or 'on' or 'off' when supplied
+    overwrite = option['overwrite'] in (True, 'on')
+    with ExcelStatsWriter(filename, overwrite, option['maxrows'],
+                          option['numberformat']) as writer:
+        # Write descriptive title
+        writer.skip_rows(1)
+        if len(option['title']) > 0:
+            writer.write_row([option['title']])
         else:
-            raise ValueError('File already exists: ' + filename)
-    
-    # Write title information to file
-    workbook = xlsxwriter.Workbook(filename)
-    worksheet = workbook.add_worksheet()
-     
-    # Write descriptive title
-    if len(option['title']) > 0:
-        worksheet.write(1, 0, option['title'])
-    else:
-        worksheet.write(1, 0, 'Skill Metrics')
-    
-    # Determine number of elements in the dictionary lists and write 
-    # appropriate header
-    worksheet.write(3, 0, 'Skill Metric')
-    ncell = len(list(data.items())[0]) - 1
-    for i in range(ncell):
-        worksheet.write(3, i+1, 'Case ' + str(i+1))
-
-    # Write data of all the fields
-    row = 4
-    col = 0
-    for key, value in data.items():
-        worksheet.write(row, col, key)
-        for i,v in enumerate([value]):
-            worksheet.write(row, col + 1 + i, v)
-        row += 1
-
-    workbook.close()
+            writer.write_row(['Skill Metrics'])
+        writer.skip_rows(1)
+
+        # Determine number of cases of the statistics and write
+        # appropriate header
+        ncell = max([len(row) for row in rows], default = 2) - 1
+        writer.write_row(['Skill Metric'] + ['Case ' + str(i+1) for i in range(ncell)])
+
+        # Write data of all the fields
+        for row in rows:
+            writer.write_row(row)
 
 def get_write_stats_options(**kwargs):
     '''
@@ -87,8 +85,10 @@ def get_write_stats_options(**kwargs):
  
     OUTPUTS:
     option : data structure containing option values.
-    option['title']     : title descriptor for data set.
-    option['overwrite'] : boolean to overwrite Excel file.
+    option['title']        : title descriptor for data set.
+    option['overwrite']    : boolean to overwrite Excel file.
+    option['maxrows']      : maximum number of rows of each worksheet.
+    option['numberformat'] : Excel number format of the statistics.
    
     LIST OF OPTIONS:
       A title description for each dataset TITLE can be optionally 
@@ -115,6 +115,8 @@ def get_write_stats_options(**kwargs):
     option = {}
     option['title'] = ''
     option['overwrite'] = False
+    option['maxrows'] = EXCEL_MAX_ROWS
+    option['numberformat'] = None
     if nargin == 0:
         # No options requested, so return with only defaults
         return option
@@ -1,5 +1,5 @@
-import os
-import xlsxwriter
+from skill_metrics.excel_stats_writer import EXCEL_MAX_ROWS
+from skill_metrics.excel_stats_writer import _write_stats_tables
 
 def write_target_stats(filename,data,**kwargs):
     '''
@@ -30,9 +30,18 @@ def write_target_stats(filename,data,**kwargs):
    
     label = label : label for each data point in target diagram, e.g. 
                     'OC445 (CB)'
+    maxrows = maxrows : maximum number of rows of each worksheet, after
+                        which writing continues on a new worksheet
+                        (Default: 1048576, the limit of Excel)
+    numberformat = format : Excel number format of the statistics, e.g.
+                            '0.000' (Default: None)
     overwrite = boolean : true/false flag to overwrite Excel file
     title = title : title descriptor data set, e.g. 'Expt. 01.0'
   
+    The statistics are written row after row in the constant memory mode
+    of the ExcelStatsWriter class, so that large data sets are written
+    quickly with bounded memory.
+  
     Author: Peter A. Rochford
         Symplectic, LLC
         www.thesymplectic.com
@@ -43,63 +52,10 @@ def write_target_stats(filename,data,**kwargs):
 
     option = get_write_target_stats_options(**kwargs)
     
-    # Check for existence of file
-    if os.path.isfile(filename):
-        if option['overwrite']:
-            os.remove(filename)
-        else:
-            raise ValueError('File already exists: ' + filename)
-    
-    # Covert data to list if necessary
-    if not type(data) is list: data = [data]
-
-    # Write title information to file
-    workbook = xlsxwriter.Workbook(filename)
-    worksheet = workbook.add_worksheet()
-     
-    # Write title information to file
-    worksheet.write(1, 0, 'Target Statistics')
-
-    # Determine number of dictionaries in data variable
-    ncell = len(data)
-    
-    # Write data for each dictionary
-    row = 2
+    # Write statistics from their columns with bounded memory
     headers = ['Description','Bias','uRMSD','RMSD']
-    for i in range(ncell):
-        row += 1
-        if len(option['title']) > 0:
-            worksheet.write(row, 0, option['title'][i])
-
-        # Write column headers
-        row += 1
-        for j,h in enumerate(headers):
-            worksheet.write(row, j, h)
-
-        # Retrieve input values as list
-        try: iter(data[i]['bias'])
-        except TypeError:
-            bias = [data[i]['bias']]
-            crmsd = [data[i]['crmsd']]
-            rmsd = [data[i]['rmsd']]
-        else:
-            bias = data[i]['bias']
-            crmsd = data[i]['crmsd']
-            rmsd = data[i]['rmsd']
-        ndata = len(bias)
-
-        # Write each row of data
-        row += 1
-        for j in range(ndata):
-            if len(option['label']) > 0:
-                worksheet.write(row, 0, option['label'][j])
-    
-            worksheet.write(row, 1, bias[j])
-            worksheet.write(row, 2, crmsd[j])
-            worksheet.write(row, 3, rmsd[j])
-            row += 1
-
-    workbook.close()
+    _write_stats_tables(filename, data, 'Target Statistics', ['bias', 'crmsd', 'rmsd'],
+                        headers, option)
 
 def get_write_target_stats_options(**kwargs):
     '''
@@ -116,8 +72,11 @@ def get_write_target_stats_options(**kwargs):
  
     OUTPUTS:
     option : data structure containing option values.
-    option['title']     : title descriptor for data set.
-    option['overwrite'] : boolean to overwrite Excel file.
+    option['label']        : label for each data point.
+    option['maxrows']      : maximum number of rows of each worksheet.
+    option['numberformat'] : Excel number format of the statistics.
+    option['title']        : title descriptor for data set.
+    option['overwrite']    : boolean to overwrite Excel file.
    
     LIST OF OPTIONS:
       A title description for each dataset TITLE can be optionally 
@@ -146,6 +105,8 @@ def get_write_target_stats_options(**kwargs):
     option = {}
     option['overwrite'] = False
     option['label'] = []
+    option['maxrows'] = EXCEL_MAX_ROWS
+    option['numberformat'] = None
     option['title'] = ''
     if nargin == 0:
         # No options requested, so return with only defaults